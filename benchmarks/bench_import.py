@@ -0,0 +1,147 @@
+"""
+Checks the import cost of flask_swadantic with `python -X importtime`.
+
+Run with `python -m benchmarks.bench_import`. The script fails if importing
+the decorators and schema declarations loads any of the lazily imported
+modules, or if the time spent in flask_swadantic's own modules exceeds the
+budget. Flask and pydantic are imported beforehand, as the applications
+declaring schemas import them anyway.
+
+Absolute import times vary widely between machines, so the budget is a ratio:
+the time spent in flask_swadantic's own modules, over the time spent in the
+modules of its dependencies in the same interpreter. The same check runs in
+the test suite, see tests/test_import.py.
+"""
+
+import statistics
+import subprocess
+import sys
+
+STATEMENT = (
+    "import flask, pydantic; "
+    "from flask_swadantic import InfoSchema, PathSchema, ResponseSchema, Schema"
+)
+
+# Self time budget for the flask_swadantic modules, relative to the self time
+# of the modules of its dependencies, which is about 0.1
+MAX_RATIO = 0.2
+
+# The top-level packages of the dependencies whose import times are the
+# reference of the budget
+REFERENCE_PACKAGES = frozenset(
+    (
+        "flask",
+        "werkzeug",
+        "jinja2",
+        "markupsafe",
+        "itsdangerous",
+        "click",
+        "blinker",
+        "pydantic",
+        "pydantic_core",
+        "annotated_types",
+        "typing_extensions",
+    )
+)
+
+LAZY_MODULES = (
+    "flask_swadantic.swadantic",
+    "flask_swadantic.schema.processor",
+    "flask_swadantic.openapi.generator",
+    "flask_swadantic.openapi.encoding",
+    "flask_swadantic.app.api_spec_view",
+    "flask_swadantic.swagger_bp",
+    "flask_swadantic.runtime",
+    "flask_swadantic.cli",
+    "concurrent.futures.process",
+)
+
+RUNS = 5
+
+
+def measure() -> dict[str, tuple[int, int]]:
+    """
+    Imports flask_swadantic in a fresh interpreter.
+
+    Returns:
+        dict[str, tuple[int, int]]: The self and cumulative import times of
+        every imported module, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STATEMENT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_time, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = (int(self_time), int(cumulative))
+
+    return times
+
+
+def self_times(times: dict[str, tuple[int, int]]) -> tuple[float, float]:
+    """
+    Sums the self import times of flask_swadantic and of its dependencies.
+
+    Args:
+        times (dict[str, tuple[int, int]]): The import times, from `measure`.
+
+    Returns:
+        tuple[float, float]: The self times of the flask_swadantic modules and
+        of the reference modules, in milliseconds.
+    """
+    own = reference = 0
+    for module, (self_time, _) in times.items():
+        package = module.split(".", 1)[0]
+        if package == "flask_swadantic":
+            own += self_time
+        elif package in REFERENCE_PACKAGES:
+            reference += self_time
+
+    return own / 1e3, reference / 1e3
+
+
+def measure_ratio(runs: int = RUNS) -> tuple[float, float, list[str]]:
+    """
+    Imports flask_swadantic in fresh interpreters, and compares its import time
+    with the import time of its dependencies.
+
+    Args:
+        runs (int): The number of interpreters.
+
+    Returns:
+        tuple[float, float, list[str]]: The median self time of flask_swadantic
+        in milliseconds, the median ratio to its dependencies, and the lazily
+        imported modules that were imported anyway.
+    """
+    measured = [measure() for _ in range(runs)]
+    own, ratios = [], []
+    for times in measured:
+        own_ms, reference_ms = self_times(times)
+        own.append(own_ms)
+        ratios.append(own_ms / reference_ms)
+
+    loaded = [module for module in LAZY_MODULES if module in measured[0]]
+
+    return statistics.median(own), statistics.median(ratios), loaded
+
+
+def main() -> int:
+    own, ratio, loaded = measure_ratio()
+
+    print(f"flask_swadantic self time (median of {RUNS}): {own:.2f} ms")
+    print(f"ratio to the dependencies: {ratio:.3f} (budget {MAX_RATIO:.3f})")
+    for module in loaded:
+        print(f"eagerly imported: {module}")
+
+    return 0 if ratio <= MAX_RATIO and not loaded else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
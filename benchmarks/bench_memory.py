@@ -0,0 +1,91 @@
+"""
+Measures the memory retained per endpoint by the endpoint metadata of a Schema.
+
+Run with `python -m benchmarks.bench_memory`. Only the allocations made by
+flask_swadantic's schema modules are counted, so the view functions and the
+blueprint's own bookkeeping are left out. The script fails if an endpoint
+retains more than the budget at the largest size.
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from flask import Blueprint
+
+from flask_swadantic import ResponseSchema, Schema
+
+SIZES = (10_000, 100_000)
+
+# Bytes of metadata retained per endpoint
+MAX_BYTES_PER_ENDPOINT = 320
+
+SCHEMA_MODULES = tracemalloc.Filter(True, "*/flask_swadantic/schema/*")
+
+
+def build_schema(endpoints: int) -> tuple[Blueprint, Schema]:
+    """
+    Builds a schema with one documented GET route per endpoint.
+
+    Args:
+        endpoints (int): The number of endpoints.
+
+    Returns:
+        tuple[Blueprint, Schema]: The generated blueprint and its schema.
+    """
+    blueprint = Blueprint(f"bench_{endpoints}", __name__, url_prefix="/bench")
+    schema = Schema(blueprint, tags=["Bench"])
+    responses = [ResponseSchema(200, None, description="Success")]
+
+    for index in range(endpoints):
+
+        def view(item_id: int):
+            return ""
+
+        view.__name__ = f"view_{index}"
+        blueprint.get(f"/items-{index}/<int:item_id>")(
+            schema.register_endpoint(
+                summary=f"View {index}", responses=responses, tags=["Items"]
+            )(view)
+        )
+
+    return blueprint, schema
+
+
+def measure(endpoints: int) -> float:
+    """
+    Measures the metadata retained once the endpoints of a schema are prepared.
+
+    Args:
+        endpoints (int): The number of endpoints.
+
+    Returns:
+        float: The retained bytes per endpoint.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    _, schema = build_schema(endpoints)
+    assert len(schema.endpoints) == endpoints
+
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces([SCHEMA_MODULES])
+    tracemalloc.stop()
+
+    retained = sum(stat.size for stat in snapshot.statistics("filename"))
+    return retained / endpoints
+
+
+def main() -> int:
+    per_endpoint = {}
+
+    print(f"{'endpoints':>10} {'bytes per endpoint':>20}")
+    for endpoints in SIZES:
+        per_endpoint[endpoints] = measure(endpoints)
+        print(f"{endpoints:>10} {per_endpoint[endpoints]:>20.1f}")
+
+    return 0 if per_endpoint[SIZES[-1]] <= MAX_BYTES_PER_ENDPOINT else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Measures how the endpoint introspection of a Schema scales with the number of
+routes of its blueprint.
+
+Run with `python -m benchmarks.bench_routes`. The script fails if the time per
+route at the largest size is more than twice the time per route at the
+smallest size, i.e. if introspection is not linear.
+"""
+
+import sys
+import time
+
+from flask import Blueprint
+
+from flask_swadantic import Schema
+
+SIZES = (1_000, 2_500, 5_000, 10_000)
+
+# Allowed growth of the time per route between the smallest and largest size
+MAX_PER_ROUTE_RATIO = 2.0
+
+
+def build_schema(routes: int) -> Schema:
+    """
+    Builds a schema with one documented GET route per endpoint.
+
+    Args:
+        routes (int): The number of routes.
+
+    Returns:
+        Schema: The schema of the generated blueprint.
+    """
+    blueprint = Blueprint(f"bench_{routes}", __name__, url_prefix="/bench")
+    schema = Schema(blueprint, tags=["Bench"])
+
+    for index in range(routes):
+
+        def view(item_id: int):
+            return ""
+
+        view.__name__ = f"view_{index}"
+        blueprint.get(f"/items-{index}/<int:item_id>")(
+            schema.register_endpoint(summary=f"View {index}")(view)
+        )
+
+    return schema
+
+
+def measure(routes: int) -> tuple[float, float]:
+    """
+    Measures the first and a repeated access to the endpoints of a schema.
+
+    Args:
+        routes (int): The number of routes.
+
+    Returns:
+        tuple[float, float]: The first and repeated access times, in seconds.
+    """
+    schema = build_schema(routes)
+
+    start = time.perf_counter()
+    assert len(schema.endpoints) == routes
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert len(schema.endpoints) == routes
+    repeated = time.perf_counter() - start
+
+    return first, repeated
+
+
+def main() -> int:
+    per_route = {}
+
+    print(
+        f"{'routes':>8} {'first (ms)':>12} {'per route (us)':>16} {'repeated (us)':>15}"
+    )
+    for routes in SIZES:
+        first, repeated = measure(routes)
+        per_route[routes] = first / routes
+        print(
+            f"{routes:>8} {first * 1e3:>12.2f} "
+            f"{per_route[routes] * 1e6:>16.2f} {repeated * 1e6:>15.2f}"
+        )
+
+    ratio = per_route[SIZES[-1]] / per_route[SIZES[0]]
+    print(f"per-route time ratio {SIZES[-1]}/{SIZES[0]}: {ratio:.2f}")
+
+    return 0 if ratio <= MAX_PER_ROUTE_RATIO else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
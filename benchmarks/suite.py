@@ -0,0 +1,266 @@
+"""
+Benchmarks spec generation and spec serving on synthetic APIs, and compares
+the results with stored baselines.
+
+Run with `python -m benchmarks.suite --profile large`. Use `--save` to store the
+results as the new baseline of the profile. The script fails if a metric is
+worse than its baseline by more than the tolerance.
+
+Absolute timings only hold on the machine they were measured on, so the
+timings are compared, and stored, relative to a reference workload measured
+in the same process (the `_x` metrics), and the import time relative to the
+import time of the dependencies (`import_ratio`).
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import replace
+
+from flask import Flask
+from pydantic import create_model
+
+from benchmarks import bench_import
+from benchmarks.synthetic import PROFILES, APIShape, build_api
+from flask_swadantic.openapi import OpenAPIGenerator
+from flask_swadantic.schema import clear_model_schema_cache
+
+BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+
+def _timed(func, repeat: int) -> float:
+    """
+    Returns the median wall time of a function, in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1e3)
+
+    return statistics.median(timings)
+
+
+def bench_generate(shape: APIShape, repeat: int) -> dict[str, float]:
+    """
+    Measures OpenAPIGenerator.generate, with and without the model schema cache,
+    and the peak memory of a cold generation.
+    """
+    api = build_api(shape)
+
+    def cold():
+        clear_model_schema_cache()
+        OpenAPIGenerator().generate(api.schemas)
+
+    def warm():
+        OpenAPIGenerator().generate(api.schemas)
+
+    results = {
+        "generate_cold_ms": _timed(cold, repeat),
+        "generate_warm_ms": _timed(warm, repeat),
+    }
+
+    clear_model_schema_cache()
+    gc.collect()
+    tracemalloc.start()
+    OpenAPIGenerator().generate(api.schemas)
+    results["generate_peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+
+    return results
+
+
+def bench_serve(shape: APIShape, requests: int) -> dict[str, float]:
+    """
+    Measures /apispec through the Flask test client: the first request, which
+    generates and encodes the spec, then warm requests.
+    """
+    clear_model_schema_cache()
+    api = build_api(shape)
+    client = api.app.test_client()
+
+    start = time.perf_counter()
+    response = client.get("/apispec")
+    first = (time.perf_counter() - start) * 1e3
+    assert response.status_code == 200
+
+    results = {"apispec_first_ms": first, "apispec_bytes": len(response.data)}
+
+    for name, headers in (("identity", {}), ("gzip", {"Accept-Encoding": "gzip"})):
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.get("/apispec", headers=headers)
+            timings.append((time.perf_counter() - start) * 1e3)
+
+        timings.sort()
+        results[f"apispec_{name}_p50_ms"] = timings[len(timings) // 2]
+        results[f"apispec_{name}_p95_ms"] = timings[int(len(timings) * 0.95)]
+
+    return results
+
+
+def bench_import_time() -> dict[str, float]:
+    """
+    Measures the self import time of flask_swadantic's modules, and its ratio
+    to the import time of the dependencies.
+    """
+    own, ratio, _ = bench_import.measure_ratio()
+
+    return {"import_ms": own, "import_ratio": ratio}
+
+
+def bench_reference(repeat: int) -> float:
+    """
+    Measures a fixed workload made of the same kind of work as the benchmarks:
+    generating the JSON schemas of fresh models, encoding JSON and sending
+    requests through the Flask test client.
+
+    Returns:
+        float: The median wall time of the workload, in milliseconds.
+    """
+    app = Flask(__name__)
+    app.add_url_rule("/", "index", lambda: "ok")
+    client = app.test_client()
+    document = {
+        f"key{index}": {"name": f"name{index}", "values": list(range(20))}
+        for index in range(500)
+    }
+
+    def workload():
+        for index in range(20):
+            fields = {f"field{field}": (int, 0) for field in range(10)}
+            create_model(f"Reference{index}", **fields).model_json_schema()
+        json.loads(json.dumps(document, sort_keys=True))
+        for _ in range(50):
+            client.get("/")
+
+    workload()
+    return _timed(workload, repeat)
+
+
+def normalize(results: dict[str, float], reference_ms: float) -> dict[str, float]:
+    """
+    Expresses the timings relative to the reference workload: `generate_cold_ms`
+    becomes `generate_cold_x`. The other metrics are kept as they are, except
+    the absolute import time, which `import_ratio` replaces.
+    """
+    normalized = {}
+    for metric, value in results.items():
+        if metric == "import_ms":
+            continue
+        if metric.endswith("_ms"):
+            normalized[f"{metric[: -len('_ms')]}_x"] = value / reference_ms
+        else:
+            normalized[metric] = value
+
+    return normalized
+
+
+def _is_timing(metric: str) -> bool:
+    return metric.endswith("_x") or metric == "import_ratio"
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    tolerance: float,
+    timing_tolerance: float,
+) -> list[str]:
+    """
+    Returns the metrics worse than their baseline by more than the tolerance.
+    Every metric is lower-is-better. The timings vary more from run to run than
+    the sizes, so they have their own, larger, tolerance.
+    """
+    regressions = []
+    for metric, value in results.items():
+        limit = timing_tolerance if _is_timing(metric) else tolerance
+        if metric in baseline and value > baseline[metric] * limit:
+            regressions.append(
+                f"{metric}: {value:.4g} > {baseline[metric]:.4g} x {limit:.2f}"
+            )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--profile", choices=PROFILES, default="medium")
+    parser.add_argument("--blueprints", type=int)
+    parser.add_argument("--depth", type=int)
+    parser.add_argument("--endpoints", type=int)
+    parser.add_argument("--models", type=int)
+    parser.add_argument("--union-responses", type=float)
+    parser.add_argument("--query-models", type=float)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--baselines", default=BASELINES)
+    parser.add_argument("--tolerance", type=float, default=1.25)
+    parser.add_argument("--timing-tolerance", type=float, default=2.0)
+    parser.add_argument("--save", action="store_true")
+    args = parser.parse_args(argv)
+
+    overrides = {
+        field: getattr(args, field)
+        for field in (
+            "blueprints",
+            "depth",
+            "endpoints",
+            "models",
+            "union_responses",
+            "query_models",
+        )
+        if getattr(args, field) is not None
+    }
+    shape = replace(PROFILES[args.profile], **overrides)
+    # Baselines only apply to the unmodified profiles
+    key = args.profile if not overrides else None
+
+    operations = build_api(shape).operations
+    print(f"profile {args.profile}: {shape} ({operations} operations)")
+
+    reference_ms = bench_reference(args.repeat)
+    results = {
+        **bench_generate(shape, args.repeat),
+        **bench_serve(shape, args.requests),
+        **bench_import_time(),
+    }
+    normalized = normalize(results, reference_ms)
+
+    baselines = {}
+    if os.path.exists(args.baselines):
+        with open(args.baselines, encoding="utf-8") as file:
+            baselines = json.load(file)
+    baseline = baselines.get(key, {}) if key else {}
+
+    print(f"{'reference_ms':>24}: {reference_ms:>12.2f}")
+    for metric, value in results.items():
+        print(f"{metric:>24}: {value:>12.2f}")
+    for metric, value in normalized.items():
+        reference = f" (baseline {baseline[metric]:.4g})" if metric in baseline else ""
+        print(f"{metric:>24}: {value:>12.4g}{reference}")
+
+    if args.save and key:
+        baselines[key] = {
+            metric: float(f"{value:.4g}") for metric, value in normalized.items()
+        }
+        with open(args.baselines, "w", encoding="utf-8") as file:
+            json.dump(baselines, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"saved baseline for {key} to {args.baselines}")
+        return 0
+
+    regressions = compare(normalized, baseline, args.tolerance, args.timing_tolerance)
+    for regression in regressions:
+        print(f"regression: {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
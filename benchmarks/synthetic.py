@@ -0,0 +1,182 @@
+"""
+Generates synthetic Flask APIs documented with flask_swadantic, to benchmark
+spec generation and serving on APIs of a realistic size.
+"""
+
+import enum
+from dataclasses import dataclass
+
+from flask import Blueprint, Flask
+from pydantic import BaseModel, create_model
+
+from flask_swadantic import InfoSchema, PathSchema, ResponseSchema, Schema, Swadantic
+
+
+@dataclass(frozen=True)
+class APIShape:
+    """
+    The size of a synthetic API.
+
+    Blueprints are nested `depth` levels deep, each level having `blueprints`
+    children, and every leaf blueprint gets `endpoints` endpoints.
+    """
+
+    blueprints: int = 4
+    depth: int = 2
+    endpoints: int = 25
+    models: int = 50
+    fields: int = 8
+    union_responses: float = 0.25
+    query_models: float = 0.25
+
+
+PROFILES = {
+    "small": APIShape(blueprints=2, depth=2, endpoints=10, models=20),
+    "medium": APIShape(),
+    # About 1,500 operations spread over 36 leaf blueprints
+    "large": APIShape(blueprints=6, depth=2, endpoints=42, models=300, fields=12),
+}
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    DISABLED = "disabled"
+
+
+@dataclass
+class SyntheticAPI:
+    app: Flask
+    swadantic: Swadantic
+    schemas: list[Schema]
+    operations: int
+
+
+def _build_models(shape: APIShape) -> list[type[BaseModel]]:
+    """
+    Builds models with scalar, enum, list and nested fields.
+
+    Args:
+        shape (APIShape): The size of the API.
+
+    Returns:
+        list[type[BaseModel]]: The generated models.
+    """
+    models = []
+
+    for index in range(shape.models):
+        fields = {"id": (int, ...), "status": (Status, Status.ACTIVE)}
+        for field in range(shape.fields):
+            fields[f"field_{field}"] = ((str, int, float, list[str])[field % 4], None)
+        if models:
+            fields["parent"] = (models[(index * 7) % len(models)] | None, None)
+
+        models.append(create_model(f"Model{index}", **fields))
+
+    return models
+
+
+def _build_query_models(shape: APIShape) -> list[type[BaseModel]]:
+    return [
+        create_model(
+            f"Query{index}",
+            page=(int, 1),
+            size=(int, 50),
+            search=(str | None, None),
+            tags=(list[str], []),
+        )
+        for index in range(max(1, shape.models // 10))
+    ]
+
+
+def _add_endpoints(
+    blueprint: Blueprint,
+    schema: Schema,
+    shape: APIShape,
+    models: list[type[BaseModel]],
+    query_models: list[type[BaseModel]],
+    offset: int,
+) -> int:
+    """
+    Adds CRUD-like endpoints to a leaf blueprint.
+
+    Returns:
+        int: The number of endpoints added.
+    """
+    for index in range(shape.endpoints):
+        number = offset + index
+        model = models[number % len(models)]
+        other = models[(number * 13) % len(models)]
+
+        body = model
+        if (number % 100) < shape.union_responses * 100:
+            body = model | other | list[model]
+
+        query = None
+        if (number % 100) < shape.query_models * 100:
+            query = query_models[number % len(query_models)]
+
+        method = ("get", "post", "put", "delete")[index % 4]
+
+        def view(item_id: int = PathSchema(description="Item ID")):
+            return ""
+
+        view.__name__ = f"view_{number}"
+        getattr(blueprint, method)(f"/items-{number}/<int:item_id>")(
+            schema.register_endpoint(
+                summary=f"Operation {number}",
+                description=f"Synthetic operation {number}",
+                query=query,
+                body=model if method in ("post", "put") else None,
+                responses=[
+                    ResponseSchema(200, body, description="Success"),
+                    ResponseSchema(404, None, description="Not found"),
+                ],
+            )(view)
+        )
+
+    return shape.endpoints
+
+
+def build_api(shape: APIShape) -> SyntheticAPI:
+    """
+    Builds a Flask application with a synthetic, documented API.
+
+    Args:
+        shape (APIShape): The size of the API.
+
+    Returns:
+        SyntheticAPI: The application, its extension and its top-level schemas.
+    """
+    models = _build_models(shape)
+    query_models = _build_query_models(shape)
+    app = Flask("synthetic")
+    swadantic = Swadantic(InfoSchema(title="Synthetic API"), app)
+    operations = 0
+
+    def build_level(name: str, level: int) -> tuple[Blueprint, Schema]:
+        nonlocal operations
+
+        blueprint = Blueprint(name, __name__, url_prefix=f"/{name}")
+        schema = Schema(blueprint, tags=[name])
+
+        if level == shape.depth:
+            operations += _add_endpoints(
+                blueprint, schema, shape, models, query_models, operations
+            )
+            return blueprint, schema
+
+        for index in range(shape.blueprints):
+            child, child_schema = build_level(f"{name}_{index}", level + 1)
+            blueprint.register_blueprint(child)
+            schema.register_schema(child_schema)
+
+        return blueprint, schema
+
+    schemas = []
+    for index in range(shape.blueprints):
+        blueprint, schema = build_level(f"v{index}", 1)
+        app.register_blueprint(blueprint)
+        swadantic.register_schema(schema)
+        schemas.append(schema)
+
+    return SyntheticAPI(app, swadantic, schemas, operations)
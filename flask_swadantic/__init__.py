@@ -1,5 +1,21 @@
+from typing import TYPE_CHECKING
+
+from flask_swadantic._lazy import lazy_getattr
+from flask_swadantic.schema import CachePolicy as CachePolicy
 from flask_swadantic.schema import InfoSchema as InfoSchema
-from flask_swadantic.swadantic import Swadantic as Swadantic
 from flask_swadantic.schema import PathSchema as PathSchema
 from flask_swadantic.schema import ResponseSchema as ResponseSchema
 from flask_swadantic.schema import Schema as Schema
+
+if TYPE_CHECKING:
+    from flask_swadantic.swadantic import Swadantic as Swadantic
+    from flask_swadantic.runtime import RequestValidationError as RequestValidationError
+
+# Imported on first use, so that declaring schemas stays cheap
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "Swadantic": ".swadantic",
+        "RequestValidationError": ".runtime",
+    },
+)
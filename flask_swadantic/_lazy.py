@@ -0,0 +1,29 @@
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_getattr(package: str, attributes: dict[str, str]) -> Callable[[str], Any]:
+    """
+    Builds a module `__getattr__` importing the given attributes on first access,
+    so that importing a package does not import its heavier modules.
+
+    Args:
+        package (str): The name of the package defining the attributes.
+        attributes (dict[str, str]): The module defining each attribute,
+            relative to the package.
+
+    Returns:
+        Callable[[str], Any]: The module `__getattr__`.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(attributes[name], package), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
@@ -1,15 +1,97 @@
-from flask import jsonify
+from mmap import mmap
+
+from flask import Response, abort, request
 from flask.views import MethodView
 
+from flask_swadantic.metrics import metrics
+from flask_swadantic.openapi.encoding import (
+    EncodedSpec,
+    StreamedSpec,
+    iter_chunks,
+    negotiate_format,
+)
+
 
 class APISpecsView(MethodView):
     """
     The /apispec.json and other specs
+
+    The loader returns the specification already encoded, or encoded while it
+    is streamed, so every request only picks the variant matching its
+    Accept-Encoding and answers 304 when the client already has the current
+    version.
+
+    With `negotiate_format`, the format of the specification is chosen with
+    `?format=` or the Accept header, and passed to the loader as `spec_format`.
     """
 
     def __init__(self, *args, **kwargs):
         self.loader = kwargs.pop("loader")
+        self.negotiate_format = kwargs.pop("negotiate_format", False)
         super(APISpecsView, self).__init__(*args, **kwargs)
 
-    def get(self):
-        return jsonify(self.loader())
\ No newline at end of file
+    def get(self, **kwargs):
+        if self.negotiate_format:
+            spec_format = negotiate_format(
+                request.args.get("format"), request.headers.get("Accept")
+            )
+            if spec_format is None:
+                abort(406)
+            kwargs["spec_format"] = spec_format
+
+        encoded = self.loader(**kwargs)
+        if encoded is None:
+            abort(404)
+
+        response = send_encoded(encoded)
+        if self.negotiate_format:
+            response.vary.add("Accept")
+
+        return response.make_conditional(request)
+
+
+def send_encoded(encoded: EncodedSpec | StreamedSpec) -> Response:
+    """
+    Builds the response of an encoded document, in the content encoding
+    matching the Accept-Encoding of the request, with its ETag.
+
+    Args:
+        encoded (EncodedSpec | StreamedSpec): The encoded document.
+
+    Returns:
+        Response: The response, not yet made conditional.
+    """
+    encoding = encoded.negotiate(request.accept_encodings)
+
+    content = encoded.get(encoding)
+
+    if isinstance(content, bytes):
+        response = Response(content, mimetype=encoded.mimetype)
+    elif isinstance(content, mmap):
+        # Memory-mapped artifacts are streamed instead of copied whole
+        response = Response(iter_chunks(content), mimetype=encoded.mimetype)
+        response.content_length = len(content)
+    else:
+        # Streamed specifications are encoded while they are sent, so the
+        # chunks must not be buffered to compute the Content-Length
+        response = Response(content, mimetype=encoded.mimetype)
+        response.implicit_sequence_conversion = False
+    if encoding:
+        response.content_encoding = encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.no_cache = True
+    response.set_etag(encoded.get_etag(encoding))
+
+    return response
+
+
+def metrics_view():
+    """
+    The /apispec/metrics timings, in the Prometheus text exposition format.
+    """
+    response = Response(
+        metrics.render_prometheus(), mimetype="text/plain; version=0.0.4"
+    )
+    response.cache_control.no_store = True
+
+    return response
@@ -16,7 +16,7 @@ class User(BaseModel):
     email: str
 
 
-@user_bp.get("/<uuid:id>")
+@user_bp.get("/<uuid:user_id>")
 @user_schema.register_endpoint(
     summary="Get User",
     description="Returns a user by ID",
@@ -29,7 +29,7 @@ def get_user(user_id: UUID = PathSchema(description="User ID")):
     return f"{user_id}", 200
 
 
-@user_bp.delete("/<uuid:id>")
+@user_bp.delete("/<uuid:user_id>")
 @user_schema.register_endpoint(
     summary="Delete User",
     description="Deletes a user by ID",
@@ -63,6 +63,8 @@ def list_users():
             description="Returns the created user",
         )
     ],
+    validate_body=True,
+    serialize_response=True,
 )
-def create_user():
-    return "", 200
+def create_user(body: User):
+    return body, 200
@@ -0,0 +1,249 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+from functools import cache
+
+from werkzeug.datastructures import Accept
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+STATIC_FOLDER = os.path.join(os.path.dirname(__file__), "static")
+
+# Precompressed siblings, by content encoding, in order of preference
+COMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Assets worth compressing
+COMPRESSIBLE_EXTENSIONS = (".js", ".css", ".html")
+
+# Builds of Swagger UI shipped in its dist folder that no page loads, served
+# on request under their own name, but neither hashed nor precompressed
+UNUSED_ASSETS = frozenset(
+    ("swagger-ui.js", "swagger-ui-es-bundle.js", "swagger-ui-es-bundle-core.js")
+)
+
+
+def _compress(content: bytes, encoding: str) -> bytes:
+    """
+    Compresses an asset at the highest level, as it is compressed only once.
+
+    Args:
+        content (bytes): The content of the asset.
+        encoding (str): "br" or "gzip".
+
+    Returns:
+        bytes: The compressed content.
+    """
+    if encoding == "br":
+        return brotli.compress(content, quality=11)
+
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+class AssetManifest:
+    """
+    Maps the Swagger UI assets to content-hashed file names, so they can be
+    served with a long-lived immutable cache, and finds their precompressed
+    siblings.
+
+    Packages built without running `make assets` ship no siblings, so the text
+    assets can also be compressed on their first request and kept in memory.
+    """
+
+    def __init__(self, folder: str):
+        """
+        Initializes an AssetManifest by hashing every asset of the folder.
+
+        Args:
+            folder (str): The folder containing the assets.
+        """
+        self._folder = folder
+        self._hashed: dict[str, str] = {}
+        self._originals: dict[str, str] = {}
+        self._unhashed: set[str] = set()
+        self._compressed: dict[str, dict[str, str]] = {}
+        # (asset, encoding) -> (content, ETag), compressed on first request
+        self._in_memory: dict[tuple[str, str], tuple[bytes, str]] = {}
+
+        for filename in sorted(os.listdir(folder)):
+            path = os.path.join(folder, filename)
+            if not os.path.isfile(path) or filename.endswith(
+                tuple(COMPRESSED_SUFFIXES.values())
+            ):
+                continue
+            if filename in UNUSED_ASSETS:
+                self._unhashed.add(filename)
+                continue
+
+            with open(path, "rb") as file:
+                digest = hashlib.sha256(file.read()).hexdigest()[:12]
+
+            stem, ext = os.path.splitext(filename)
+            hashed = f"{stem}.{digest}{ext}"
+            self._hashed[filename] = hashed
+            self._originals[hashed] = filename
+            self._compressed[filename] = {
+                encoding: f"{filename}{suffix}"
+                for encoding, suffix in COMPRESSED_SUFFIXES.items()
+                if os.path.isfile(os.path.join(folder, f"{filename}{suffix}"))
+            }
+
+    @property
+    def folder(self) -> str:
+        """
+        Returns the folder containing the assets.
+
+        Returns:
+            str: The path of the folder.
+        """
+        return self._folder
+
+    def hashed_name(self, filename: str) -> str:
+        """
+        Returns the content-hashed name of an asset.
+
+        Args:
+            filename (str): The name of the asset.
+
+        Returns:
+            str: The content-hashed name, or the name itself for unknown assets.
+        """
+        return self._hashed.get(filename, filename)
+
+    def resolve(self, name: str) -> tuple[str, bool] | None:
+        """
+        Resolves a requested name to an asset.
+
+        Args:
+            name (str): Either the name or the content-hashed name of an asset.
+
+        Returns:
+            tuple[str, bool] | None: The asset name and whether the name was
+            content-hashed (and is thus immutable), or None for unknown assets.
+        """
+        if name in self._originals:
+            return self._originals[name], True
+        if name in self._hashed or name in self._unhashed:
+            return name, False
+
+        return None
+
+    def negotiate(
+        self, filename: str, accept_encodings: Accept, in_memory: bool = False
+    ) -> tuple[str, str | None]:
+        """
+        Chooses the precompressed sibling of an asset to answer with.
+
+        Args:
+            filename (str): The name of the asset.
+            accept_encodings (Accept): The parsed Accept-Encoding header.
+            in_memory (bool): Also offers the text assets without siblings
+                compressed, see `compress`.
+
+        Returns:
+            tuple[str, str | None]: The file to send and its content encoding,
+            or None when the uncompressed asset is sent. The file is the asset
+            itself when it must be compressed in memory.
+        """
+        compressed = self._compressed.get(filename, {})
+        offers = list(compressed)
+        if not offers and in_memory and filename.endswith(COMPRESSIBLE_EXTENSIONS):
+            offers = [
+                encoding
+                for encoding in COMPRESSED_SUFFIXES
+                if encoding != "br" or brotli
+            ]
+        if not offers:
+            return filename, None
+
+        encoding = accept_encodings.best_match([*offers, "identity"])
+        if encoding in compressed:
+            return compressed[encoding], encoding
+        if encoding in offers:
+            return filename, encoding
+
+        return filename, None
+
+    def compress(self, filename: str, encoding: str) -> tuple[bytes, str]:
+        """
+        Returns an asset compressed in memory, compressed once per process.
+
+        Args:
+            filename (str): The name of the asset.
+            encoding (str): "br" or "gzip".
+
+        Returns:
+            tuple[bytes, str]: The compressed content and its ETag.
+        """
+        key = (filename, encoding)
+        if key not in self._in_memory:
+            with open(os.path.join(self._folder, filename), "rb") as file:
+                content = _compress(file.read(), encoding)
+
+            etag = hashlib.sha256(content).hexdigest()[:32]
+            self._in_memory[key] = (content, etag)
+
+        return self._in_memory[key]
+
+    def mimetype(self, filename: str) -> str:
+        """
+        Returns the mimetype of an asset.
+
+        Args:
+            filename (str): The name of the asset.
+
+        Returns:
+            str: The mimetype guessed from the asset name.
+        """
+        return mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+
+@cache
+def get_manifest() -> AssetManifest:
+    """
+    Returns the manifest of the bundled Swagger UI assets, hashed once per process.
+
+    Returns:
+        AssetManifest: The manifest of the bundled assets.
+    """
+    return AssetManifest(STATIC_FOLDER)
+
+
+def precompress_assets(folder: str = STATIC_FOLDER) -> list[str]:
+    """
+    Writes the `.gz` and, when brotli is installed, `.br` siblings of the
+    text assets of a folder.
+
+    Args:
+        folder (str): The folder containing the assets.
+
+    Returns:
+        list[str]: The paths of the written files.
+    """
+    written = []
+
+    for filename in sorted(os.listdir(folder)):
+        path = os.path.join(folder, filename)
+        if (
+            not os.path.isfile(path)
+            or filename in UNUSED_ASSETS
+            or not filename.endswith(COMPRESSIBLE_EXTENSIONS)
+        ):
+            continue
+
+        with open(path, "rb") as file:
+            content = file.read()
+
+        for encoding, suffix in COMPRESSED_SUFFIXES.items():
+            if encoding == "br" and not brotli:
+                continue
+
+            with open(f"{path}{suffix}", "wb") as file:
+                file.write(_compress(content, encoding))
+            written.append(f"{path}{suffix}")
+
+    get_manifest.cache_clear()
+    return written
@@ -0,0 +1,110 @@
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+swadantic_cli = AppGroup("swadantic", help="OpenAPI specification commands.")
+
+
+@swadantic_cli.command("build")
+@click.option(
+    "--output",
+    "-o",
+    default="openapi.json",
+    show_default=True,
+    type=click.Path(dir_okay=False, writable=True),
+    help="Path of the JSON file to write.",
+)
+def build_command(output: str):
+    """
+    Generates the specification and writes it as a prebuilt artifact.
+    """
+    from flask_swadantic.openapi.artifact import write_artifact
+
+    swadantic = current_app.extensions["swadantic"]
+
+    for path in write_artifact(swadantic.generate_spec(), output):
+        click.echo(f"Wrote {path}")
+
+
+@swadantic_cli.command("loadtest")
+@click.option(
+    "--processes",
+    "-p",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of processes sending requests.",
+)
+@click.option(
+    "--duration",
+    "-d",
+    default=10.0,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Duration of the test, in seconds.",
+)
+@click.option(
+    "--requests",
+    "-n",
+    "count",
+    type=click.IntRange(min=1),
+    help="Total number of requests to send, instead of a duration.",
+)
+@click.option(
+    "--url",
+    help="URL of a running server to test, instead of the test client.",
+)
+@click.option(
+    "--operation",
+    "-O",
+    "operations",
+    multiple=True,
+    help="operationId to test, all by default. Can be repeated.",
+)
+def loadtest_command(
+    processes: int,
+    duration: float,
+    count: int | None,
+    url: str | None,
+    operations: tuple[str, ...],
+):
+    """
+    Sends requests synthesized from the specification and reports the
+    throughput and latency percentiles of each operation.
+    """
+    from flask_swadantic.loadtest import plan_requests, run_loadtest
+
+    swadantic = current_app.extensions["swadantic"]
+
+    planned = plan_requests(swadantic.get_spec, operations)
+    if not planned:
+        raise click.UsageError("No operation to test.")
+
+    stats = run_loadtest(
+        current_app._get_current_object(),
+        planned,
+        processes=processes,
+        duration=duration,
+        count=count,
+        url=url,
+    )
+
+    width = max(len("operationId"), *(len(stat.operation_id) for stat in stats))
+    click.echo(
+        f"{'operationId':<{width}} {'requests':>9} {'errors':>7} {'4xx':>7}"
+        f" {'req/s':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for stat in stats:
+        click.echo(
+            f"{stat.operation_id:<{width}} {stat.requests:>9} {stat.errors:>7}"
+            f" {stat.client_errors:>7} {stat.throughput:>9.1f}"
+            f" {stat.p50 * 1000:>8.2f} {stat.p90 * 1000:>8.2f}"
+            f" {stat.p99 * 1000:>8.2f} {stat.max * 1000:>8.2f}"
+        )
+
+    # The synthesized requests are valid, so a 4xx points to a wrong schema
+    client_errors = sum(stat.client_errors for stat in stats)
+    if client_errors:
+        raise click.ClickException(
+            f"{client_errors} requests were answered with a 4xx status."
+        )
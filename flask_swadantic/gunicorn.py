@@ -0,0 +1,54 @@
+"""
+Gunicorn server hooks.
+
+Add them to the gunicorn configuration file to build the specification in the
+master process, before the workers are forked::
+
+    from flask_swadantic.gunicorn import on_starting
+"""
+
+from flask import Flask
+
+
+def _find_flask_app(wsgi) -> Flask | None:
+    """
+    Finds the Flask application behind WSGI middlewares such as ProxyFix.
+
+    Args:
+        wsgi: The WSGI application loaded by gunicorn.
+
+    Returns:
+        Flask | None: The Flask application, if any.
+    """
+    seen = set()
+
+    while wsgi is not None and id(wsgi) not in seen:
+        if isinstance(wsgi, Flask):
+            return wsgi
+
+        seen.add(id(wsgi))
+        wsgi = getattr(wsgi, "app", None) or getattr(wsgi, "wsgi_app", None)
+
+    return None
+
+
+def on_starting(server):
+    """
+    Loads the application in the master process and warms up its Swadantic
+    extension, so every worker shares one copy-on-write specification.
+
+    Loading the application here has the same effect as `preload_app = True`:
+    the workers reuse the application loaded by the master.
+
+    Args:
+        server: The gunicorn arbiter.
+    """
+    app = _find_flask_app(server.app.wsgi())
+    swadantic = app.extensions.get("swadantic") if app else None
+
+    if swadantic is None:
+        server.log.warning("flask-swadantic: no Swadantic extension found to warm up")
+        return
+
+    swadantic.warmup()
+    server.log.info("flask-swadantic: specification built before forking workers")
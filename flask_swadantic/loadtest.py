@@ -0,0 +1,460 @@
+"""
+Load tests driven by the generated specification.
+
+Every operation of the specification is turned into a request with valid
+path parameters, required query parameters and JSON body, synthesized from
+the schemas of the components. The requests are then sent in a loop, through
+the Werkzeug test client of the application or to a running server, from one
+or more processes, and the latencies are aggregated per operationId.
+"""
+
+import http.client
+import json
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import cycle
+from multiprocessing import get_all_start_methods, get_context
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from flask import Flask
+
+# Depth from which nested schemas are not synthesized, which also stops
+# self-referencing models
+MAX_DEPTH = 8
+
+STRING_FORMATS = {
+    "uuid": lambda: str(uuid.uuid4()),
+    "date": lambda: "2024-01-01",
+    "date-time": lambda: "2024-01-01T00:00:00Z",
+    "time": lambda: "00:00:00",
+    "email": lambda: "user@example.com",
+    "uri": lambda: "https://example.com",
+}
+
+# The application tested through the test client, inherited by forked workers
+_app: Flask | None = None
+
+# The latencies, the server errors and the client errors (4xx) of an operation
+_Results = dict[str, tuple[list[float], int, int]]
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedRequest:
+    operation_id: str
+    method: str
+    path: str
+    query: tuple[tuple[str, str], ...] = ()
+    body: bytes | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class OperationStats:
+    operation_id: str
+    requests: int
+    errors: int
+    client_errors: int
+    throughput: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+def example_value(schema: dict, components: dict[str, dict], depth: int = 0) -> Any:
+    """
+    Synthesizes a value valid against a JSON schema.
+
+    Args:
+        schema (dict): The JSON schema.
+        components (dict[str, dict]): The component schemas, by name.
+        depth (int): The nesting depth of the schema.
+
+    Returns:
+        Any: The value, None for the schemas nested too deep.
+    """
+    if depth > MAX_DEPTH:
+        return None
+
+    if "$ref" in schema:
+        name = schema["$ref"].rsplit("/", 1)[-1]
+        return example_value(components.get(name, {}), components, depth + 1)
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("examples"):
+        return schema["examples"][0]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    if schema.get("default") is not None:
+        return schema["default"]
+
+    for keyword in ("oneOf", "anyOf"):
+        options = [
+            option
+            for option in schema.get(keyword) or ()
+            if option.get("type") != "null"
+        ]
+        if options:
+            return example_value(options[0], components, depth + 1)
+
+    if "allOf" in schema:
+        value = {}
+        for part in schema["allOf"]:
+            part_value = example_value(part, components, depth + 1)
+            if isinstance(part_value, dict):
+                value.update(part_value)
+        return value
+
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), None)
+
+    if schema_type == "object" or "properties" in schema:
+        properties = schema.get("properties", {})
+        return {
+            name: example_value(properties[name], components, depth + 1)
+            for name in schema.get("required", ())
+            if name in properties
+        }
+    if schema_type == "array":
+        items = schema.get("items") or {}
+        return [
+            example_value(items, components, depth + 1)
+            for _ in range(max(schema.get("minItems", 1), 1))
+        ]
+    if schema_type in ("integer", "number"):
+        value = schema.get("minimum", schema.get("exclusiveMinimum", 0))
+        if "exclusiveMinimum" in schema and "minimum" not in schema:
+            value += 1
+        elif "minimum" not in schema:
+            value = max(value, 1)
+        if "maximum" in schema:
+            value = min(value, schema["maximum"])
+        return int(value) if schema_type == "integer" else float(value)
+    if schema_type == "boolean":
+        return True
+    if schema_type == "null":
+        return None
+
+    if schema.get("format") in STRING_FORMATS:
+        return STRING_FORMATS[schema["format"]]()
+
+    value = "string"[: schema.get("maxLength")]
+    return value.ljust(schema.get("minLength", 0), "x")
+
+
+def _format(value: Any) -> str:
+    """
+    Formats a scalar value for a URL.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: The value as written in paths and query strings.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    return "" if value is None else str(value)
+
+
+def _query_pairs(name: str, value: Any, deep_object: bool) -> list[tuple[str, str]]:
+    """
+    Serializes a query parameter the way it is documented: lists as repeated
+    keys, and objects in the deepObject style.
+
+    Args:
+        name (str): The name of the parameter.
+        value (Any): The value of the parameter.
+        deep_object (bool): Whether objects use the deepObject style.
+
+    Returns:
+        list[tuple[str, str]]: The keys and values of the query string.
+    """
+    if isinstance(value, list):
+        return [(name, _format(item)) for item in value]
+    if isinstance(value, dict) and deep_object:
+        return [
+            pair
+            for key, item in value.items()
+            for pair in _query_pairs(f"{name}[{key}]", item, deep_object)
+        ]
+    if isinstance(value, dict):
+        return [(name, json.dumps(value))]
+
+    return [(name, _format(value))]
+
+
+def plan_requests(spec: dict, operations: tuple[str, ...] = ()) -> list[PlannedRequest]:
+    """
+    Synthesizes one valid request per operation of a specification.
+
+    Args:
+        spec (dict): The OpenAPI specification.
+        operations (tuple[str, ...]): The operationIds to keep, all if empty.
+
+    Returns:
+        list[PlannedRequest]: The requests, in the order of the specification.
+    """
+    components = spec.get("components", {}).get("schemas", {})
+    planned = []
+
+    for path, methods in spec.get("paths", {}).items():
+        for method, operation in methods.items():
+            operation_id = operation.get("operationId") or f"{method}-{path}"
+            if operations and operation_id not in operations:
+                continue
+
+            url, query = path, []
+            for parameter in operation.get("parameters") or ():
+                value = example_value(parameter.get("schema") or {}, components)
+
+                if parameter.get("in") == "path":
+                    url = url.replace(f"{{{parameter['name']}}}", _format(value))
+                elif parameter.get("in") == "query" and parameter.get("required"):
+                    query.extend(
+                        _query_pairs(
+                            parameter["name"],
+                            value,
+                            parameter.get("style") == "deepObject",
+                        )
+                    )
+
+            body = None
+            content = (operation.get("requestBody") or {}).get("content") or {}
+            if "application/json" in content:
+                body = json.dumps(
+                    example_value(
+                        content["application/json"].get("schema") or {}, components
+                    )
+                ).encode()
+
+            planned.append(
+                PlannedRequest(operation_id, method.upper(), url, tuple(query), body)
+            )
+
+    return planned
+
+
+class _AppClient:
+    """
+    Sends the requests to the application through its Werkzeug test client.
+    """
+
+    def __init__(self, app: Flask):
+        self._client = app.test_client()
+
+    def send(self, request: PlannedRequest) -> int:
+        response = self._client.open(
+            request.path,
+            method=request.method,
+            query_string=list(request.query),
+            data=request.body,
+            content_type="application/json" if request.body is not None else None,
+        )
+        response.close()
+        return response.status_code
+
+
+class _HTTPClient:
+    """
+    Sends the requests to a running server, on a keep-alive connection.
+    """
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self._connection_class = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip("/")
+        self._connection: http.client.HTTPConnection | None = None
+
+    def send(self, request: PlannedRequest) -> int:
+        if self._connection is None:
+            self._connection = self._connection_class(self._netloc)
+
+        target = self._prefix + request.path
+        if request.query:
+            target = f"{target}?{urlencode(request.query)}"
+
+        headers = {}
+        if request.body is not None:
+            headers["Content-Type"] = "application/json"
+
+        try:
+            self._connection.request(
+                request.method, target, body=request.body, headers=headers
+            )
+            response = self._connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            self._connection.close()
+            self._connection = None
+            raise
+
+        return response.status
+
+
+def _run_worker(
+    planned: list[PlannedRequest],
+    url: str | None,
+    duration: float,
+    count: int | None,
+) -> tuple[_Results, float]:
+    """
+    Sends the planned requests in a loop, until the duration is over or the
+    number of requests is sent.
+
+    Args:
+        planned (list[PlannedRequest]): The requests.
+        url (str | None): The URL of a running server, or None to use the
+            test client of the application.
+        duration (float): The duration of the test, in seconds.
+        count (int | None): The number of requests to send, if limited.
+
+    Returns:
+        tuple[_Results, float]: The latencies, the number of errors and the
+        number of client errors by operationId, and the elapsed time. Errors
+        are 5xx responses and failed connections.
+    """
+    client = _HTTPClient(url) if url else _AppClient(_app)
+    results: _Results = {request.operation_id: ([], 0, 0) for request in planned}
+
+    start = time.perf_counter()
+    deadline = start + duration
+
+    for sent, request in enumerate(cycle(planned)):
+        if (count is not None and sent >= count) or (
+            count is None and time.perf_counter() >= deadline
+        ):
+            break
+
+        latencies, errors, client_errors = results[request.operation_id]
+        request_start = time.perf_counter()
+        try:
+            status = client.send(request)
+        except (OSError, http.client.HTTPException):
+            status = None
+        latencies.append(time.perf_counter() - request_start)
+
+        if status is None or status >= 500:
+            results[request.operation_id] = (latencies, errors + 1, client_errors)
+        elif status >= 400:
+            results[request.operation_id] = (latencies, errors, client_errors + 1)
+
+    return results, time.perf_counter() - start
+
+
+def _percentile(latencies: list[float], percent: float) -> float:
+    """
+    Returns a percentile of sorted latencies, by the nearest-rank method.
+
+    Args:
+        latencies (list[float]): The sorted latencies.
+        percent (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The latency, 0 if there are none.
+    """
+    if not latencies:
+        return 0.0
+
+    rank = max(int(len(latencies) * percent / 100 + 0.5), 1)
+    return latencies[min(rank, len(latencies)) - 1]
+
+
+def _worker_pool(workers: int) -> Executor:
+    """
+    Returns the pool running the workers: forked processes, which inherit the
+    application, or threads where fork is not available.
+
+    Args:
+        workers (int): The number of workers.
+
+    Returns:
+        Executor: The pool.
+    """
+    if "fork" in get_all_start_methods():
+        return ProcessPoolExecutor(workers, mp_context=get_context("fork"))
+
+    return ThreadPoolExecutor(workers)
+
+
+def run_loadtest(
+    app: Flask,
+    planned: list[PlannedRequest],
+    processes: int = 1,
+    duration: float = 10.0,
+    count: int | None = None,
+    url: str | None = None,
+) -> list[OperationStats]:
+    """
+    Runs a load test and aggregates the latencies per operationId.
+
+    Args:
+        app (Flask): The application, tested through its test client when no
+            URL is given.
+        planned (list[PlannedRequest]): The requests, sent in a loop.
+        processes (int): The number of processes sending requests. The
+            processes are forked, so they share the loaded application, or
+            are threads where fork is not available, e.g. on Windows.
+        duration (float): The duration of the test, in seconds.
+        count (int | None): The total number of requests to send instead.
+        url (str | None): The URL of a running server to test instead of the
+            application.
+
+    Returns:
+        list[OperationStats]: The statistics of each operation, in seconds.
+    """
+    global _app
+    _app = app
+
+    counts = [None] * processes
+    if count is not None:
+        counts = [
+            count // processes + (index < count % processes)
+            for index in range(processes)
+        ]
+
+    if processes == 1:
+        outcomes = [_run_worker(planned, url, duration, counts[0])]
+    else:
+        with _worker_pool(processes) as pool:
+            outcomes = list(
+                pool.map(
+                    _run_worker,
+                    [planned] * processes,
+                    [url] * processes,
+                    [duration] * processes,
+                    counts,
+                )
+            )
+
+    elapsed = max(outcome_elapsed for _, outcome_elapsed in outcomes) or 1.0
+    stats = []
+
+    for operation_id in dict.fromkeys(request.operation_id for request in planned):
+        latencies = sorted(
+            latency for results, _ in outcomes for latency in results[operation_id][0]
+        )
+        stats.append(
+            OperationStats(
+                operation_id=operation_id,
+                requests=len(latencies),
+                errors=sum(results[operation_id][1] for results, _ in outcomes),
+                client_errors=sum(results[operation_id][2] for results, _ in outcomes),
+                throughput=len(latencies) / elapsed,
+                p50=_percentile(latencies, 50),
+                p90=_percentile(latencies, 90),
+                p99=_percentile(latencies, 99),
+                max=latencies[-1] if latencies else 0.0,
+            )
+        )
+
+    return stats
@@ -0,0 +1,202 @@
+"""
+Timings of the work flask_swadantic does on the hot path and while generating
+the specification.
+
+The registry is disabled by default, and then only costs an attribute lookup
+per timed call. Once enabled (see `Swadantic(collect_metrics=True)`), every timing is
+aggregated into a histogram, exposed in the Prometheus text format, and sent
+through the blinker signals below, with the duration in seconds:
+
+- `request_validated`: `operation_id`, `duration`
+- `response_serialized`: `operation_id`, `duration`
+- `spec_phase_timed`: `phase`, `duration`
+- `model_schema_generated`: `model`, `duration`
+
+Request signals are sent by the current application, the others by the
+application when there is an application context and by None otherwise.
+Timings taken in the workers of a process pool are not collected.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+
+from blinker import Namespace
+from flask import current_app, has_app_context
+
+_signals = Namespace()
+
+request_validated = _signals.signal("swadantic-request-validated")
+response_serialized = _signals.signal("swadantic-response-serialized")
+spec_phase_timed = _signals.signal("swadantic-spec-phase-timed")
+model_schema_generated = _signals.signal("swadantic-model-schema-generated")
+
+# Upper bounds of the histogram buckets, in seconds
+BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+# Name, label, help text and signal of each family of timings
+FAMILIES = {
+    "request_validation": (
+        "swadantic_request_validation_seconds",
+        "operation_id",
+        "Time spent validating request queries and bodies.",
+        request_validated,
+    ),
+    "response_serialization": (
+        "swadantic_response_serialization_seconds",
+        "operation_id",
+        "Time spent serializing responses.",
+        response_serialized,
+    ),
+    "spec_phase": (
+        "swadantic_spec_phase_seconds",
+        "phase",
+        "Time spent in each phase of the specification generation.",
+        spec_phase_timed,
+    ),
+    "model_schema": (
+        "swadantic_model_schema_seconds",
+        "model",
+        "Time spent generating the JSON schema of each model.",
+        model_schema_generated,
+    ),
+}
+
+
+@dataclass(slots=True)
+class Histogram:
+    count: int = 0
+    total: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(BUCKETS))
+
+
+class Metrics:
+    """
+    Metrics aggregates the timings of flask_swadantic by family and label.
+    """
+
+    def __init__(self):
+        """
+        Initializes a disabled Metrics registry.
+        """
+        self.enabled = False
+        self._lock = Lock()
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+
+    def observe(self, family: str, label: str, duration: float):
+        """
+        Records a timing and sends it through the signal of its family.
+
+        Args:
+            family (str): The family of the timing, a key of FAMILIES.
+            label (str): The operation, phase or model timed.
+            duration (float): The duration, in seconds.
+        """
+        with self._lock:
+            histogram = self._histograms.get((family, label))
+            if histogram is None:
+                histogram = self._histograms[(family, label)] = Histogram()
+
+            histogram.count += 1
+            histogram.total += duration
+            for index, bound in enumerate(BUCKETS):
+                if duration <= bound:
+                    histogram.buckets[index] += 1
+
+        _, label_name, _, signal = FAMILIES[family]
+        if signal.receivers:
+            sender = current_app._get_current_object() if has_app_context() else None
+            signal.send(sender, **{label_name: label, "duration": duration})
+
+    @contextmanager
+    def timed(self, family: str, label: str) -> Iterator[None]:
+        """
+        Times a block, when the registry is enabled.
+
+        Args:
+            family (str): The family of the timing, a key of FAMILIES.
+            label (str): The operation, phase or model timed.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(family, label, time.perf_counter() - start)
+
+    def snapshot(self) -> dict[tuple[str, str], Histogram]:
+        """
+        Returns a copy of the recorded histograms.
+
+        Returns:
+            dict[tuple[str, str], Histogram]: The histograms by family and label.
+        """
+        with self._lock:
+            return {
+                key: Histogram(
+                    histogram.count, histogram.total, list(histogram.buckets)
+                )
+                for key, histogram in self._histograms.items()
+            }
+
+    def reset(self):
+        """
+        Discards the recorded timings.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        """
+        Renders the recorded timings in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one histogram per family and label.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        for family, (name, label_name, help_text, _) in FAMILIES.items():
+            series = sorted(
+                (label, histogram)
+                for (key, label), histogram in snapshot.items()
+                if key == family
+            )
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+
+            for label, histogram in series:
+                label_value = _escape(label)
+                for bound, count in zip(BUCKETS, histogram.buckets):
+                    lines.append(
+                        f'{name}_bucket{{{label_name}="{label_value}",le="{bound}"}}'
+                        f" {count}"
+                    )
+                lines.append(
+                    f'{name}_bucket{{{label_name}="{label_value}",le="+Inf"}}'
+                    f" {histogram.count}"
+                )
+                lines.append(
+                    f'{name}_sum{{{label_name}="{label_value}"}} {histogram.total}'
+                )
+                lines.append(
+                    f'{name}_count{{{label_name}="{label_value}"}} {histogram.count}'
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """
+    Escapes a label value for the Prometheus text format.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# The process-wide registry
+metrics = Metrics()
@@ -1 +1,21 @@
-from .generator import OpenAPIGenerator as OpenAPIGenerator
+from typing import TYPE_CHECKING
+
+from flask_swadantic._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .cache import SpecCache as SpecCache
+    from .dedup import deduplicate_schemas as deduplicate_schemas
+    from .generator import ComponentConflictError as ComponentConflictError
+    from .generator import OpenAPIGenerator as OpenAPIGenerator
+
+# Imported on first use, so that the generator is only loaded when a
+# specification is generated
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "OpenAPIGenerator": ".generator",
+        "ComponentConflictError": ".generator",
+        "SpecCache": ".cache",
+        "deduplicate_schemas": ".dedup",
+    },
+)
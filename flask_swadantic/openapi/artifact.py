@@ -0,0 +1,150 @@
+import json
+import mmap
+import os
+import tempfile
+from functools import cached_property
+
+from flask_swadantic.openapi.encoding import EncodedSpec, encode_spec
+
+# Version of the artifact layout, bumped whenever it changes incompatibly
+ARTIFACT_FORMAT = 1
+
+COMPRESSED_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+def _manifest_path(path: str) -> str:
+    return f"{path}.meta.json"
+
+
+def write_artifact(spec: dict, path: str) -> list[str]:
+    """
+    Writes a prebuilt specification: the compact JSON, its precompressed copies
+    and a manifest describing them.
+
+    Every file is written to a temporary file first, and only moved into place
+    once all of them are written, the manifest last. A failed build leaves the
+    previous artifact untouched, and the processes that memory-mapped it keep
+    reading the previous files.
+
+    Args:
+        spec (dict): The OpenAPI specification.
+        path (str): The path of the JSON file. The compressed copies and the
+            manifest are written next to it.
+
+    Returns:
+        list[str]: The paths of the written files.
+    """
+    encoded = encode_spec(spec)
+    files = {path: encoded.identity}
+
+    for encoding, suffix in COMPRESSED_SUFFIXES.items():
+        content = encoded.get(encoding)
+        if content is not None:
+            files[f"{path}{suffix}"] = content
+
+    info = spec["info"]
+    manifest = {
+        "format": ARTIFACT_FORMAT,
+        "openapi": spec["openapi"],
+        "version": info["version"] if isinstance(info, dict) else info.version,
+        "etag": encoded.etag,
+        "encodings": [
+            encoding
+            for encoding, suffix in COMPRESSED_SUFFIXES.items()
+            if f"{path}{suffix}" in files
+        ],
+    }
+    files[_manifest_path(path)] = json.dumps(manifest, indent=2).encode()
+
+    temporary = {}
+    try:
+        for file_path, content in files.items():
+            directory, name = os.path.split(os.path.abspath(file_path))
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=directory, prefix=f".{name}.", delete=False
+            ) as file:
+                temporary[file_path] = file.name
+                file.write(content)
+
+        # The manifest was added last, so it is moved into place last
+        for file_path, temporary_path in temporary.items():
+            os.replace(temporary_path, file_path)
+    finally:
+        for temporary_path in temporary.values():
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    return list(files)
+
+
+def _map(path: str) -> mmap.mmap:
+    with open(path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class SpecArtifact:
+    """
+    A prebuilt specification, memory-mapped so that forked workers share the
+    pages of the files and serve them without generating the specification.
+    """
+
+    def __init__(self, path: str):
+        """
+        Loads a prebuilt specification written by `write_artifact`.
+
+        Args:
+            path (str): The path of the JSON file.
+
+        Raises:
+            FileNotFoundError: If the artifact or its manifest does not exist.
+            ValueError: If the artifact was written in an unsupported format.
+        """
+        with open(_manifest_path(path), encoding="utf-8") as file:
+            self.manifest = json.load(file)
+
+        if self.manifest.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(
+                f"Unsupported artifact format {self.manifest.get('format')!r} in "
+                f"{path}. Expected {ARTIFACT_FORMAT}; rebuild it with "
+                "'flask swadantic build'."
+            )
+
+        self._path = os.fspath(path)
+        self._maps = {None: _map(path)}
+        for encoding in self.manifest["encodings"]:
+            self._maps[encoding] = _map(f"{path}{COMPRESSED_SUFFIXES[encoding]}")
+
+    @property
+    def path(self) -> str:
+        """
+        Returns the path of the JSON file.
+
+        Returns:
+            str: The path of the artifact.
+        """
+        return self._path
+
+    @cached_property
+    def spec(self) -> dict:
+        """
+        Returns the decoded specification, decoded on first access only.
+
+        Returns:
+            dict: OpenAPI Specification in JSON format.
+        """
+        return json.loads(self._maps[None][:])
+
+    @cached_property
+    def encoded(self) -> EncodedSpec:
+        """
+        Returns the memory-mapped specification and its compressed copies.
+
+        Returns:
+            EncodedSpec: The encoded OpenAPI Specification.
+        """
+        return EncodedSpec(
+            identity=self._maps[None],
+            gzip=self._maps.get("gzip"),
+            br=self._maps.get("br"),
+            etag=self.manifest["etag"],
+        )
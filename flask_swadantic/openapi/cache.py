@@ -0,0 +1,303 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from flask_swadantic.metrics import metrics
+from flask_swadantic.schema import Schema
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+    from flask_swadantic.openapi.discovery import RouteDiscovery
+
+
+class SpecCache:
+    """
+    SpecCache keeps the generated OpenAPI paths and components of every schema,
+    so that only the schemas that changed since the last build are generated again.
+
+    Each schema is cached once per position in the schema tree (the chain of
+    schemas from a top-level schema down to it), because the URL prefixes of
+    its endpoints depend on its parents.
+
+    Once an application is attached with `discover_routes`, the routes of the
+    endpoints are read from its url_map, and the blueprints are only replayed
+    for the schemas whose blueprint is not registered in the application.
+    Routes added to the application later only invalidate the schemas of the
+    blueprints they were added to.
+    """
+
+    def __init__(self, workers: int | None = None, executor: str = "thread"):
+        """
+        Initializes a SpecCache.
+
+        Args:
+            workers (int | None): The number of workers used to generate the
+                changed schemas in parallel.
+            executor (str): "thread" or "process".
+        """
+        self._workers = workers
+        self._executor = executor
+        self._fragments: dict[tuple[Schema, ...], dict[str, dict]] = {}
+        self._dirty: set[Schema] = set()
+        # Chains of dirty schemas already generated again for a slice
+        self._fresh: set[tuple[Schema, ...]] = set()
+        self._result: dict[str, dict] | None = None
+        self._slices: dict[tuple[str, str], dict[str, dict] | None] = {}
+        self._revision = 0
+        self._version = 0
+        self._discovery: RouteDiscovery | None = None
+
+    @property
+    def revision(self) -> int:
+        """
+        Returns the number of times the paths and components were merged.
+
+        Returns:
+            int: The revision of the last build.
+        """
+        return self._revision
+
+    @property
+    def version(self) -> int:
+        """
+        Returns a number that changes every time a schema changes, before
+        anything is generated again.
+
+        Returns:
+            int: The version of the schemas.
+        """
+        return self._version
+
+    def discover_routes(self, app: "Flask"):
+        """
+        Reads the routes of the endpoints from the url_map of an application.
+
+        Args:
+            app (Flask): The application.
+        """
+        from flask_swadantic.openapi.discovery import RouteDiscovery
+
+        self._discovery = RouteDiscovery(app)
+        self.invalidate()
+
+    @property
+    def routes_changed(self) -> bool:
+        """
+        Tells whether routes were added to the application since the last
+        build, which then generates their schemas again.
+
+        Returns:
+            bool: True if the routes changed.
+        """
+        return self._discovery is not None and self._discovery.changed
+
+    def _refresh_routes(self):
+        """
+        Reads the routes added to the application, and discards the cached
+        schemas of the blueprints they were added to.
+        """
+        if not self.routes_changed:
+            return
+
+        # Bumped before the flag is reset, so a reader without the build lock
+        # never sees the routes unchanged with the previous version
+        self._version += 1
+        self._result = None
+        self._slices.clear()
+
+        blueprints = self._discovery.refresh()
+        stale = [
+            chain
+            for chain in self._fragments
+            if ".".join(schema.name for schema in chain) in blueprints
+        ]
+        for chain in stale:
+            del self._fragments[chain]
+            self._fresh.discard(chain)
+
+    def invalidate(self, schema: Schema | None = None):
+        """
+        Marks a schema as changed, or discards every cached schema.
+
+        Args:
+            schema (Schema | None): The schema that changed. When omitted, the
+                whole cache is discarded and rebuilt on the next build.
+        """
+        if schema is None:
+            self._fragments.clear()
+            self._fresh.clear()
+        else:
+            self._dirty.add(schema)
+            if self._fresh:
+                self._fresh = {
+                    chain for chain in self._fresh if chain[-1] is not schema
+                }
+
+        self._result = None
+        self._slices.clear()
+        self._version += 1
+
+    def _walk(
+        self, schema: Schema, chain: tuple[Schema, ...]
+    ) -> Iterator[tuple[Schema, ...]]:
+        """
+        Yields the chain of every schema of a subtree, parents first.
+
+        Args:
+            schema (Schema): The root of the subtree.
+            chain (tuple[Schema, ...]): The chain of parents of the schema.
+
+        Returns:
+            Iterator[tuple[Schema, ...]]: Chains from the top-level schema.
+        """
+        chain = (*chain, schema)
+        yield chain
+
+        for sub_schema in schema.schemas:
+            yield from self._walk(sub_schema, chain)
+
+    def _generate_fragments(
+        self, chains: list[tuple[Schema, ...]]
+    ) -> list[dict[str, dict]]:
+        """
+        Generates the paths and components of the last schema of each chain.
+
+        Args:
+            chains (list[tuple[Schema, ...]]): The chains from the top-level schemas.
+
+        Returns:
+            list[dict[str, dict]]: The OpenAPI paths and components of each schema.
+        """
+        from flask_swadantic.openapi.generator import OpenAPIGenerator, map_shards
+
+        generator = OpenAPIGenerator()
+        shards = []
+
+        with metrics.timed("spec_phase", "process_schemas"):
+            for chain in chains:
+                endpoints = None
+                if self._discovery is not None:
+                    endpoints = self._discovery.endpoints(chain)
+
+                if endpoints is None:
+                    # Replays the blueprint and applies the prefixes of the chain
+                    endpoints = generator.prefixed_endpoints(
+                        chain[-1], [schema.url_prefix for schema in reversed(chain)]
+                    )
+
+                shards.append(endpoints)
+
+        return map_shards(shards, self._workers, self._executor)
+
+    def _chain_fragments(
+        self, chains: list[tuple[Schema, ...]]
+    ) -> list[dict[str, dict]]:
+        """
+        Returns the paths and components of each chain, generating the chains
+        that are new or changed.
+
+        Args:
+            chains (list[tuple[Schema, ...]]): The chains from the top-level schemas.
+
+        Returns:
+            list[dict[str, dict]]: The OpenAPI paths and components of each schema.
+        """
+        changed = [
+            chain
+            for chain in chains
+            if chain not in self._fragments
+            or (chain[-1] in self._dirty and chain not in self._fresh)
+        ]
+
+        for chain, fragment in zip(changed, self._generate_fragments(changed)):
+            self._fragments[chain] = fragment
+            self._fresh.add(chain)
+
+        return [self._fragments[chain] for chain in chains]
+
+    def build(self, schemas: list[Schema]) -> dict[str, dict]:
+        """
+        Returns the OpenAPI paths and components for the given schemas,
+        generating only the schemas that are new or changed.
+
+        Args:
+            schemas (list[Schema]): The top-level schemas of the application.
+
+        Returns:
+            dict[str, dict]: A dictionary containing the OpenAPI paths and components.
+        """
+        if self._result is not None and not self.routes_changed:
+            return self._result
+
+        from flask_swadantic.openapi.generator import merge_fragments
+
+        self._refresh_routes()
+        chains = [chain for schema in schemas for chain in self._walk(schema, ())]
+        fragments = self._chain_fragments(chains)
+
+        # Drops the chains that are no longer part of the schema tree
+        self._fragments = dict(zip(chains, fragments))
+        self._dirty.clear()
+        self._fresh.clear()
+        with metrics.timed("spec_phase", "merge"):
+            self._result = merge_fragments(fragments)
+        self._revision += 1
+
+        return self._result
+
+    def build_slice(
+        self,
+        schemas: list[Schema],
+        blueprint: str | None = None,
+        tag: str | None = None,
+    ) -> dict[str, dict] | None:
+        """
+        Returns the OpenAPI paths of the schemas of a blueprint, or of the
+        operations with a tag, and the components they reference.
+
+        Only the schemas of the slice are generated, if they are new or changed.
+
+        Args:
+            schemas (list[Schema]): The top-level schemas of the application.
+            blueprint (str | None): Selects the schemas of the blueprint with
+                this name and their child schemas.
+            tag (str | None): Selects the operations with this tag.
+
+        Returns:
+            dict[str, dict] | None: A dictionary containing the OpenAPI paths and
+            components, or None if nothing matches.
+        """
+        key = ("blueprint", blueprint) if blueprint is not None else ("tag", tag)
+        if key in self._slices and not self.routes_changed:
+            return self._slices[key]
+
+        from flask_swadantic.openapi.generator import merge_fragments
+        from flask_swadantic.openapi.slicing import filter_tag, select_components
+
+        self._refresh_routes()
+        chains = [chain for schema in schemas for chain in self._walk(schema, ())]
+        if blueprint is not None:
+            chains = [
+                chain
+                for chain in chains
+                if any(schema.name == blueprint for schema in chain)
+            ]
+        else:
+            chains = [
+                chain
+                for chain in chains
+                if any(
+                    tag in (endpoint.tags or ())
+                    for endpoint in chain[-1].registered_endpoints
+                )
+            ]
+
+        result = None
+        if chains:
+            merged = merge_fragments(self._chain_fragments(chains))
+            paths = merged["paths"] if tag is None else filter_tag(merged["paths"], tag)
+            models = select_components(paths, merged["components"]["schemas"])
+            result = {"paths": paths, "components": {"schemas": models}}
+
+        self._slices[key] = result
+        return result
@@ -0,0 +1,304 @@
+import hashlib
+import json
+import re
+from collections import Counter
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from flask_swadantic.openapi.slicing import REF_PREFIX
+
+# Keywords whose value is a single sub-schema, or a list of sub-schemas
+SUBSCHEMA_KEYWORDS = ("items", "additionalProperties", "not")
+SUBSCHEMA_LIST_KEYWORDS = ("oneOf", "anyOf", "allOf", "prefixItems")
+
+MAX_NAME_LENGTH = 64
+
+
+def _is_composite(node: dict) -> bool:
+    """
+    Tells whether an inline schema is worth sharing: references and schemas
+    made only of scalar keywords, such as `{"type": "string"}`, are kept inline.
+
+    Args:
+        node (dict): The inline schema.
+
+    Returns:
+        bool: True if the schema nests other values.
+    """
+    return "$ref" not in node and any(
+        isinstance(value, (dict, list)) for value in node.values()
+    )
+
+
+def _canonical_key(node: dict) -> str:
+    """
+    Returns a key equal for structurally equal schemas, whatever their key order.
+
+    Args:
+        node (dict): The inline schema.
+
+    Returns:
+        str: The canonical JSON of the schema.
+    """
+    return json.dumps(node, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _iter_subschemas(node: dict) -> Iterator[dict]:
+    """
+    Yields the sub-schemas nested directly in a schema.
+
+    Args:
+        node (dict): The schema.
+
+    Returns:
+        Iterator[dict]: The nested sub-schemas.
+    """
+    for keyword in SUBSCHEMA_KEYWORDS:
+        if isinstance(node.get(keyword), dict):
+            yield node[keyword]
+
+    for keyword in SUBSCHEMA_LIST_KEYWORDS:
+        for child in node.get(keyword) or ():
+            if isinstance(child, dict):
+                yield child
+
+    for child in (node.get("properties") or {}).values():
+        if isinstance(child, dict):
+            yield child
+
+
+def _iter_schemas(value: Any) -> Iterator[dict]:
+    """
+    Yields the schemas of the parameters, request bodies and responses of
+    OpenAPI paths.
+
+    Args:
+        value (Any): The OpenAPI paths, or a part of them.
+
+    Returns:
+        Iterator[dict]: The schemas.
+    """
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if key == "schema" and isinstance(child, dict):
+                yield child
+            else:
+                yield from _iter_schemas(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _iter_schemas(child)
+
+
+def _map_copy_on_write(value: Any, transform: Callable[[Any, Any], Any]) -> Any:
+    """
+    Applies a transformation to the items of a dict or list, copying the
+    container only if an item changed, so unchanged parts stay shared.
+
+    Args:
+        value (Any): The container.
+        transform (Callable[[Any, Any], Any]): Transforms an item, given its key
+            (None for list items) and the item.
+
+    Returns:
+        Any: The container itself, or a changed copy.
+    """
+    if isinstance(value, dict):
+        items = {key: transform(key, child) for key, child in value.items()}
+        changed = any(items[key] is not child for key, child in value.items())
+    elif isinstance(value, list):
+        items = [transform(None, child) for child in value]
+        changed = any(new is not old for new, old in zip(items, value))
+    else:
+        return value
+
+    return items if changed else value
+
+
+def _suggest_name(node: dict) -> str:
+    """
+    Derives a component name from the structure of a schema, e.g. `UserList`
+    for an array of users.
+
+    Args:
+        node (dict): The schema.
+
+    Returns:
+        str: The suggested name.
+    """
+    if "$ref" in node:
+        return node["$ref"].rsplit("/", 1)[-1]
+    if node.get("type") == "array" and isinstance(node.get("items"), dict):
+        return f"{_suggest_name(node['items'])}List"
+
+    for keyword, separator in (("oneOf", "Or"), ("anyOf", "Or"), ("allOf", "And")):
+        if isinstance(node.get(keyword), list):
+            return separator.join(
+                _suggest_name(child)
+                for child in node[keyword]
+                if isinstance(child, dict)
+            )
+
+    if isinstance(node.get("type"), str):
+        return node["type"].capitalize()
+
+    return "Schema"
+
+
+def _saves_space(node: dict, key: str, occurrences: int) -> bool:
+    """
+    Tells whether hoisting a schema makes the document smaller: each occurrence
+    is replaced with a reference, and the schema is written once in the
+    components, under a name suggested from its structure.
+
+    Args:
+        node (dict): The schema.
+        key (str): The canonical key of the schema.
+        occurrences (int): The number of occurrences of the schema.
+
+    Returns:
+        bool: True if the references save more than the component costs.
+    """
+    name = _suggest_name(node)
+    if len(name) > MAX_NAME_LENGTH:
+        name = "Schema00000000"
+
+    reference = len(f'{{"$ref":"{REF_PREFIX}{name}"}}')
+    component = len(f'"{name}":,') + len(key)
+
+    return (len(key) - reference) * occurrences > component
+
+
+def deduplicate_schemas(
+    generated: dict[str, dict], min_occurrences: int = 2
+) -> dict[str, dict]:
+    """
+    Hoists the inline schemas repeated across the operations, such as the
+    arrays of models and the unions of responses, into the components, and
+    replaces them with references.
+
+    Structurally equal schemas are found by their canonical JSON. Only schemas
+    nesting other values are hoisted, and only when the references save more
+    than the component costs, e.g. an array of models repeated in a handful of
+    responses. A schema nested in a hoisted schema only counts once. The given
+    paths and components are left untouched: the parts of the paths that
+    change are copied and the rest is shared.
+
+    Args:
+        generated (dict[str, dict]): The OpenAPI paths and components.
+        min_occurrences (int): The number of occurrences from which a schema
+            may be hoisted.
+
+    Returns:
+        dict[str, dict]: The OpenAPI paths and components, deduplicated.
+    """
+    paths = generated["paths"]
+    components = dict(generated["components"]["schemas"])
+
+    # The first occurrence of each schema, from which its name is suggested
+    samples: dict[str, dict] = {}
+    decisions: dict[tuple[str, int], bool] = {}
+
+    def is_repeated(key: str, counts: Counter) -> bool:
+        if counts[key] < min_occurrences:
+            return False
+
+        decision = (key, counts[key])
+        if decision not in decisions:
+            decisions[decision] = _saves_space(samples[key], key, counts[key])
+        return decisions[decision]
+
+    occurrences = Counter()
+
+    def count(node: dict):
+        if _is_composite(node):
+            key = _canonical_key(node)
+            occurrences[key] += 1
+            samples.setdefault(key, node)
+        for child in _iter_subschemas(node):
+            count(child)
+
+    for schema in _iter_schemas(paths):
+        count(schema)
+
+    # Counts again, with the schemas nested in a repeated schema counted once,
+    # as they end up once in its component
+    hoisted_counts = Counter()
+    visited = set()
+
+    def count_hoisted(node: dict):
+        if _is_composite(node):
+            key = _canonical_key(node)
+            hoisted_counts[key] += 1
+            if is_repeated(key, occurrences):
+                if key in visited:
+                    return
+                visited.add(key)
+        for child in _iter_subschemas(node):
+            count_hoisted(child)
+
+    for schema in _iter_schemas(paths):
+        count_hoisted(schema)
+
+    names: dict[str, str] = {}
+
+    def hoist(node: dict) -> dict:
+        if _is_composite(node):
+            key = _canonical_key(node)
+            if is_repeated(key, hoisted_counts):
+                if key not in names:
+                    names[key] = _component_name(node, key, components)
+                    components[names[key]] = rewrite_subschemas(node)
+                return {"$ref": f"{REF_PREFIX}{names[key]}"}
+
+        return rewrite_subschemas(node)
+
+    def hoist_item(_, child):
+        return hoist(child) if isinstance(child, dict) else child
+
+    def rewrite_subschemas(node: dict) -> dict:
+        def transform(keyword, value):
+            if keyword in SUBSCHEMA_KEYWORDS and isinstance(value, dict):
+                return hoist(value)
+            if keyword in (*SUBSCHEMA_LIST_KEYWORDS, "properties"):
+                return _map_copy_on_write(value, hoist_item)
+            return value
+
+        return _map_copy_on_write(node, transform)
+
+    def rewrite_paths(key, value):
+        if key == "schema" and isinstance(value, dict):
+            return hoist(value)
+        return _map_copy_on_write(value, rewrite_paths)
+
+    if not any(is_repeated(key, hoisted_counts) for key in hoisted_counts):
+        return generated
+
+    return {
+        "paths": _map_copy_on_write(paths, rewrite_paths),
+        "components": {"schemas": components},
+    }
+
+
+def _component_name(node: dict, key: str, components: dict[str, dict]) -> str:
+    """
+    Chooses a component name for a hoisted schema, not used by another component.
+
+    Args:
+        node (dict): The schema.
+        key (str): The canonical key of the schema.
+        components (dict[str, dict]): The components.
+
+    Returns:
+        str: The component name.
+    """
+    base = re.sub(r"[^A-Za-z0-9._-]", "", _suggest_name(node)) or "Schema"
+    if len(base) > MAX_NAME_LENGTH:
+        base = f"Schema{hashlib.sha256(key.encode()).hexdigest()[:8]}"
+
+    name = base
+    suffix = 2
+    while name in components:
+        name = f"{base}{suffix}"
+        suffix += 1
+
+    return name
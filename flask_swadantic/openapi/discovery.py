@@ -0,0 +1,183 @@
+from dataclasses import replace
+from functools import wraps
+
+from flask import Flask
+from werkzeug.routing import BaseConverter, Map
+from werkzeug.routing.rules import parse_converter_args
+
+from flask_swadantic.schema import EndpointMeta, Schema
+from flask_swadantic.schema.routing import (
+    RULE_CONVERTER,
+    path_parameters,
+    rule_methods,
+)
+
+
+def _build_converter(url_map: Map, name: str, arguments: str) -> BaseConverter | None:
+    """
+    Builds a converter of a url_map.
+
+    Args:
+        url_map (Map): The url_map declaring the converter.
+        name (str): The name of the converter.
+        arguments (str): Its arguments, as written in the rule.
+
+    Returns:
+        BaseConverter | None: The converter, or None if it is not declared or
+        cannot be built.
+    """
+    converter_class = url_map.converters.get(name)
+    if converter_class is None:
+        return None
+
+    try:
+        args, kwargs = parse_converter_args(arguments)
+        return converter_class(url_map, *args, **kwargs)
+    except (TypeError, ValueError):
+        return None
+
+
+class RouteDiscovery:
+    """
+    RouteDiscovery finds the routes of the documented endpoints in the
+    url_map of the application, in a single pass over its rules, done again
+    only when rules are added.
+
+    The rules of the url_map already carry the URL prefixes of every blueprint
+    they were registered through, so the blueprints do not have to be
+    replayed. Only the public API of the url_map is read: the arguments of a
+    rule are parsed from its string, with the converters of the url_map.
+    """
+
+    def __init__(self, app: Flask):
+        """
+        Initializes a RouteDiscovery.
+
+        Args:
+            app (Flask): The application whose url_map is read.
+        """
+        self._app = app
+        self._changed = True
+        # (blueprint name, function name) -> [(rule, methods, path parameters)]
+        self._routes: dict[tuple[str, str], list[tuple[str, tuple, tuple]]] = {}
+        # (converter name, arguments) -> converter, for the custom converters
+        self._converters: dict[tuple[str, str], BaseConverter | None] = {}
+        self._watch(app.url_map)
+
+    def _watch(self, url_map: Map):
+        """
+        Flags the routes as changed whenever rules are added to the url_map,
+        so that checking for changes does not read its rules.
+
+        Args:
+            url_map (Map): The url_map of the application.
+        """
+        add = url_map.add
+
+        @wraps(add)
+        def watched_add(rulefactory):
+            add(rulefactory)
+            self._changed = True
+
+        url_map.add = watched_add
+
+    @property
+    def changed(self) -> bool:
+        """
+        Tells whether rules were added to the url_map since the last pass.
+
+        Returns:
+            bool: True if `refresh` has rules to index.
+        """
+        return self._changed
+
+    def refresh(self) -> set[str]:
+        """
+        Indexes the rules of the url_map again if rules were added since the
+        last pass.
+
+        Returns:
+            set[str]: The names of the blueprints whose routes changed.
+        """
+        if not self._changed:
+            return set()
+
+        self._changed = False
+        routes = {}
+        for rule in self._app.url_map.iter_rules():
+            view_func = self._app.view_functions.get(rule.endpoint)
+            if view_func is None:
+                continue
+
+            blueprint, _, _ = rule.endpoint.rpartition(".")
+            routes.setdefault((blueprint, view_func.__name__), []).append(
+                (
+                    rule.rule,
+                    rule_methods(rule.methods or ()),
+                    path_parameters(self._rule_converters(rule.rule), view_func),
+                )
+            )
+
+        blueprints = {
+            blueprint
+            for blueprint, function_name in routes.keys() | self._routes.keys()
+            if routes.get((blueprint, function_name))
+            != self._routes.get((blueprint, function_name))
+        }
+        self._routes = routes
+        return blueprints
+
+    def _rule_converters(
+        self, rule: str
+    ) -> tuple[tuple[str, BaseConverter | None], ...]:
+        """
+        Parses the arguments of a rule with the converters of the url_map, so
+        custom converters, and default ones replaced by the application, are
+        described by the converter they extend.
+
+        Args:
+            rule (str): The rule, e.g. '/users/<uuid:user_id>'.
+
+        Returns:
+            tuple[tuple[str, BaseConverter | None], ...]: The arguments and
+            their converters, in order.
+        """
+        converters = []
+        for match in RULE_CONVERTER.finditer(rule):
+            key = (match["converter"] or "default", match["arguments"] or "")
+            if key not in self._converters:
+                self._converters[key] = _build_converter(self._app.url_map, *key)
+            converters.append((match["variable"], self._converters[key]))
+
+        return tuple(converters)
+
+    def endpoints(self, chain: tuple[Schema, ...]) -> list[EndpointMeta] | None:
+        """
+        Returns the endpoints of the last schema of a chain, with the rules
+        they are registered with in the application, as of the last `refresh`.
+
+        Args:
+            chain (tuple[Schema, ...]): The chain of schemas from a top-level
+                schema, whose blueprint names make the blueprint name of the
+                last schema in the application.
+
+        Returns:
+            list[EndpointMeta] | None: The endpoints with their full rule, one
+            per method, or None if the blueprint is not registered in the
+            application under that name.
+        """
+        blueprint = ".".join(schema.name for schema in chain)
+        if blueprint not in self._app.blueprints:
+            return None
+
+        endpoints = []
+        for endpoint in chain[-1].registered_endpoints:
+            for rule, methods, path in self._routes.get(
+                (blueprint, endpoint.function_name), ()
+            ):
+                endpoints.extend(
+                    replace(endpoint, rule=rule, method=method, path=path)
+                    for method in methods
+                )
+
+        return endpoints
@@ -0,0 +1,451 @@
+import dataclasses
+import gzip
+import hashlib
+import json
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from mmap import mmap
+from typing import Any
+
+from werkzeug.datastructures import Accept, MIMEAccept
+from werkzeug.http import parse_accept_header
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML is optional
+    yaml = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is optional
+    msgpack = None
+
+# Media type of each format of the specification. "min" is the JSON without
+# its null and empty fields, only selected with `?format=min`
+SPEC_FORMATS = {
+    "json": "application/json",
+    "min": "application/json",
+    "yaml": "application/yaml",
+    "msgpack": "application/msgpack",
+}
+
+# Media types accepted for each format, in order of preference
+ACCEPTED_MEDIA_TYPES = {
+    "application/json": "json",
+    "application/yaml": "yaml",
+    "application/x-yaml": "yaml",
+    "text/yaml": "yaml",
+    "application/msgpack": "msgpack",
+    "application/vnd.msgpack": "msgpack",
+    "application/x-msgpack": "msgpack",
+}
+
+# Fields of the OpenAPI objects whose values are kept verbatim by strip_empty:
+# schemas, the map of component schemas, example values, and the security
+# requirements, where nulls and empty values are meaningful
+VERBATIM_FIELDS = frozenset(("schema", "schemas", "example", "value", "security"))
+
+
+def _default(value):
+    """
+    Encodes the values the standard JSON encoder does not support.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The JSON compatible representation of the value.
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass(frozen=True)
+class EncodedSpec:
+    """
+    The OpenAPI specification encoded once into immutable bytes, together with
+    its compressed variants and the strong ETag of its content.
+    """
+
+    identity: bytes | mmap
+    gzip: bytes | mmap | None
+    br: bytes | mmap | None
+    etag: str
+    mimetype: str = "application/json"
+
+    def negotiate(self, accept_encodings: Accept) -> str | None:
+        """
+        Chooses the content encoding to answer with.
+
+        Args:
+            accept_encodings (Accept): The parsed Accept-Encoding header.
+
+        Returns:
+            str | None: "br", "gzip" or None for the uncompressed content.
+        """
+        offers = [
+            encoding for encoding in ("br", "gzip") if self.get(encoding) is not None
+        ]
+        encoding = accept_encodings.best_match([*offers, "identity"])
+
+        return encoding if encoding in ("br", "gzip") else None
+
+    def get(self, encoding: str | None) -> bytes | mmap | None:
+        """
+        Returns the content for the given encoding.
+
+        Args:
+            encoding (str | None): "br", "gzip" or None for the uncompressed content.
+
+        Returns:
+            bytes | mmap | None: The encoded specification, memory-mapped for
+            prebuilt artifacts, or None if the encoding is not available.
+        """
+        return getattr(self, encoding) if encoding else self.identity
+
+    def get_etag(self, encoding: str | None) -> str:
+        """
+        Returns the strong ETag for the given encoding. Each encoding has its
+        own ETag, as the bytes sent differ.
+
+        Args:
+            encoding (str | None): "br", "gzip" or None for the uncompressed content.
+
+        Returns:
+            str: The ETag, without quotes.
+        """
+        return f"{self.etag}-{encoding}" if encoding else self.etag
+
+
+def iter_chunks(buffer: bytes | mmap, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Yields a buffer in chunks, so memory-mapped content is copied one chunk
+    at a time while it is sent.
+
+    Args:
+        buffer (bytes | mmap): The content to send.
+        chunk_size (int): The maximum size of each chunk.
+
+    Returns:
+        Iterator[bytes]: The chunks of the buffer.
+    """
+    for start in range(0, len(buffer), chunk_size):
+        yield buffer[start : start + chunk_size]
+
+
+@dataclass(frozen=True)
+class StreamedSpec:
+    """
+    The OpenAPI specification encoded while it is sent, so only a bounded buffer
+    is held in memory per request instead of the whole encoded document.
+
+    Its ETag cannot be derived from the content ahead of time, so it is derived
+    from a token unique to the process and the revision of the specification.
+    """
+
+    spec: dict
+    etag: str
+    chunk_size: int = 64 * 1024
+    mimetype: str = "application/json"
+
+    def negotiate(self, accept_encodings: Accept) -> str | None:
+        """
+        Chooses the content encoding to answer with.
+
+        Args:
+            accept_encodings (Accept): The parsed Accept-Encoding header.
+
+        Returns:
+            str | None: "br", "gzip" or None for the uncompressed content.
+        """
+        offers = ["br", "gzip"] if _brotli_compressor() else ["gzip"]
+        encoding = accept_encodings.best_match([*offers, "identity"])
+
+        return encoding if encoding in ("br", "gzip") else None
+
+    def get(self, encoding: str | None) -> Iterator[bytes]:
+        """
+        Returns the chunks of the content for the given encoding.
+
+        Args:
+            encoding (str | None): "br", "gzip" or None for the uncompressed content.
+
+        Returns:
+            Iterator[bytes]: The encoded specification, chunk by chunk.
+        """
+        chunks = iter_spec_json(self.spec, self.chunk_size)
+
+        if encoding == "gzip":
+            # wbits 31 writes the gzip header and trailer
+            return _iter_compressed(chunks, zlib.compressobj(6, zlib.DEFLATED, 31))
+        if encoding == "br":
+            return _iter_compressed(chunks, _brotli_compressor()(quality=5))
+
+        return chunks
+
+    def get_etag(self, encoding: str | None) -> str:
+        """
+        Returns the ETag for the given encoding.
+
+        Args:
+            encoding (str | None): "br", "gzip" or None for the uncompressed content.
+
+        Returns:
+            str: The ETag, without quotes.
+        """
+        return f"{self.etag}-{encoding}" if encoding else self.etag
+
+
+def _brotli_compressor():
+    """
+    Returns the incremental brotli compressor, if brotli is installed.
+    """
+    return getattr(brotli, "Compressor", None)
+
+
+def _iter_compressed(chunks: Iterator[bytes], compressor) -> Iterator[bytes]:
+    """
+    Compresses chunks incrementally.
+
+    Args:
+        chunks (Iterator[bytes]): The uncompressed chunks.
+        compressor: A zlib compressobj or a brotli Compressor.
+
+    Returns:
+        Iterator[bytes]: The compressed chunks.
+    """
+    compress = getattr(compressor, "compress", None) or compressor.process
+    flush = getattr(compressor, "flush", None) or compressor.finish
+
+    for chunk in chunks:
+        compressed = compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield flush()
+
+
+def _iter_object(mapping: dict, encode) -> Iterator[str]:
+    """
+    Yields a mapping as a JSON object, one entry at a time.
+
+    Args:
+        mapping (dict): The mapping to encode.
+        encode: Yields the pieces of the JSON of an entry, given its key and value.
+
+    Returns:
+        Iterator[str]: The pieces of the JSON object.
+    """
+    yield "{"
+    for index, (key, value) in enumerate(mapping.items()):
+        yield f"{',' if index else ''}{json.dumps(key)}:"
+        yield from encode(key, value)
+    yield "}"
+
+
+def iter_spec_json(spec: dict, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Encodes the OpenAPI specification into compact JSON bytes, yielded in chunks
+    of about `chunk_size` bytes.
+
+    The paths and the component schemas are encoded one entry at a time, straight
+    from the cached fragments they are shared with, so the encoded document is
+    never held in memory whole.
+
+    Args:
+        spec (dict): The OpenAPI specification.
+        chunk_size (int): The size from which the buffer is yielded.
+
+    Returns:
+        Iterator[bytes]: The chunks of the encoded specification.
+    """
+    encoder = json.JSONEncoder(default=_default, sort_keys=True, separators=(",", ":"))
+
+    def encode_value(key: str, value) -> Iterator[str]:
+        yield encoder.encode(value)
+
+    def encode_components(key: str, value) -> Iterator[str]:
+        if isinstance(value, dict):
+            return _iter_object(value, encode_value)
+        return encode_value(key, value)
+
+    def encode_top(key: str, value) -> Iterator[str]:
+        if key == "paths":
+            return _iter_object(value, encode_value)
+        if key == "components":
+            return _iter_object(value, encode_components)
+        return encode_value(key, value)
+
+    buffer = []
+    size = 0
+
+    for piece in _iter_object(spec, encode_top):
+        buffer.append(piece)
+        size += len(piece)
+
+        if size >= chunk_size:
+            yield "".join(buffer).encode()
+            buffer.clear()
+            size = 0
+
+    yield "".join(buffer).encode()
+
+
+def encode_document(identity: bytes, mimetype: str = "application/json") -> EncodedSpec:
+    """
+    Compresses an encoded document, such as a specification or a page
+    rendered from it, and derives its ETag.
+
+    Args:
+        identity (bytes): The encoded document.
+        mimetype (str): The media type of the document.
+
+    Returns:
+        EncodedSpec: The document and its compressed variants.
+    """
+    return EncodedSpec(
+        identity=identity,
+        gzip=gzip.compress(identity, compresslevel=9, mtime=0),
+        br=brotli.compress(identity, quality=9) if brotli else None,
+        etag=hashlib.sha256(identity).hexdigest()[:32],
+        mimetype=mimetype,
+    )
+
+
+def encode_spec(spec: dict) -> EncodedSpec:
+    """
+    Encodes the OpenAPI specification into compact JSON bytes and compresses it.
+
+    Args:
+        spec (dict): The OpenAPI specification.
+
+    Returns:
+        EncodedSpec: The encoded specification.
+    """
+    return encode_document(
+        json.dumps(
+            spec, default=_default, sort_keys=True, separators=(",", ":")
+        ).encode()
+    )
+
+
+def strip_empty(value: Any) -> Any:
+    """
+    Removes the null fields, and the empty lists and objects, of the OpenAPI
+    objects of a document, such as a missing description or requestBody.
+
+    Schemas and example values are not stripped, as `default: null` or `{}`
+    are meaningful there, and neither are the items of lists.
+
+    Args:
+        value (Any): The decoded document, or a part of it.
+
+    Returns:
+        Any: A stripped copy of the value.
+    """
+    if isinstance(value, dict):
+        stripped = {}
+        for key, child in value.items():
+            if key not in VERBATIM_FIELDS:
+                child = strip_empty(child)
+                if child is None or child in ({}, []):
+                    continue
+            stripped[key] = child
+        return stripped
+    if isinstance(value, list):
+        return [strip_empty(child) for child in value]
+
+    return value
+
+
+@cache
+def available_formats() -> tuple[str, ...]:
+    """
+    Returns the formats of the specification that can be served, depending on
+    the optional encoders installed.
+
+    Returns:
+        tuple[str, ...]: The available formats, keys of SPEC_FORMATS.
+    """
+    return tuple(
+        spec_format
+        for spec_format in SPEC_FORMATS
+        if not (spec_format == "yaml" and yaml is None)
+        and not (spec_format == "msgpack" and msgpack is None)
+    )
+
+
+# Clients send a handful of distinct Accept headers, so the negotiation is
+# memoized on the raw headers
+@lru_cache(maxsize=256)
+def negotiate_format(requested: str | None, accept: str | None) -> str | None:
+    """
+    Chooses the format of the specification to answer with.
+
+    Args:
+        requested (str | None): The format requested with `?format=`, which
+            takes precedence over the Accept header.
+        accept (str | None): The raw Accept header.
+
+    Returns:
+        str | None: The format, JSON when nothing else is accepted, or None if
+        the requested format is not available.
+    """
+    available = available_formats()
+
+    if requested:
+        return requested if requested in available else None
+    if not accept:
+        return "json"
+
+    offers = [
+        media_type
+        for media_type, spec_format in ACCEPTED_MEDIA_TYPES.items()
+        if spec_format in available
+    ]
+    best = parse_accept_header(accept, MIMEAccept).best_match(
+        offers, default="application/json"
+    )
+    return ACCEPTED_MEDIA_TYPES[best]
+
+
+def encode_spec_format(identity: bytes | mmap, spec_format: str) -> EncodedSpec:
+    """
+    Encodes the OpenAPI specification into an alternative format, from its
+    JSON encoding. The alternative formats leave out the null and empty fields.
+
+    Args:
+        identity (bytes | mmap): The specification encoded into JSON.
+        spec_format (str): "min", "yaml" or "msgpack".
+
+    Returns:
+        EncodedSpec: The encoded specification.
+
+    Raises:
+        ValueError: If the format is not available.
+    """
+    if spec_format not in available_formats() or spec_format == "json":
+        raise ValueError(f"The {spec_format!r} specification format is not available")
+
+    document = strip_empty(json.loads(identity[:]))
+
+    if spec_format == "yaml":
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        encoded = yaml.dump(
+            document, Dumper=dumper, sort_keys=False, allow_unicode=True
+        ).encode()
+    elif spec_format == "msgpack":
+        encoded = msgpack.packb(document, use_bin_type=True)
+    else:
+        encoded = json.dumps(document, separators=(",", ":")).encode()
+
+    return encode_document(encoded, SPEC_FORMATS[spec_format])
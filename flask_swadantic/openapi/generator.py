@@ -1,7 +1,133 @@
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+
+from flask_swadantic.metrics import metrics
 from flask_swadantic.schema import EndpointMeta
 from flask_swadantic.schema import SchemaProcessor
 from flask_swadantic.schema import Schema
 
+logger = logging.getLogger(__name__)
+
+EXECUTORS: dict[str, type[Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+class ComponentConflictError(ValueError):
+    """
+    Raised when separately generated parts of a specification define the same
+    component or operation differently.
+    """
+
+
+def map_shard(endpoints: list[EndpointMeta]) -> dict[str, dict]:
+    """
+    Maps a shard of endpoints to OpenAPI paths and components with its own
+    generator, so that shards can be mapped in parallel.
+
+    Args:
+        endpoints (list[EndpointMeta]): The prefixed endpoints of the shard.
+
+    Returns:
+        dict[str, dict]: A dictionary containing the OpenAPI paths and components.
+    """
+    generator = OpenAPIGenerator()
+
+    return {
+        "paths": dict(generator._map_endpoints(endpoints)),
+        "components": {"schemas": generator._models},
+    }
+
+
+def map_shards(
+    shards: list[list[EndpointMeta]],
+    workers: int | None = None,
+    executor: str = "thread",
+) -> list[dict[str, dict]]:
+    """
+    Maps several shards of endpoints, in parallel when more than one worker
+    is requested.
+
+    Args:
+        shards (list[list[EndpointMeta]]): The prefixed endpoints of each shard.
+        workers (int | None): The number of workers. Shards are mapped serially
+            when None or 1.
+        executor (str): "thread" or "process". Process pools require the models
+            of the endpoints to be importable.
+
+    Returns:
+        list[dict[str, dict]]: The paths and components of each shard, in order.
+
+    Raises:
+        ValueError: If the executor is not supported.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Invalid executor {executor!r}. Expected one of {', '.join(EXECUTORS)}."
+        )
+
+    if not workers or workers <= 1 or len(shards) <= 1:
+        return list(map(map_shard, shards))
+
+    with EXECUTORS[executor](max_workers=min(workers, len(shards))) as pool:
+        return list(pool.map(map_shard, shards))
+
+
+def merge_fragments(
+    fragments: list[dict[str, dict]], strict: bool = False
+) -> dict[str, dict]:
+    """
+    Merges separately generated paths and components, in order.
+
+    Conflicts are resolved the way a single generator resolves them: the first
+    component with a name is kept, and an operation defined again replaces the
+    previous one. Each conflict is logged as a warning, unless `strict` makes
+    it an error.
+
+    Args:
+        fragments (list[dict[str, dict]]): The paths and components to merge.
+        strict (bool): Raises on conflicts instead of resolving them.
+
+    Returns:
+        dict[str, dict]: A dictionary containing the OpenAPI paths and components.
+
+    Raises:
+        ComponentConflictError: If `strict` and two fragments define the same
+            component differently, or the same operation of a path.
+    """
+    paths = {}
+    models = {}
+
+    for fragment in fragments:
+        for rule, operations in fragment["paths"].items():
+            path = paths.setdefault(rule, {})
+
+            for method in operations:
+                if method not in path:
+                    continue
+
+                message = (
+                    f"Operation '{method.upper()} {rule}' is defined more than once"
+                )
+                if strict:
+                    raise ComponentConflictError(message)
+                logger.warning("%s, keeping the last one", message)
+
+            path.update(operations)
+
+        for name, schema in fragment["components"]["schemas"].items():
+            existing = models.setdefault(name, schema)
+
+            if existing is not schema and existing != schema:
+                message = f"Component '{name}' is defined more than once with different schemas"
+                if strict:
+                    raise ComponentConflictError(message)
+                logger.warning("%s, keeping the first one", message)
+
+    return {"paths": paths, "components": {"schemas": models}}
+
 
 class OpenAPIGenerator(SchemaProcessor):
     """
@@ -11,16 +137,22 @@ class OpenAPIGenerator(SchemaProcessor):
     prefixes, ensuring a structured and consistent OpenAPI specification is created.
     """
 
-    def _add_prefix_to_endpoint(self, prefixes: list[str], endpoint: EndpointMeta):
+    def _add_prefix_to_endpoint(
+        self, prefixes: list[str], endpoint: EndpointMeta
+    ) -> EndpointMeta:
         """
         Adds prefixes to the endpoint's rule.
 
+        The endpoint metadata registered in the schema is left untouched, so the
+        same schemas can be processed any number of times.
+
         Args:
-            prefixes (list[str]): A list of URL prefixes to prepend to the endpoint.
-            endpoint (EndpointMeta): The endpoint metadata containing the rule to update.
+            prefixes (list[str]): A list of URL prefixes to prepend to the endpoint,
+                from the innermost to the outermost.
+            endpoint (EndpointMeta): The endpoint metadata containing the rule.
 
         Returns:
-            None
+            EndpointMeta: A copy of the endpoint metadata with the prefixed rule.
         """
         rule = endpoint.rule
 
@@ -28,7 +160,7 @@ class OpenAPIGenerator(SchemaProcessor):
             if prefix:
                 rule = f"{prefix.rstrip('/')}/{rule.lstrip('/')}"
 
-        endpoint.rule = rule
+        return replace(endpoint, rule=rule)
 
     def _process_schema(self, schema: Schema) -> list[EndpointMeta]:
         """
@@ -41,7 +173,9 @@ class OpenAPIGenerator(SchemaProcessor):
         Returns:
             list[EndpointMeta]: A list of processed EndpointMeta objects.
         """
-        endpoints = schema.endpoints
+        endpoints = [
+            endpoint for endpoint in schema.endpoints if endpoint.rule is not None
+        ]
 
         # Recursively process child schemas
         for sub_schema in schema.schemas:
@@ -49,10 +183,10 @@ class OpenAPIGenerator(SchemaProcessor):
             endpoints.extend(child_endpoints)
 
         # Process endpoints of the current schema
-        for endpoint in endpoints:
+        return [
             self._add_prefix_to_endpoint([schema.url_prefix], endpoint)
-
-        return endpoints
+            for endpoint in endpoints
+        ]
 
     def _process_schemas(self, schemas: list[Schema]) -> list[EndpointMeta]:
         """
@@ -71,23 +205,88 @@ class OpenAPIGenerator(SchemaProcessor):
 
         return endpoints
 
-    def generate(self, schemas: list[Schema]) -> dict[str, dict]:
+    def generate_fragment(self, schema: Schema, prefixes: list[str]) -> dict[str, dict]:
+        """
+        Generates the paths and components contributed by the schema's own
+        endpoints, without descending into its child schemas.
+
+        Args:
+            schema (Schema): The schema to generate.
+            prefixes (list[str]): The URL prefixes of the schema and its parents,
+                from the innermost to the outermost.
+
+        Returns:
+            dict[str, dict]: A dictionary containing the OpenAPI paths and components.
+        """
+        endpoints = self.prefixed_endpoints(schema, prefixes)
+
+        return {
+            "paths": self._map_endpoints(endpoints),
+            "components": {"schemas": self._models},
+        }
+
+    def prefixed_endpoints(
+        self, schema: Schema, prefixes: list[str]
+    ) -> list[EndpointMeta]:
+        """
+        Returns the schema's own endpoints with the given prefixes applied.
+
+        Args:
+            schema (Schema): The schema to process.
+            prefixes (list[str]): The URL prefixes of the schema and its parents,
+                from the innermost to the outermost.
+
+        Returns:
+            list[EndpointMeta]: A list of processed EndpointMeta objects.
+        """
+        return [
+            self._add_prefix_to_endpoint(prefixes, endpoint)
+            for endpoint in schema.endpoints
+            if endpoint.rule is not None
+        ]
+
+    def generate(
+        self,
+        schemas: list[Schema],
+        workers: int | None = None,
+        executor: str = "thread",
+        strict: bool = False,
+    ) -> dict[str, dict]:
         """
         Generates an OpenAPI specification for the given schemas.
 
+        With more than one worker, each top-level schema is mapped as a separate
+        shard on a thread or process pool, and the shards are merged in order.
+
         Args:
             schemas (list[Schema]): A list of Schema objects representing the API schemas.
+            workers (int | None): The number of workers used to map the schemas.
+            executor (str): "thread" or "process".
+            strict (bool): Raises when shards conflict, instead of logging a
+                warning and resolving the conflict as a single generator would.
 
         Returns:
             dict[str, dict]: A dictionary containing the OpenAPI paths and components.
 
         Raises:
             ValueError: If any item in 'schemas' is not an instance of the Schema class.
+            ComponentConflictError: If `strict` and shards define the same
+                component differently.
         """
         if not all(isinstance(schema, Schema) for schema in schemas):
             raise ValueError("All items in 'schemas' must be instances of 'Schema'")
 
-        endpoints = self._process_schemas(schemas)
+        if workers and workers > 1:
+            # Blueprints are introspected here; only the mapping runs in parallel
+            with metrics.timed("spec_phase", "process_schemas"):
+                shards = [self._process_schema(schema) for schema in schemas]
+
+            fragments = map_shards(shards, workers, executor)
+            with metrics.timed("spec_phase", "merge"):
+                return merge_fragments(fragments, strict)
+
+        with metrics.timed("spec_phase", "process_schemas"):
+            endpoints = self._process_schemas(schemas)
         models = self._models
 
         return {
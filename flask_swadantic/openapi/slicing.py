@@ -0,0 +1,78 @@
+from collections.abc import Iterator
+from typing import Any
+
+REF_PREFIX = "#/components/schemas/"
+
+
+def iter_refs(node: Any) -> Iterator[str]:
+    """
+    Yields the names of the components referenced anywhere in a JSON structure.
+
+    Args:
+        node (Any): The JSON structure to walk.
+
+    Returns:
+        Iterator[str]: The names of the referenced components.
+    """
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+            yield ref[len(REF_PREFIX) :]
+
+        for value in node.values():
+            yield from iter_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from iter_refs(value)
+
+
+def select_components(paths: dict, components: dict[str, dict]) -> dict[str, dict]:
+    """
+    Selects the components referenced by the paths, directly or through other
+    components.
+
+    Args:
+        paths (dict): The OpenAPI paths.
+        components (dict[str, dict]): The available component schemas.
+
+    Returns:
+        dict[str, dict]: The transitive closure of the referenced components.
+    """
+    selected = {}
+    pending = list(iter_refs(paths))
+
+    while pending:
+        name = pending.pop()
+        if name in selected or name not in components:
+            continue
+
+        selected[name] = components[name]
+        pending.extend(iter_refs(components[name]))
+
+    # Keep the order of the available components
+    return {name: schema for name, schema in components.items() if name in selected}
+
+
+def filter_tag(paths: dict, tag: str) -> dict:
+    """
+    Keeps the operations tagged with the given tag.
+
+    Args:
+        paths (dict): The OpenAPI paths.
+        tag (str): The tag to keep.
+
+    Returns:
+        dict: The paths with at least one operation tagged with the tag.
+    """
+    filtered = {}
+
+    for rule, operations in paths.items():
+        tagged = {
+            method: operation
+            for method, operation in operations.items()
+            if tag in (operation.get("tags") or ())
+        }
+        if tagged:
+            filtered[rule] = tagged
+
+    return filtered
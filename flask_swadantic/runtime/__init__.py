@@ -0,0 +1,13 @@
+from .body import BodyValidator as BodyValidator
+from .body import RequestValidationError as RequestValidationError
+from .cache import CacheBackend as CacheBackend
+from .cache import CachedResponse as CachedResponse
+from .cache import MemoryCache as MemoryCache
+from .cache import ResponseCache as ResponseCache
+from .query import QueryParser as QueryParser
+from .response import ResponseMismatch as ResponseMismatch
+from .response import ResponseSerializer as ResponseSerializer
+from .response import ResponseValidator as ResponseValidator
+from .types import iter_models as iter_models
+from .types import to_annotation as to_annotation
+from .view import wrap_view as wrap_view
@@ -0,0 +1,64 @@
+import json
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from werkzeug.exceptions import UnprocessableEntity
+
+from flask_swadantic.runtime.types import to_annotation
+
+
+class RequestValidationError(UnprocessableEntity):
+    """
+    Raised when a request does not match the models declared for its endpoint.
+
+    The response is a JSON document listing the validation errors, which are
+    also available in `errors` for custom error handlers.
+    """
+
+    def __init__(self, errors: list[dict[str, Any]]):
+        super().__init__()
+        self.errors = errors
+
+    def get_body(self, environ=None, scope=None) -> str:
+        return json.dumps({"code": self.code, "errors": self.errors})
+
+    def get_headers(self, environ=None, scope=None) -> list[tuple[str, str]]:
+        return [("Content-Type", "application/json")]
+
+
+class BodyValidator:
+    """
+    Validates raw request bodies against the body declared for an endpoint.
+
+    The validator is built once per endpoint and parses the JSON bytes directly
+    into the declared models, without decoding them into a dict first.
+    """
+
+    def __init__(self, body: Any):
+        """
+        Initializes a BodyValidator.
+
+        Args:
+            body (Any): The declared body: a model, a list of models, `list[Model]`
+                or a union.
+        """
+        self._adapter = TypeAdapter(to_annotation(body))
+
+    def validate(self, data: bytes) -> Any:
+        """
+        Validates a raw request body.
+
+        Args:
+            data (bytes): The raw JSON request body.
+
+        Returns:
+            Any: The parsed body.
+
+        Raises:
+            RequestValidationError: If the body is not valid JSON or does not
+                match the declared body.
+        """
+        try:
+            return self._adapter.validate_json(data)
+        except ValidationError as e:
+            raise RequestValidationError(json.loads(e.json(include_url=False)))
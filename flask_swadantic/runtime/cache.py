@@ -0,0 +1,270 @@
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from flask import Response, current_app, request
+from pydantic import BaseModel
+
+from flask_swadantic.schema.cache import CachePolicy
+
+# Methods whose responses are cached
+CACHED_METHODS = frozenset(("GET", "HEAD"))
+
+# Headers that are not replayed from a cached response
+UNCACHED_HEADERS = frozenset(("content-length", "date", "etag", "set-cookie"))
+
+# Headers identifying the client, part of the key unless the policy is shared
+CREDENTIAL_HEADERS = ("Authorization", "Cookie")
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    status: int
+    headers: tuple[tuple[str, str], ...]
+    etag: str
+
+
+class CacheBackend(ABC):
+    """
+    CacheBackend stores the cached responses of an endpoint.
+
+    Implementations may be shared by processes, e.g. backed by Redis: the keys
+    are strings, and the entries are picklable.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Returns a cached response.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            CachedResponse | None: The response, or None if it is not cached
+            or has expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: CachedResponse, ttl: float):
+        """
+        Caches a response.
+
+        Args:
+            key (str): The cache key.
+            value (CachedResponse): The response.
+            ttl (float): The number of seconds the response stays fresh.
+        """
+
+    @abstractmethod
+    def clear(self):
+        """
+        Discards every cached response.
+        """
+
+
+class MemoryCache(CacheBackend):
+    """
+    MemoryCache keeps the cached responses in the process, in a bounded LRU.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initializes a MemoryCache.
+
+        Args:
+            max_entries (int): The number of responses from which the least
+                recently used ones are evicted.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResponse, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Caches the responses of a GET endpoint, keyed by the endpoint, its path
+    parameters, its validated query model and the headers it varies on.
+
+    Unless the policy is shared, the responses vary on the Authorization and
+    Cookie headers too, so a response is never served to another client, and
+    are private to the client when it sent credentials.
+
+    Responses are served with a strong ETag and Cache-Control max-age, and
+    answer 304 when the client already has them.
+    """
+
+    def __init__(self, policy: CachePolicy):
+        """
+        Initializes a ResponseCache.
+
+        Args:
+            policy (CachePolicy): The cache policy of the endpoint.
+        """
+        self._ttl = policy.ttl
+        self._private = not policy.shared
+        declared = {header.lower() for header in policy.vary}
+        self._vary = tuple(policy.vary) + tuple(
+            header
+            for header in (CREDENTIAL_HEADERS if self._private else ())
+            if header.lower() not in declared
+        )
+        self._backend = policy.backend or MemoryCache(policy.max_entries)
+
+    @property
+    def backend(self) -> CacheBackend:
+        """
+        Returns the backend storing the responses.
+
+        Returns:
+            CacheBackend: The backend.
+        """
+        return self._backend
+
+    def key(self, query: BaseModel | None = None) -> str | None:
+        """
+        Returns the cache key of the current request.
+
+        Args:
+            query (BaseModel | None): The validated query model, if the
+                endpoint parses its query string. The raw arguments are used
+                otherwise, in a canonical order.
+
+        Returns:
+            str | None: The key, or None if the request method is not cached.
+        """
+        if request.method not in CACHED_METHODS:
+            return None
+
+        if query is not None:
+            canonical_query: Any = query.model_dump(mode="json")
+        else:
+            canonical_query = sorted(request.args.items(multi=True))
+
+        parts = [
+            request.endpoint,
+            sorted((name, str(value)) for name, value in request.view_args.items()),
+            canonical_query,
+            [request.headers.get(header) for header in self._vary],
+        ]
+        digest = hashlib.sha256(
+            json.dumps(parts, sort_keys=True, separators=(",", ":")).encode()
+        )
+
+        return f"swadantic:{request.endpoint}:{digest.hexdigest()[:32]}"
+
+    def lookup(self, key: str) -> Response | None:
+        """
+        Returns the cached response of a request.
+
+        Args:
+            key (str): The cache key of the request.
+
+        Returns:
+            Response | None: The response, or None if it is not cached.
+        """
+        cached = self._backend.get(key)
+        if cached is None:
+            return None
+
+        response = current_app.response_class(
+            cached.body, status=cached.status, headers=list(cached.headers)
+        )
+        return self._finalize(response, cached.etag)
+
+    def store(self, key: str, rv: Any) -> Response:
+        """
+        Caches the value returned by a view, if it is a complete 200 response
+        without cookies.
+
+        Args:
+            key (str): The cache key of the request.
+            rv (Any): The value returned by the view.
+
+        Returns:
+            Response: The response to send.
+        """
+        response = current_app.make_response(rv)
+
+        if (
+            response.status_code != 200
+            or response.is_streamed
+            or "Set-Cookie" in response.headers
+        ):
+            return response
+
+        body = response.get_data()
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        self._backend.set(
+            key,
+            CachedResponse(
+                body=body,
+                status=response.status_code,
+                headers=tuple(
+                    (name, value)
+                    for name, value in response.headers.items()
+                    if name.lower() not in UNCACHED_HEADERS
+                ),
+                etag=etag,
+            ),
+            self._ttl,
+        )
+
+        return self._finalize(response, etag)
+
+    def _finalize(self, response: Response, etag: str) -> Response:
+        """
+        Adds the caching headers to a response and makes it conditional.
+
+        Args:
+            response (Response): The response.
+            etag (str): The ETag of its body.
+
+        Returns:
+            Response: The response, or a 304 response.
+        """
+        response.set_etag(etag)
+        response.cache_control.max_age = int(self._ttl)
+        if self._private and any(
+            header in request.headers for header in CREDENTIAL_HEADERS
+        ):
+            response.cache_control.private = True
+        for header in self._vary:
+            response.vary.add(header)
+
+        return response.make_conditional(request)
@@ -0,0 +1,157 @@
+import json
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from inspect import isclass
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, ValidationError
+from werkzeug.datastructures import MultiDict
+
+from flask_swadantic.runtime.body import RequestValidationError
+
+# Depth from which nested models are not unfolded into deepObject keys, which
+# also stops self-referencing models
+MAX_DEPTH = 8
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """
+    Returns the annotation of an optional field without its None member.
+
+    Args:
+        annotation (Any): The annotation of a field.
+
+    Returns:
+        Any: The annotation, without None if it was `X | None`.
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        members = [member for member in get_args(annotation) if member is not NoneType]
+        if len(members) == 1:
+            return members[0]
+
+    return annotation
+
+
+def _is_sequence(annotation: Any) -> bool:
+    """
+    Tells whether a field takes multiple values, e.g. `list[int]` or `set[str]`.
+
+    Args:
+        annotation (Any): The annotation of a field, without None.
+
+    Returns:
+        bool: True if the field is a sequence or a set.
+    """
+    origin = get_origin(annotation) or annotation
+    return (
+        isclass(origin)
+        and issubclass(origin, (Sequence, AbstractSet))
+        and not issubclass(origin, (str, bytes))
+    )
+
+
+def _is_model(annotation: Any) -> bool:
+    return isclass(annotation) and issubclass(annotation, BaseModel)
+
+
+def compile_plan(
+    model: type[BaseModel], prefix: str = "", path: tuple[str, ...] = (), depth: int = 0
+) -> dict[str, tuple[tuple[str, ...], bool]]:
+    """
+    Compiles the coercion plan of a query model: the query keys it accepts, and
+    where their values go in the data validated by the model.
+
+    Fields are read by their alias. Nested models are read in the deepObject
+    style, e.g. `filter[name]=...`, and sequences from repeated keys.
+
+    Args:
+        model (type[BaseModel]): The query model.
+        prefix (str): The query key of the model, for nested models.
+        path (tuple[str, ...]): The path of the model in the validated data.
+        depth (int): The nesting depth of the model.
+
+    Returns:
+        dict[str, tuple[tuple[str, ...], bool]]: The path in the validated data
+        of each query key, and whether the key takes multiple values.
+    """
+    plan = {}
+
+    for name, field in model.model_fields.items():
+        alias = (
+            field.validation_alias if isinstance(field.validation_alias, str) else None
+        )
+        key = alias or field.alias or name
+        query_key = f"{prefix}[{key}]" if prefix else key
+        annotation = _unwrap_optional(field.annotation)
+
+        if _is_model(annotation) and depth < MAX_DEPTH:
+            plan.update(compile_plan(annotation, query_key, (*path, key), depth + 1))
+        else:
+            plan[query_key] = ((*path, key), _is_sequence(annotation))
+
+    return plan
+
+
+class QueryParser:
+    """
+    Parses the query string of a request into the query model declared for its
+    endpoint.
+
+    The parser is built once per endpoint: the query keys of the model are
+    compiled into a plan, so a request only costs one pass over its arguments
+    and one validation. Values are coerced from strings by pydantic in lax
+    mode, which handles numbers, booleans, enums, dates and UUIDs.
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        """
+        Initializes a QueryParser.
+
+        Args:
+            model (type[BaseModel]): The query model.
+
+        Raises:
+            TypeError: If the query is not a single pydantic model.
+        """
+        if not _is_model(model):
+            raise TypeError("Only a single pydantic model can parse the query string")
+
+        self._model = model
+        self._plan = compile_plan(model)
+
+    def parse(self, args: MultiDict[str, str]) -> BaseModel:
+        """
+        Parses query arguments. Keys the model does not declare are ignored.
+
+        Args:
+            args (MultiDict[str, str]): The query arguments, e.g. `request.args`.
+
+        Returns:
+            BaseModel: The query model.
+
+        Raises:
+            RequestValidationError: If the arguments do not match the model.
+        """
+        data: dict[str, Any] = {}
+
+        for key, values in args.lists():
+            planned = self._plan.get(key)
+            if planned is None:
+                continue
+
+            path, multiple = planned
+            target = data
+            for part in path[:-1]:
+                target = target.setdefault(part, {})
+            target[path[-1]] = values if multiple else values[0]
+
+        try:
+            return self._model.model_validate(data)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ["query", *error["loc"]]}
+                    for error in json.loads(e.json(include_url=False))
+                ]
+            )
@@ -0,0 +1,146 @@
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from flask import Response, current_app
+from pydantic import TypeAdapter, ValidationError
+from werkzeug.datastructures import Headers
+
+from flask_swadantic.runtime.types import to_annotation
+from flask_swadantic.schema.response import ResponseSchema
+
+
+def _status_code(status: Any) -> int | None:
+    """
+    Reads the status code of a status returned by a view.
+
+    Args:
+        status (Any): An int, an HTTPStatus or a string such as "201 CREATED".
+
+    Returns:
+        int | None: The status code, or None if it cannot be read.
+    """
+    if isinstance(status, int):
+        return int(status)
+
+    if isinstance(status, str):
+        code, _, _ = status.strip().partition(" ")
+        if code.isdigit():
+            return int(code)
+
+    return None
+
+
+class ResponseSerializer:
+    """
+    Serializes the values returned by a view with the bodies declared in its
+    response schemas.
+
+    A serializer is compiled once per declared status code, so views can return
+    models, lists of models or any value matching the declared body, which is
+    written straight to JSON bytes.
+    """
+
+    def __init__(self, responses: list[ResponseSchema]):
+        """
+        Initializes a ResponseSerializer.
+
+        Args:
+            responses (list[ResponseSchema]): The response schemas of the endpoint.
+        """
+        self._adapters: dict[int, TypeAdapter] = {
+            int(response.status_code): TypeAdapter(to_annotation(response.body))
+            for response in responses
+            if response.body is not None
+        }
+
+    def serialize(self, rv: Any) -> Any:
+        """
+        Serializes the return value of a view.
+
+        Responses, and values returned with a status code without a declared
+        body, are returned unchanged for Flask to handle.
+
+        Args:
+            rv (Any): The return value of the view, optionally a tuple with
+                the status code and headers.
+
+        Returns:
+            Any: The response, or the return value unchanged.
+        """
+        body, status, headers = rv, 200, None
+
+        if isinstance(rv, tuple):
+            if len(rv) == 3:
+                body, status, headers = rv
+            elif len(rv) == 2 and isinstance(rv[1], (Headers, dict, tuple, list)):
+                # Like Flask, anything else is a status
+                body, headers = rv
+            elif len(rv) == 2:
+                body, status = rv
+
+        if isinstance(body, Response):
+            return rv
+
+        adapter = self._adapters.get(_status_code(status))
+        if adapter is None:
+            return rv
+
+        return current_app.response_class(
+            adapter.dump_json(body, warnings=False),
+            status=status,
+            headers=headers,
+            mimetype="application/json",
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseMismatch:
+    endpoint: str
+    method: str
+    status_code: int
+    errors: list[dict[str, Any]]
+
+
+class ResponseValidator:
+    """
+    Validates sent responses against the bodies declared in the response
+    schemas of their endpoint, to detect drift between the views and the
+    specification.
+    """
+
+    def __init__(self, responses: list[ResponseSchema]):
+        """
+        Initializes a ResponseValidator.
+
+        Args:
+            responses (list[ResponseSchema]): The response schemas of the endpoint.
+        """
+        self._adapters: dict[int, TypeAdapter] = {
+            int(response.status_code): TypeAdapter(to_annotation(response.body))
+            for response in responses
+            if response.body is not None
+        }
+
+    def validate(self, response: Response) -> list[dict[str, Any]] | None:
+        """
+        Validates the JSON payload of a response. Streamed and non-JSON
+        responses, and status codes without a declared body, are not checked.
+
+        Args:
+            response (Response): The response sent by the view.
+
+        Returns:
+            list[dict[str, Any]] | None: The validation errors, or None if the
+            payload matches the declared body.
+        """
+        adapter = self._adapters.get(response.status_code)
+        if adapter is None or response.is_streamed or not response.is_json:
+            return None
+
+        try:
+            adapter.validate_json(response.get_data())
+        except ValidationError as e:
+            return json.loads(e.json(include_url=False))
+
+        return None
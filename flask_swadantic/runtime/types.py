@@ -0,0 +1,76 @@
+from collections.abc import Iterable, Iterator
+from functools import reduce
+from inspect import isclass
+from operator import or_
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+
+def _union(annotations: Iterable[Any]) -> Any:
+    """
+    Builds the union of type annotations, as `A | B | C` would.
+
+    Args:
+        annotations (Iterable[Any]): The annotations, at least one.
+
+    Returns:
+        Any: The union of the annotations.
+    """
+    return reduce(or_, annotations)
+
+
+def to_annotation(body: Any) -> Any:
+    """
+    Converts a body declared in the schemas into a type annotation pydantic
+    can validate and serialize.
+
+    Bodies are declared the same way they are documented: a list of models is
+    any of the models, `list[str, float, bool]` is a list of any of the item
+    types, and constants such as `"OK"` are literals.
+
+    Args:
+        body (Any): The declared body.
+
+    Returns:
+        Any: The equivalent type annotation.
+    """
+    if isinstance(body, list):
+        return _union(map(to_annotation, body))
+
+    origin = get_origin(body)
+
+    if origin is list:
+        items = tuple(map(to_annotation, get_args(body)))
+        return list[_union(items)] if items else list
+
+    if origin is Union or origin is UnionType:
+        return _union(map(to_annotation, get_args(body)))
+
+    if body is None:
+        return NoneType
+
+    if isinstance(body, (str, int, float, bool)):
+        return Literal[body]
+
+    return body
+
+
+def iter_models(body: Any) -> Iterator[type[BaseModel]]:
+    """
+    Yields the pydantic models used by a declared body, query or list of models.
+
+    Args:
+        body (Any): The declared body.
+
+    Returns:
+        Iterator[type[BaseModel]]: The models, possibly repeated.
+    """
+    if isinstance(body, (list, tuple)):
+        for item in body:
+            yield from iter_models(item)
+    elif get_origin(body):
+        yield from iter_models(get_args(body))
+    elif isclass(body) and issubclass(body, BaseModel):
+        yield body
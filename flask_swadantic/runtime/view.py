@@ -0,0 +1,87 @@
+import time
+from functools import wraps
+from types import FunctionType
+
+from flask import request
+
+from flask_swadantic.metrics import metrics
+from flask_swadantic.runtime.body import BodyValidator
+from flask_swadantic.runtime.cache import ResponseCache
+from flask_swadantic.runtime.query import QueryParser
+from flask_swadantic.runtime.response import ResponseSerializer
+from flask_swadantic.schema.endpoint import operation_id
+
+
+def wrap_view(
+    func: FunctionType,
+    body_validator: BodyValidator | None = None,
+    response_serializer: ResponseSerializer | None = None,
+    query_parser: QueryParser | None = None,
+    response_cache: ResponseCache | None = None,
+    summary: str | None = None,
+) -> FunctionType:
+    """
+    Wraps a view function with the runtime behaviours enabled for its endpoint.
+
+    Args:
+        func (FunctionType): The view function.
+        body_validator (BodyValidator | None): Validates the request body, which
+            is passed to the view as the `body` keyword argument.
+        response_serializer (ResponseSerializer | None): Serializes the value
+            returned by the view.
+        query_parser (QueryParser | None): Parses the query string, which is
+            passed to the view as the `query` keyword argument.
+        response_cache (ResponseCache | None): Caches the responses of GET
+            requests, keyed by the validated query.
+        summary (str | None): The summary of the endpoint, which names its
+            timings in the metrics.
+
+    Returns:
+        FunctionType: The wrapped view function.
+    """
+
+    summary = summary or func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # The timings are only taken when the metrics are enabled
+        timed = metrics.enabled
+        operation = operation_id(request.method, summary) if timed else None
+
+        if query_parser is not None or body_validator is not None:
+            start = time.perf_counter() if timed else 0.0
+            try:
+                if query_parser is not None:
+                    kwargs["query"] = query_parser.parse(request.args)
+                if body_validator is not None:
+                    kwargs["body"] = body_validator.validate(request.get_data())
+            finally:
+                if timed:
+                    metrics.observe(
+                        "request_validation", operation, time.perf_counter() - start
+                    )
+
+        cache_key = None
+        if response_cache is not None:
+            cache_key = response_cache.key(kwargs.get("query"))
+            if cache_key is not None:
+                cached = response_cache.lookup(cache_key)
+                if cached is not None:
+                    return cached
+
+        rv = func(*args, **kwargs)
+
+        if response_serializer is not None:
+            start = time.perf_counter() if timed else 0.0
+            rv = response_serializer.serialize(rv)
+            if timed:
+                metrics.observe(
+                    "response_serialization", operation, time.perf_counter() - start
+                )
+
+        if cache_key is not None:
+            return response_cache.store(cache_key, rv)
+
+        return rv
+
+    return wrapper
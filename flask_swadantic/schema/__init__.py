@@ -1,7 +1,24 @@
+from typing import TYPE_CHECKING
+
+from flask_swadantic._lazy import lazy_getattr
+
+from .cache import CachePolicy as CachePolicy
 from .info import InfoSchema as InfoSchema
 from .path import PathSchema as PathSchema
 from .query import QuerySchema as QuerySchema
 from .response import ResponseSchema as ResponseSchema, BodyType as BodyType
 from .endpoint import EndpointMeta as EndpointMeta, Endpoint as Endpoint
 from .schema import Schema as Schema
-from .processor import SchemaProcessor as SchemaProcessor
+
+if TYPE_CHECKING:
+    from .processor import SchemaProcessor as SchemaProcessor
+    from .processor import clear_model_schema_cache as clear_model_schema_cache
+
+# Imported on first use, so that declaring schemas stays cheap
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "SchemaProcessor": ".processor",
+        "clear_model_schema_cache": ".processor",
+    },
+)
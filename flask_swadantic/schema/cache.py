@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from flask_swadantic.runtime.cache import CacheBackend
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    ttl: float
+    max_entries: int = 1024
+    vary: tuple[str, ...] = ()
+    backend: "CacheBackend | None" = None
+    # True if the responses do not depend on the credentials of the request,
+    # which are otherwise part of the cache key
+    shared: bool = False
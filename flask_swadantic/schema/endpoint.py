@@ -1,64 +1,88 @@
-import inspect
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Type
 
 from pydantic import BaseModel
 
-from flask_swadantic.schema import PathSchema
 from flask_swadantic.schema import ResponseSchema
+from flask_swadantic.schema.cache import CachePolicy
+from flask_swadantic.schema.routing import (
+    path_parameters,
+    rule_converters,
+    rule_methods,
+)
 
+# Every distinct combination of tags is stored once, and shared by the endpoints
+_tag_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
 
+
+def intern_tags(tags: Iterable[str]) -> tuple[str, ...]:
+    """
+    Returns the shared tuple for a combination of tags.
+
+    Args:
+        tags (Iterable[str]): The tags.
+
+    Returns:
+        tuple[str, ...]: The interned tuple of interned tags.
+    """
+    tags = tuple(tags)
+    interned = _tag_tuples.get(tags)
+
+    if interned is None:
+        interned = _tag_tuples.setdefault(tags, tuple(sys.intern(tag) for tag in tags))
+
+    return interned
+
+
+def operation_id(method: str, summary: str) -> str:
+    """
+    Returns the operationId of an endpoint.
+
+    Args:
+        method (str): The HTTP method.
+        summary (str): The summary of the endpoint.
+
+    Returns:
+        str: The operationId, e.g. 'get-list-users'.
+    """
+    return f"{method.lower()}-{summary.lower().replace(' ', '-')}"
+
+
+# Compared by identity: two endpoints with the same metadata are still distinct
+@dataclass(frozen=True, slots=True, eq=False)
 class EndpointMeta:
-    def __init__(
-        self,
-        summary: str,
-        function_name: str,
-        description: str | None = None,
-        query: Type[BaseModel] | list[Type[BaseModel]] | None = None,
-        path: list[PathSchema] = None,
-        body: Type[BaseModel] | list[Type[BaseModel]] | None = None,
-        responses: list[ResponseSchema] | None = None,
-        tags: list[str] | None = None,
-        rule: str | None = None,
-        method: str | None = None,
-    ):
-        self.summary = summary
-        self.description = description
-        self.function_name = function_name
-        self.query = query
-        self.path = path
-        self.body = body
-        self.responses = responses
-        self.tags = tags
-        self.rule = rule
-        self.method = method
+    summary: str
+    function_name: str
+    description: str | None = None
+    query: Type[BaseModel] | list[Type[BaseModel]] | None = None
+    path: tuple[dict, ...] = ()
+    body: Type[BaseModel] | list[Type[BaseModel]] | None = None
+    responses: list[ResponseSchema] | None = None
+    tags: tuple[str, ...] = ()
+    rule: str | None = None
+    method: str | None = None
+    response_sample_rate: float | None = None
+    cache: CachePolicy | None = None
 
 
+# Mutable, as Flask records the route by calling add_url_rule on it
+@dataclass(slots=True)
 class Endpoint:
-    def __init__(self):
-        self.rule = None
-        self.endpoint = None
-        self.method = None
-        self.function_name = None
-        self.path = []
+    rule: str | None = None
+    endpoint: str | None = None
+    methods: tuple[str, ...] = ()
+    function_name: str | None = None
+    path: tuple[dict, ...] = ()
 
     def add_url_rule(
         self, rule, endpoint, view_func, provide_automatic_options=True, **options
     ):
         self.rule = rule
         self.endpoint = endpoint
-        self.method = options.get("methods")[0]
+        self.methods = rule_methods(
+            options.get("methods") or getattr(view_func, "methods", None) or ("GET",)
+        )
         self.function_name = view_func.__name__
-
-        params = inspect.signature(view_func).parameters
-        mapped_params = []
-        for param in params:
-            if isinstance(params[param].default, PathSchema):
-                mapped_params.append(
-                    {
-                        "name": params[param].name,
-                        "type": params[param].annotation,
-                        "description": params[param].default.description,
-                    }
-                )
-
-        self.path = mapped_params
+        self.path = path_parameters(rule_converters(rule), view_func)
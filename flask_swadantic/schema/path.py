@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
 class PathSchema:
-    def __init__(self, description: str):
-        self.description = description
+    description: str
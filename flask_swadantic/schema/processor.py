@@ -1,15 +1,48 @@
-import re
 from collections import defaultdict
+from functools import cache
+from threading import Lock
 from inspect import isclass
 from types import UnionType
-from typing import Type, Union
-from typing_extensions import get_origin, get_args
+from typing import Type, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 
-from flask_swadantic.schema import ResponseSchema
+from flask_swadantic.metrics import metrics
+from flask_swadantic.schema import CachePolicy, ResponseSchema
 from flask_swadantic.schema import EndpointMeta
 from flask_swadantic.schema import BodyType
+from flask_swadantic.schema.endpoint import operation_id
+from flask_swadantic.schema.routing import RULE_CONVERTER
+
+REF_TEMPLATE = "#/components/schemas/{model}"
+
+# JSON schemas of the models, by model class and reference template, shared by
+# every processor of the process. Entries are dropped along with their model.
+_model_schemas: WeakKeyDictionary[type, dict[str, dict]] = WeakKeyDictionary()
+_model_schemas_lock = Lock()
+
+
+def clear_model_schema_cache():
+    """
+    Clears the JSON schemas cached for every model, e.g. after a model is rebuilt.
+    """
+    with _model_schemas_lock:
+        _model_schemas.clear()
+
+
+@cache
+def _convert_rule(rule: str) -> str:
+    """
+    Converts the route variables of a rule, once per distinct rule.
+
+    Args:
+        rule (str): The endpoint rule (e.g., '/users/<string:user_id>').
+
+    Returns:
+        str: Converted rule (e.g., '/users/{user_id}').
+    """
+    return RULE_CONVERTER.sub(r"{\g<variable>}", rule)
 
 
 class SchemaProcessor:
@@ -41,6 +74,9 @@ class SchemaProcessor:
         """
         Returns a JSON schema representation for the given model or list of models.
 
+        The schemas are generated once per model and process and shared by every
+        processor, so they must be treated as read-only.
+
         Args:
             model (Union[BaseModel, List[BaseModel]]): A Pydantic model or a list of models to be processed.
 
@@ -50,11 +86,18 @@ class SchemaProcessor:
         if isinstance(model, list):
             return list(map(self._generate_model_schema, model))
 
-        schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
-        parsed_schema = self._parse_defs(schema)
-        parsed_schema[schema["title"]] = schema
+        parsed_schema = _model_schemas.get(model, {}).get(REF_TEMPLATE)
 
-        return parsed_schema
+        if parsed_schema is None:
+            with metrics.timed("model_schema", model.__name__):
+                schema = model.model_json_schema(ref_template=REF_TEMPLATE)
+            parsed_schema = self._parse_defs(schema)
+            parsed_schema[schema["title"]] = schema
+
+            with _model_schemas_lock:
+                _model_schemas.setdefault(model, {})[REF_TEMPLATE] = parsed_schema
+
+        return dict(parsed_schema)
 
     def _get_model_reference(
         self, model: Type[BaseModel] | list[Type[BaseModel]]
@@ -141,25 +184,41 @@ class SchemaProcessor:
         # Default empty schema if type cannot be processed
         return {}
 
-    def _process_properties(self, properties: dict, required_fields: list[str]):
+    def _process_properties(
+        self,
+        properties: dict,
+        required_fields: list[str],
+        defs: dict[str, dict] | None = None,
+    ):
         """
         Process the properties of an object to generate query parameters.
 
+        Nested models are documented in the deepObject style, e.g.
+        `filter[name]=...`, as the query parser reads them.
+
         Args:
             properties (dict): Properties of the schema.
+            required_fields (list[str]): Names of the required properties.
+            defs (dict[str, dict] | None): The schemas the properties reference,
+                by name.
 
         Returns:
-            None
+            list[dict]: List of OpenAPI query parameters.
         """
+        defs = defs or {}
         query_params = []
 
         for field_name, field_info in properties.items():
-            # Skip references for now
-            if "$ref" in field_info:
-                continue
+            references = [
+                option["$ref"].rsplit("/", 1)[-1]
+                for option in (field_info, *field_info.get("anyOf", ()))
+                if "$ref" in option
+            ]
 
             schema = {}
-            if field_info.get("type") == "array":
+            if "$ref" in field_info:
+                schema = {"$ref": field_info["$ref"]}
+            elif field_info.get("type") == "array":
                 schema = {"type": "array", "items": field_info.get("items", {})}
             elif "anyOf" in field_info:
                 schema = {"anyOf": field_info["anyOf"]}
@@ -174,23 +233,30 @@ class SchemaProcessor:
                 "description": field_info.get("title", f"{field_name} query parameter"),
                 "required": field_name in required_fields,
             }
+            if any(defs.get(name, {}).get("type") == "object" for name in references):
+                param["style"] = "deepObject"
+                param["explode"] = True
+
             query_params.append(param)
 
         return query_params
 
-    def _convert_to_openapi_query_params(self, schema: dict):
+    def _convert_to_openapi_query_params(
+        self, schema: dict, defs: dict[str, dict] | None = None
+    ):
         """
         Converts a JSON schema structure into OpenAPI query parameters.
 
         Args:
-            schema (dict): Structure with schemas in the format {"Model": {...}}.
+            schema (dict): The JSON schema of the query model.
+            defs (dict[str, dict] | None): The schemas it references, by name.
 
         Returns:
             list[dict]: List of parameters in OpenAPI query parameter format.
         """
         # Process each schema in the provided JSON structure
         return self._process_properties(
-            schema.get("properties", {}), schema.get("required", [])
+            schema.get("properties", {}), schema.get("required", []), defs
         )
 
     def _map_query(self, endpoint: EndpointMeta):
@@ -204,11 +270,13 @@ class SchemaProcessor:
             list[dict]: List of OpenAPI query parameters.
         """
 
-        # The schema is generated but not saved because it should not appear in the OpenAPI specification.
-        schema = self._generate_model_schema(endpoint.query)[
-            self._get_model_name(endpoint.query)
-        ]
-        return self._convert_to_openapi_query_params(schema)
+        # The query model itself is not saved because it should not appear in the
+        # OpenAPI specification, only the nested models and enums it references
+        schemas = self._generate_model_schema(endpoint.query)
+        schema = schemas.pop(self._get_model_name(endpoint.query))
+        self._models.update(schemas)
+
+        return self._convert_to_openapi_query_params(schema, schemas)
 
     def _map_path(self, endpoint: EndpointMeta):
         """
@@ -222,15 +290,16 @@ class SchemaProcessor:
         """
         params = []
         for param in endpoint.path:
-            params.append(
-                {
-                    "name": param["name"],
-                    "in": "path",
-                    "required": True,
-                    "schema": {"type": "string"},
-                    "description": param["description"],
-                }
-            )
+            mapped_param = {
+                "name": param["name"],
+                "in": "path",
+                "required": True,
+                "schema": param["schema"],
+            }
+            if param["description"] is not None:
+                mapped_param["description"] = param["description"]
+
+            params.append(mapped_param)
 
         return params
 
@@ -244,11 +313,12 @@ class SchemaProcessor:
         Returns:
             dict: OpenAPI request body content.
         """
-        return {
-            "content": {
-                "application/json": {"schema": self._get_model_reference(endpoint.body)}
-            }
-        }
+        if get_origin(endpoint.body):
+            schema = self._parse_response_body(endpoint.body)
+        else:
+            schema = self._get_model_reference(endpoint.body)
+
+        return {"content": {"application/json": {"schema": schema}}}
 
     def _map_response(self, response: ResponseSchema):
         return {
@@ -283,20 +353,66 @@ class SchemaProcessor:
         path_params = self._map_path(endpoint) if endpoint.path else []
 
         method = endpoint.method.lower()
-        return {
-            method: {
-                "summary": endpoint.summary,
-                "description": endpoint.description,
-                "operationId": f"{method}-{endpoint.summary.lower().replace(' ', '-')}",
-                "tags": endpoint.tags,
-                "parameters": [*query_params, *path_params],
-                "requestBody": self._map_body(endpoint) if endpoint.body else None,
-                "responses": self._map_responses(endpoint.responses)
-                if endpoint.responses
-                else None,
-            }
+        operation = {
+            "summary": endpoint.summary,
+            "description": endpoint.description,
+            "operationId": operation_id(method, endpoint.summary),
+            "tags": list(endpoint.tags),
+            "parameters": [*query_params, *path_params],
+            "requestBody": self._map_body(endpoint) if endpoint.body else None,
+            "responses": self._map_responses(endpoint.responses)
+            if endpoint.responses
+            else None,
         }
 
+        if endpoint.cache is not None and method in ("get", "head"):
+            self._map_cache(endpoint.cache, operation)
+
+        return {method: operation}
+
+    def _map_cache(self, policy: CachePolicy, operation: dict):
+        """
+        Documents the caching headers of an operation whose responses are cached.
+
+        Args:
+            policy (CachePolicy): The cache policy of the endpoint.
+            operation (dict): The OpenAPI operation, updated in place.
+        """
+        operation["parameters"].extend(
+            {
+                "name": header,
+                "in": "header",
+                "required": False,
+                "schema": {"type": "string"},
+                "description": description,
+            }
+            for header, description in (
+                ("If-None-Match", "ETag of a cached copy of the response."),
+                *(
+                    (header, "The cached responses vary on it.")
+                    for header in policy.vary
+                ),
+            )
+        )
+
+        responses = operation["responses"] = dict(operation["responses"] or {})
+        for status_code, response in responses.items():
+            if int(status_code) == 200:
+                response["headers"] = {
+                    "ETag": {
+                        "description": "Strong ETag of the response body.",
+                        "schema": {"type": "string"},
+                    },
+                    "Cache-Control": {
+                        "description": "How long the response stays fresh.",
+                        "schema": {
+                            "type": "string",
+                            "example": f"max-age={int(policy.ttl)}",
+                        },
+                    },
+                }
+        responses[304] = {"description": "Not Modified"}
+
     def convert_rule_segments(self, rule: str) -> str:
         """
         Converts Flask-style route variables to OpenAPI-style for a given rule.
@@ -307,16 +423,7 @@ class SchemaProcessor:
         Returns:
             str: Converted rule (e.g., '/users/{user_id}').
         """
-        raw_segments = re.split(r"(<[^:]+:[^>]+>)", rule)
-
-        segments = []
-        for segment in raw_segments:
-            if segment.startswith("<") and segment.endswith(">"):
-                segments.append(f"{{{segment[1:-1].split(':')[-1]}}}")
-            else:
-                segments.append(segment)
-
-        return "".join(segments)
+        return _convert_rule(rule)
 
     def _map_endpoints(self, endpoints: list[EndpointMeta]) -> dict:
         """
@@ -330,8 +437,9 @@ class SchemaProcessor:
         """
         meta = defaultdict(dict)
 
-        for endpoint in endpoints:
-            rule = self.convert_rule_segments(endpoint.rule)
-            meta[rule].update(self._map_endpoint(endpoint))
+        with metrics.timed("spec_phase", "map_endpoints"):
+            for endpoint in endpoints:
+                rule = self.convert_rule_segments(endpoint.rule)
+                meta[rule].update(self._map_endpoint(endpoint))
 
         return meta
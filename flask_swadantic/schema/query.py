@@ -1,7 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
 class QuerySchema:
-    def __init__(
-        self, name: str, description: str | None = None, required: bool = False
-    ):
-        self.name = name
-        self.description = description
-        self.required = required
+    name: str
+    description: str | None = None
+    required: bool = False
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Type, Union
 
 from pydantic import BaseModel
@@ -21,13 +22,8 @@ BodyType = (
 )
 
 
+@dataclass(frozen=True, slots=True)
 class ResponseSchema:
-    def __init__(
-        self,
-        status_code: int,
-        body: BodyType,
-        description: str | None = None,
-    ):
-        self.status_code = status_code
-        self.body = body
-        self.description = description
+    status_code: int
+    body: BodyType
+    description: str | None = None
@@ -0,0 +1,197 @@
+import inspect
+import json
+import re
+from collections.abc import Callable
+from functools import cache
+
+from werkzeug.routing import BaseConverter, Map
+from werkzeug.routing.converters import (
+    AnyConverter,
+    IntegerConverter,
+    NumberConverter,
+    UUIDConverter,
+)
+from werkzeug.routing.rules import parse_converter_args
+
+from flask_swadantic.schema.path import PathSchema
+
+# Methods answered by Flask itself, which are not documented
+IMPLICIT_METHODS = frozenset(("HEAD", "OPTIONS"))
+
+# Order of the methods of a rule, the others are sorted after them
+METHOD_ORDER = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+# The converter, its arguments and the variable of a rule argument
+RULE_CONVERTER = re.compile(
+    r"<(?:(?P<converter>[a-zA-Z_]\w*)(?:\((?P<arguments>.*?)\))?:)?"
+    r"(?P<variable>[a-zA-Z_]\w*)>"
+)
+
+# Only provides the default converters with the map they are bound to
+_DEFAULT_MAP = Map()
+
+# Every distinct tuple of path parameters, and of methods, is stored once and
+# shared by the endpoints
+_parameter_tuples: dict[tuple, tuple[dict, ...]] = {}
+_method_tuples: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def converter_schema(converter: BaseConverter | None) -> dict:
+    """
+    Returns the JSON schema of the values matched by a Werkzeug converter.
+
+    Args:
+        converter (BaseConverter | None): The converter of a rule argument.
+
+    Returns:
+        dict: The JSON schema of the argument. Unknown converters match strings.
+    """
+    if isinstance(converter, UUIDConverter):
+        return {"type": "string", "format": "uuid"}
+    if isinstance(converter, AnyConverter):
+        return {"type": "string", "enum": sorted(converter.items)}
+    if isinstance(converter, NumberConverter):
+        # int and float
+        schema = {
+            "type": "integer" if isinstance(converter, IntegerConverter) else "number"
+        }
+
+        minimum = converter.min
+        if minimum is None and not converter.signed:
+            minimum = 0
+        if minimum is not None:
+            schema["minimum"] = minimum
+        if converter.max is not None:
+            schema["maximum"] = converter.max
+
+        return schema
+
+    # string, path and custom converters
+    return {"type": "string"}
+
+
+@cache
+def _default_converter(name: str, arguments: str) -> BaseConverter | None:
+    """
+    Builds a default Werkzeug converter, once per distinct converter and
+    arguments, e.g. 'int' and 'min=1'.
+
+    Args:
+        name (str): The name of the converter.
+        arguments (str): Its arguments, as written in the rule.
+
+    Returns:
+        BaseConverter | None: The converter, or None if it is not a default one.
+    """
+    converter_class = _DEFAULT_MAP.converters.get(name)
+    if converter_class is None:
+        return None
+
+    args, kwargs = parse_converter_args(arguments)
+    return converter_class(_DEFAULT_MAP, *args, **kwargs)
+
+
+def rule_converters(rule: str) -> tuple[tuple[str, BaseConverter | None], ...]:
+    """
+    Parses the arguments of a rule with the default Werkzeug converters.
+
+    Args:
+        rule (str): The rule, e.g. '/users/<uuid:user_id>'.
+
+    Returns:
+        tuple[tuple[str, BaseConverter | None], ...]: The arguments and their
+        converters, in order. The converter is None when it is not a default one,
+        as custom converters are only known by the application's url_map.
+    """
+    return tuple(
+        (
+            match["variable"],
+            _default_converter(
+                match["converter"] or "default", match["arguments"] or ""
+            ),
+        )
+        for match in RULE_CONVERTER.finditer(rule)
+    )
+
+
+def view_descriptions(view_func: Callable) -> dict[str, str]:
+    """
+    Returns the descriptions of the path parameters documented with a
+    PathSchema default in the signature of a view.
+
+    Args:
+        view_func (Callable): The view function.
+
+    Returns:
+        dict[str, str]: The descriptions by parameter name.
+    """
+    try:
+        parameters = inspect.signature(view_func).parameters.values()
+    except (TypeError, ValueError):
+        return {}
+
+    return {
+        parameter.name: parameter.default.description
+        for parameter in parameters
+        if isinstance(parameter.default, PathSchema)
+    }
+
+
+def path_parameters(
+    converters: tuple[tuple[str, BaseConverter | None], ...],
+    view_func: Callable | None,
+) -> tuple[dict, ...]:
+    """
+    Describes the arguments of a rule as path parameters.
+
+    Args:
+        converters (tuple[tuple[str, BaseConverter | None], ...]): The arguments
+            of the rule and their converters.
+        view_func (Callable | None): The view, whose PathSchema defaults
+            describe the parameters.
+
+    Returns:
+        tuple[dict, ...]: The name, schema and description of each parameter,
+        shared by the endpoints with the same parameters and read-only.
+    """
+    if not converters:
+        return ()
+
+    descriptions = view_descriptions(view_func) if view_func else {}
+    parameters = tuple(
+        {
+            "name": name,
+            "schema": converter_schema(converter),
+            "description": descriptions.get(name),
+        }
+        for name, converter in converters
+    )
+
+    key = tuple(
+        (
+            parameter["name"],
+            json.dumps(parameter["schema"], sort_keys=True),
+            parameter["description"],
+        )
+        for parameter in parameters
+    )
+    return _parameter_tuples.setdefault(key, parameters)
+
+
+def rule_methods(methods) -> tuple[str, ...]:
+    """
+    Returns the documented methods of a rule, in a stable order.
+
+    Args:
+        methods: The methods of the rule.
+
+    Returns:
+        tuple[str, ...]: The methods, without HEAD and OPTIONS.
+    """
+    methods = {method.upper() for method in methods} - IMPLICIT_METHODS
+    ordered = (
+        *(method for method in METHOD_ORDER if method in methods),
+        *sorted(methods.difference(METHOD_ORDER)),
+    )
+
+    return _method_tuples.setdefault(ordered, ordered)
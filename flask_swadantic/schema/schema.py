@@ -1,11 +1,14 @@
+from collections.abc import Callable
+from dataclasses import replace
 from types import FunctionType
 from typing import Type, Self
 
 from flask import Blueprint
 from pydantic import BaseModel
 
-from flask_swadantic.schema import ResponseSchema
+from flask_swadantic.schema import CachePolicy, ResponseSchema
 from flask_swadantic.schema import EndpointMeta, Endpoint
+from flask_swadantic.schema.endpoint import intern_tags
 
 
 class Schema:
@@ -19,7 +22,7 @@ class Schema:
     def __init__(
         self,
         blueprint: Blueprint,
-        tags: list[str] | None = [],
+        tags: list[str] | None = None,
     ):
         """
         Initializes a Schema instance.
@@ -29,10 +32,39 @@ class Schema:
             tags (list[str] | None): Optional list of tags for classifying endpoints.
         """
         self._blueprint = blueprint
-        self._endpoints: list[EndpointMeta] = []
+        self._endpoints: dict[str, EndpointMeta] = {}
+        self._routes: dict[str, Endpoint] = {}
+        self._replayed = 0
+        # Bumped on every registration, including replaced metadata
+        self._version = 0
+        self._prepared: tuple[int, int] | None = None
+        self._endpoint_list: list[EndpointMeta] = []
         self._title = blueprint.name
-        self._tags = tags
-        self._schemas: list[Self] = []
+        self._tags = intern_tags(tags or ())
+        # Dicts keep the registration order and give O(1) lookups
+        self._schemas: dict[Self, None] = {}
+        self._listeners: list[Callable[[Self], None]] = []
+
+    def add_listener(self, listener: Callable[[Self], None]):
+        """
+        Registers a callback notified whenever this schema or one of its
+        child schemas changes.
+
+        Args:
+            listener (Callable[[Self], None]): Called with the schema that changed.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def _notify(self, schema: Self):
+        """
+        Notifies the registered listeners that a schema of this subtree changed.
+
+        Args:
+            schema (Self): The schema that changed.
+        """
+        for listener in self._listeners:
+            listener(schema)
 
     def register_schema(self, schema: Self):
         """
@@ -42,7 +74,9 @@ class Schema:
             schema (Self): The schema instance to register.
         """
         if schema not in self._schemas:
-            self._schemas.append(schema)
+            self._schemas[schema] = None
+            schema.add_listener(self._notify)
+            self._notify(schema)
 
     def register_endpoint(
         self,
@@ -51,11 +85,35 @@ class Schema:
         query: Type[BaseModel] | list[Type[BaseModel]] | None = None,
         body: Type[BaseModel] | list[Type[BaseModel]] | None = None,
         responses: list[ResponseSchema] | None = None,
-        tags: list[str] | None = [],
+        tags: list[str] | None = None,
+        validate_body: bool = False,
+        serialize_response: bool = False,
+        parse_query: bool = False,
+        response_sample_rate: float | None = None,
+        cache: CachePolicy | None = None,
     ):
         """
         Registers an endpoint with metadata and extra information.
 
+        When `validate_body` is set, the view is wrapped to validate the raw
+        request body against `body` and receives the parsed body as its `body`
+        keyword argument. Invalid bodies are answered with a 422 response.
+
+        When `serialize_response` is set, the values returned by the view are
+        serialized to JSON with the body declared for their status code, so
+        views can return models directly.
+
+        When `parse_query` is set, the view is wrapped to parse the query string
+        into the `query` model and receives it as its `query` keyword argument.
+        Repeated keys fill list fields, nested models are read in the deepObject
+        style (`filter[name]=...`), and invalid queries are answered with a 422
+        response.
+
+        When `cache` is set, the responses of GET requests are cached for the
+        policy's TTL, keyed by the endpoint, its path parameters, its query
+        (the validated model with `parse_query`) and the headers of `vary`,
+        and served with an ETag answering 304 to matching `If-None-Match`.
+
         Args:
             summary (str | None): Short summary of the endpoint.
             description (str | None): Detailed description of the endpoint.
@@ -63,24 +121,78 @@ class Schema:
             body (Type[BaseModel] | list[Type[BaseModel]] | None): Request body model(s).
             responses (list[ResponseSchema] | None): List of possible response schemas.
             tags (list[str] | None): Additional tags for the endpoint.
+            validate_body (bool): Validates the request body at runtime.
+            serialize_response (bool): Serializes the returned values with the
+                declared response bodies.
+            parse_query (bool): Parses the query string at runtime.
+            response_sample_rate (float | None): The share of responses, between
+                0 and 1, validated against the declared bodies. Defaults to the
+                rate of the Swadantic instance.
+            cache (CachePolicy | None): Caches the responses of the endpoint.
 
         Returns:
             FunctionType: A decorator that wraps the endpoint function.
+
+        Raises:
+            ValueError: If response_sample_rate is not between 0 and 1.
         """
 
+        if response_sample_rate is not None and not 0 <= response_sample_rate <= 1:
+            raise ValueError(
+                f"Invalid response_sample_rate {response_sample_rate!r}. "
+                "Expected a rate between 0 and 1."
+            )
+
         def inner(func: FunctionType):
-            self._endpoints.append(
-                EndpointMeta(
-                    summary=summary or func.__name__,
-                    function_name=func.__name__,
-                    description=description,
-                    query=query,
-                    path=[],
-                    body=body,
-                    responses=responses,
-                    tags=[*self._tags, *tags],
-                )
+            self._endpoints[func.__name__] = EndpointMeta(
+                summary=summary or func.__name__,
+                function_name=func.__name__,
+                description=description,
+                query=query,
+                body=body,
+                responses=responses,
+                tags=intern_tags((*self._tags, *(tags or ()))),
+                response_sample_rate=response_sample_rate,
+                cache=cache,
             )
+            self._version += 1
+            self._notify(self)
+
+            if not (validate_body or serialize_response or parse_query or cache):
+                return func
+
+            # The runtime is only imported by endpoints that use it
+            from flask_swadantic.runtime import (
+                BodyValidator,
+                QueryParser,
+                ResponseCache,
+                ResponseSerializer,
+                wrap_view,
+            )
+
+            body_validator = None
+            if validate_body and body is not None:
+                body_validator = BodyValidator(body)
+
+            response_serializer = None
+            if serialize_response and responses:
+                response_serializer = ResponseSerializer(responses)
+
+            query_parser = None
+            if parse_query and query is not None:
+                query_parser = QueryParser(query)
+
+            response_cache = ResponseCache(cache) if cache is not None else None
+
+            if body_validator or response_serializer or query_parser or response_cache:
+                return wrap_view(
+                    func,
+                    body_validator=body_validator,
+                    response_serializer=response_serializer,
+                    query_parser=query_parser,
+                    response_cache=response_cache,
+                    summary=summary,
+                )
 
             return func
 
@@ -96,10 +208,7 @@ class Schema:
         Returns:
             EndpointMeta | None: The metadata instance if found, otherwise None.
         """
-        return next(
-            (meta for meta in self._endpoints if meta.function_name == function_name),
-            None,
-        )
+        return self._endpoints.get(function_name)
 
     def _prepare_endpoints(self):
         """
@@ -109,24 +218,69 @@ class Schema:
         Flask blueprint, capturing endpoint information, and synchronizing
         them with the registered endpoint metadata.
 
+        Deferred functions are only replayed once, and the endpoints are only
+        synchronized again when the blueprint or the registered endpoints change.
+
         Returns:
             list[EndpointMeta]: Updated list of endpoint metadata.
         """
-        for func in self._blueprint.deferred_functions:
+        deferred_functions = self._blueprint.deferred_functions
+        prepared = (len(deferred_functions), self._version)
+
+        if self._prepared == prepared:
+            return self._endpoint_list
+
+        for func in deferred_functions[self._replayed :]:
             # Captures Flask endpoint information
             endpoint = Endpoint()
-            func(endpoint)
+            try:
+                func(endpoint)
+            except AttributeError as e:
+                # Not a route, e.g. a function recorded with `record_once`
+                # reading `state.app`, which the recorder does not provide
+                if e.obj is not endpoint:
+                    raise
+                continue
 
+            if endpoint.function_name:
+                self._routes[endpoint.function_name] = endpoint
+
+        self._replayed = len(deferred_functions)
+
+        endpoint_list = []
+        for function_name, endpoint_meta in self._endpoints.items():
             # Matches function names between endpoint and schema
-            endpoint_meta = self._find_meta(endpoint.function_name)
+            endpoint = self._routes.get(function_name)
+
+            if endpoint is None:
+                endpoint_list.append(endpoint_meta)
+                continue
+
+            # One endpoint metadata per method of the route
+            endpoint_list.extend(
+                replace(
+                    endpoint_meta,
+                    rule=endpoint.rule,
+                    method=method,
+                    path=endpoint.path,
+                )
+                for method in endpoint.methods
+            )
 
-            if endpoint_meta:
-                # Update the endpoint metadata
-                endpoint_meta.rule = endpoint.rule
-                endpoint_meta.method = endpoint.method
-                endpoint_meta.path = endpoint.path
+        self._prepared = prepared
+        self._endpoint_list = endpoint_list
 
-        return self._endpoints
+        return self._endpoint_list
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name of the associated Flask blueprint.
+
+        Returns:
+            str: The blueprint name.
+        """
+        return self._blueprint.name
 
     @property
     def url_prefix(self):
@@ -138,6 +292,17 @@ class Schema:
         """
         return self._blueprint.url_prefix
 
+    @property
+    def registered_endpoints(self) -> list[EndpointMeta]:
+        """
+        Returns the endpoint metadata as registered, without looking up the
+        routes of the blueprint: their rule, method and path are not set.
+
+        Returns:
+            list[EndpointMeta]: List of the registered endpoint metadata objects.
+        """
+        return list(self._endpoints.values())
+
     @property
     def endpoints(self):
         """
@@ -154,7 +319,7 @@ class Schema:
         Returns the tags associated with the schema.
 
         Returns:
-            list[str]: List of tags.
+            tuple[str, ...]: The tags.
         """
         return self._tags
 
@@ -166,4 +331,4 @@ class Schema:
         Returns:
             list[Self]: List of registered schema instances.
         """
-        return self._schemas
+        return list(self._schemas)
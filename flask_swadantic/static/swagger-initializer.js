@@ -1,9 +1,13 @@
 window.onload = function () {
     //<editor-fold desc="Changeable Configuration Block">
 
+    // the URLs are rendered into the page, so they follow the mount point of the app
+    var urls = document.getElementById("swagger-ui").dataset;
+
     // the following lines will be replaced by docker/configurator, when it runs in a docker-container
     window.ui = SwaggerUIBundle({
-        url: "http://localhost:8000/apispec",
+        url: urls.specUrl,
+        configUrl: urls.configUrl,
         dom_id: '#swagger-ui',
         deepLinking: true,
         presets: [
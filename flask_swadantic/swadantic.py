@@ -1,21 +1,192 @@
-from functools import cached_property
+import functools
+import gc
+import logging
+import os
+import random
+import secrets
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
 
-from flask import Flask, Blueprint
+from flask import Flask, Blueprint, Response, current_app, request, url_for
 
-from flask_swadantic.openapi import OpenAPIGenerator
-from flask_swadantic.schema import Schema
+from flask_swadantic.metrics import metrics
+from flask_swadantic.openapi.cache import SpecCache
+from flask_swadantic.schema import EndpointMeta, Schema
 from flask_swadantic.schema import InfoSchema
-from flask_swadantic.app.api_spec_view import APISpecsView
-from flask_swadantic.swagger_bp import swagger_bp
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from flask_swadantic.openapi.artifact import SpecArtifact
+    from flask_swadantic.openapi.encoding import EncodedSpec, StreamedSpec
+    from flask_swadantic.runtime import ResponseMismatch, ResponseValidator
+
+
+STATIC_SENDFILE_MODES = ("x-sendfile", "x-accel-redirect")
+
+SWAGGER_UI_MODES = ("static", "inline", "light")
+
+logger = logging.getLogger(__name__)
+
+
+def _single_flight(method):
+    """
+    Runs a method under the build lock of the extension, so concurrent callers
+    wait for the build in flight and reuse its result instead of building again.
+
+    The methods on the request path check their cached result before calling
+    a method wrapped by it, so a built specification is served without the lock.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._build_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# Extensions whose threading state is reset in forked children
+_instances: "weakref.WeakSet[Swadantic]" = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for instance in list(_instances):
+        instance._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 class Swadantic:
-    def __init__(self, info_schema: InfoSchema, app: Flask | None = None):
+    def __init__(
+        self,
+        info_schema: InfoSchema,
+        app: Flask | None = None,
+        static_sendfile: str | None = None,
+        static_accel_prefix: str = "/_swadantic/static/",
+        workers: int | None = None,
+        executor: str = "thread",
+        spec_artifact: str | None = None,
+        stream_spec: bool = False,
+        deduplicate_schemas: bool = False,
+        background_warmup: bool = False,
+        collect_metrics: bool = False,
+        response_sample_rate: float = 0.0,
+        on_response_mismatch: Callable[["ResponseMismatch"], None] | None = None,
+        swagger_ui: str = "static",
+    ):
+        """
+        Initializes a Swadantic instance.
+
+        Args:
+            info_schema (InfoSchema): The info object of the specification.
+            app (Flask | None): The Flask application instance.
+            static_sendfile (str | None): Lets the front server send the Swagger UI
+                assets, either "x-sendfile" or "x-accel-redirect" (nginx).
+            static_accel_prefix (str): The internal nginx location mapped to the
+                Swagger UI static folder, for "x-accel-redirect".
+            workers (int | None): Generates the changed schemas of the specification
+                in parallel with this many workers.
+            executor (str): The pool used by the workers, "thread" or "process".
+            spec_artifact (str | None): Serves the prebuilt specification written
+                by `flask swadantic build` at this path instead of generating it.
+                If it does not exist, a warning is logged and the specification
+                is generated at runtime.
+            stream_spec (bool): Encodes the specification while it is sent, in
+                bounded chunks, instead of keeping it encoded in memory.
+            deduplicate_schemas (bool): Moves the inline schemas repeated across
+                operations, such as arrays of models, into shared components.
+            background_warmup (bool): Builds the specification and the models on
+                a background thread, and again whenever a schema changes, so
+                the first request to /apispec does not pay for it. The thread
+                starts with `start_warmup`, once the application has
+                registered its blueprints.
+            collect_metrics (bool): Records the timings of request validation,
+                response serialization and spec generation, sends them through
+                the signals of `flask_swadantic.metrics` and serves them in the
+                Prometheus text format at /apispec/metrics. The timings are
+                recorded process-wide.
+            response_sample_rate (float): The share of responses, between 0 and
+                1, validated against the bodies declared for their status code,
+                e.g. 1.0 in tests and 0.005 in production. Endpoints can
+                override it with their own `response_sample_rate`.
+            on_response_mismatch (Callable[[ResponseMismatch], None] | None):
+                Called with the sampled responses that do not match their
+                declared body. They are logged as warnings by default.
+            swagger_ui (str): How /swagger is served: "static" fetches
+                /apispec once loaded, "inline" embeds the specification in a
+                page rendered once per version of the specification, and
+                "light" does the same with swagger-ui-bundle.js only.
+
+        Raises:
+            ValueError: If static_sendfile or swagger_ui is not a supported
+                mode, or response_sample_rate is not between 0 and 1.
+        """
         super().__init__()
 
+        if static_sendfile not in (None, *STATIC_SENDFILE_MODES):
+            raise ValueError(
+                f"Invalid static_sendfile mode {static_sendfile!r}. "
+                f"Expected one of {', '.join(STATIC_SENDFILE_MODES)}."
+            )
+        if swagger_ui not in SWAGGER_UI_MODES:
+            raise ValueError(
+                f"Invalid swagger_ui mode {swagger_ui!r}. "
+                f"Expected one of {', '.join(SWAGGER_UI_MODES)}."
+            )
+        if not 0 <= response_sample_rate <= 1:
+            raise ValueError(
+                f"Invalid response_sample_rate {response_sample_rate!r}. "
+                "Expected a rate between 0 and 1."
+            )
+
         self._open_api_version = "3.1.1"
         self._info_schema = info_schema
-        self._schemas: list[Schema] = []
+        # Dicts keep the registration order and give O(1) lookups
+        self._schemas: dict[Schema, None] = {}
+        self._spec_cache = SpecCache(workers, executor)
+        self._spec: dict | None = None
+        self._spec_revision: int | None = None
+        self._encoded_spec: EncodedSpec | None = None
+        self._encoded_revision: int | None = None
+        self._encoded_slices: dict[tuple, EncodedSpec | None] = {}
+        # The alternative formats, encoded from the JSON with this ETag
+        self._encoded_formats: dict[str, EncodedSpec] = {}
+        self._encoded_formats_etag: str | None = None
+        self.swagger_ui = swagger_ui
+        # The Swagger UI page, rendered from the JSON with this ETag
+        self._swagger_page: EncodedSpec | None = None
+        self._swagger_page_etag: str | None = None
+        self._encoded_slices_version: int | None = None
+        self.static_sendfile = static_sendfile
+        self.static_accel_prefix = static_accel_prefix
+        self._spec_artifact_path = spec_artifact
+        self._spec_artifact: SpecArtifact | None = None
+        self._stream_spec = stream_spec
+        self._deduplicate_schemas = deduplicate_schemas
+        self._build_lock = threading.RLock()
+        self._ready_version: int | None = None
+        # Format -> (version of the schemas, specification served by /apispec)
+        self._loaded_specs: dict[str, tuple[int, EncodedSpec | StreamedSpec]] = {}
+        self._background_warmup = background_warmup
+        self._warmup_requested = threading.Event()
+        self._warmup_thread: threading.Thread | None = None
+
+        # Tells the streamed specifications of different processes apart
+        self._stream_token = secrets.token_hex(8)
+        self._collect_metrics = collect_metrics
+        self._response_sample_rate = response_sample_rate
+        self._on_response_mismatch = on_response_mismatch
+        # Flask endpoint -> (rate, validator), resolved on its first response
+        self._response_samplers: dict[str, tuple[float, ResponseValidator] | None] = {}
+        _instances.add(self)
+
+        if collect_metrics:
+            metrics.enabled = True
 
         if app is not None:
             self.init_app(app)
@@ -35,6 +206,30 @@ class Swadantic:
                 f"Invalid Flask app instance. Expected Flask, but received {type(app).__name__}."
             )
 
+        # The views, the Swagger UI and the CLI are only imported with an app
+        from flask_swadantic.app.api_spec_view import APISpecsView, metrics_view
+        from flask_swadantic.cli import swadantic_cli
+        from flask_swadantic.swagger_bp import swagger_bp
+
+        app.extensions["swadantic"] = self
+        app.cli.add_command(swadantic_cli)
+        with self._build_lock:
+            self._spec_cache.discover_routes(app)
+
+        if self._spec_artifact_path and self._spec_artifact is None:
+            from flask_swadantic.openapi.artifact import SpecArtifact
+
+            try:
+                self._spec_artifact = SpecArtifact(self._spec_artifact_path)
+            except FileNotFoundError:
+                # e.g. when running `flask swadantic build` to create it
+                logger.warning(
+                    "flask-swadantic: the prebuilt specification %s does not "
+                    "exist, the specification is generated at runtime instead. "
+                    "Build it with 'flask swadantic build'.",
+                    self._spec_artifact_path,
+                )
+
         # Register Swagger Blueprint
         app.register_blueprint(swagger_bp, url_prefix="/swagger")
 
@@ -43,25 +238,615 @@ class Swadantic:
         spec_bp.add_url_rule(
             "",
             "apispec",
-            view_func=APISpecsView.as_view("apispec", loader=lambda: self.get_spec),
+            view_func=APISpecsView.as_view(
+                "apispec", loader=self._load_spec, negotiate_format=True
+            ),
+        )
+        spec_bp.add_url_rule(
+            "/index",
+            "apispec_index",
+            view_func=APISpecsView.as_view(
+                "apispec_index", loader=lambda: self._encode_slice(("index",))
+            ),
+        )
+        spec_bp.add_url_rule(
+            "/tag/<tag>",
+            "apispec_tag",
+            view_func=APISpecsView.as_view(
+                "apispec_tag",
+                loader=lambda tag: self._encode_slice(("tag", tag)),
+            ),
+        )
+        spec_bp.add_url_rule(
+            "/blueprint/<name>",
+            "apispec_blueprint",
+            view_func=APISpecsView.as_view(
+                "apispec_blueprint",
+                loader=lambda name: self._encode_slice(("blueprint", name)),
+            ),
         )
+        if self._collect_metrics:
+            spec_bp.add_url_rule("/metrics", "apispec_metrics", view_func=metrics_view)
         app.register_blueprint(spec_bp, url_prefix="/apispec")
+        app.after_request(self._sample_response)
 
     def register_schema(self, schema: Schema):
+        """
+        Registers a top-level schema. Changes to the schema or to any of its
+        child schemas are picked up by the next access to the specification.
+
+        Args:
+            schema (Schema): The schema instance to register.
+        """
         if schema not in self._schemas:
-            self._schemas.append(schema)
+            self._schemas[schema] = None
+            schema.add_listener(self._on_schema_change)
+            self._on_schema_change(schema)
 
-    @cached_property
+    def _on_schema_change(self, schema: Schema):
+        """
+        Marks a changed schema to be generated again.
+
+        Args:
+            schema (Schema): The schema that changed.
+        """
+        # Waits for a build in flight, which would otherwise cache a stale result
+        with self._build_lock:
+            self._spec_cache.invalidate(schema)
+        self._response_samplers.clear()
+        self._request_warmup()
+
+    def invalidate_spec(self):
+        """
+        Discards the cached specification, so that every schema is generated
+        again on the next access.
+        """
+        with self._build_lock:
+            self._spec_cache.invalidate()
+        self._response_samplers.clear()
+        self._request_warmup()
+
+    @property
+    def ready(self) -> bool:
+        """
+        Tells whether the specification is built for the current schemas, so
+        that /apispec answers without generating it. Meant for readiness probes,
+        together with `background_warmup` or `warmup`.
+
+        Returns:
+            bool: True if the specification is built and up to date.
+        """
+        if self._spec_artifact is not None:
+            return True
+
+        return (
+            self._ready_version == self._spec_cache.version
+            and not self._spec_cache.routes_changed
+        )
+
+    @property
+    def spec_revision(self) -> int:
+        """
+        Returns the revision of the specification, which changes every time
+        the specification is generated again.
+
+        Returns:
+            int: The revision of the specification.
+        """
+        if self._spec_artifact is None:
+            self.generate_spec()
+
+        return self._spec_revision
+
+    @property
     def get_spec(self) -> dict:
+        """
+        Returns the OpenAPI Specification for the application, either loaded
+        from the prebuilt artifact or generated.
+
+        Returns:
+            dict: OpenAPI Specification in JSON format.
+        """
+        if self._spec_artifact is not None:
+            return self._spec_artifact.spec
+
+        return self.generate_spec()
+
+    @_single_flight
+    def generate_spec(self) -> dict:
         """
         Generates and returns the OpenAPI Specification for the application.
 
+        Only the schemas registered or changed since the previous access are
+        generated again; the specification is otherwise returned from cache.
+
         Returns:
             dict: OpenAPI Specification in JSON format.
         """
+        generated = self._spec_cache.build(list(self._schemas))
+
+        if self._spec_revision != self._spec_cache.revision:
+            self._spec = {
+                "openapi": self._open_api_version,
+                "info": self._info_schema,
+                **self._postprocess(generated),
+            }
+            self._spec_revision = self._spec_cache.revision
+
+        return self._spec
+
+    @_single_flight
+    def get_spec_slice(
+        self, blueprint: str | None = None, tag: str | None = None
+    ) -> dict | None:
+        """
+        Generates and returns the part of the OpenAPI Specification for the
+        schemas of a blueprint, or for the operations with a tag, with the
+        components they reference. Only the schemas of the slice are generated.
+
+        Args:
+            blueprint (str | None): The name of the blueprint.
+            tag (str | None): The tag.
+
+        Returns:
+            dict | None: OpenAPI Specification in JSON format, or None if
+            nothing matches.
+        """
+        generated = self._spec_cache.build_slice(
+            list(self._schemas), blueprint=blueprint, tag=tag
+        )
+        if generated is None:
+            return None
 
         return {
             "openapi": self._open_api_version,
             "info": self._info_schema,
-            **OpenAPIGenerator().generate(self._schemas),
+            **self._postprocess(generated),
         }
+
+    def _postprocess(self, generated: dict[str, dict]) -> dict[str, dict]:
+        """
+        Applies the optional passes to the generated paths and components.
+
+        Args:
+            generated (dict[str, dict]): The OpenAPI paths and components.
+
+        Returns:
+            dict[str, dict]: The OpenAPI paths and components to serve.
+        """
+        if self._deduplicate_schemas:
+            from flask_swadantic.openapi.dedup import deduplicate_schemas
+
+            with metrics.timed("spec_phase", "deduplicate"):
+                generated = deduplicate_schemas(generated)
+
+        return generated
+
+    def get_spec_index(self) -> dict:
+        """
+        Lists the specification and its slices, in the format of the `urls`
+        option of Swagger UI so it can offer them in its picker.
+
+        Must be called within a request or application context.
+
+        Returns:
+            dict: The Swagger UI configuration listing the specifications.
+        """
+        urls = [{"name": "All", "url": url_for("spec_bp.apispec")}]
+        tags = {}
+        blueprints = {}
+
+        for schema in self._iter_schemas(list(self._schemas)):
+            blueprints.setdefault(schema.name, None)
+            for endpoint in schema.registered_endpoints:
+                tags.update(dict.fromkeys(endpoint.tags or ()))
+
+        for tag in tags:
+            urls.append(
+                {"name": f"Tag: {tag}", "url": url_for("spec_bp.apispec_tag", tag=tag)}
+            )
+        for name in blueprints:
+            urls.append(
+                {
+                    "name": f"Blueprint: {name}",
+                    "url": url_for("spec_bp.apispec_blueprint", name=name),
+                }
+            )
+
+        return {"urls": urls, "urls.primaryName": "All"}
+
+    @_single_flight
+    def _encode_slice(self, key: tuple) -> "EncodedSpec | None":
+        """
+        Returns the index or a slice of the specification encoded, encoded once
+        until a schema changes.
+
+        Args:
+            key (tuple): ("index",), ("tag", tag) or ("blueprint", name).
+
+        Returns:
+            EncodedSpec | None: The encoded document, or None if nothing matches.
+        """
+        from flask_swadantic.openapi.encoding import encode_spec
+
+        if self._encoded_slices_version != self._spec_cache.version:
+            self._encoded_slices = {}
+            self._encoded_slices_version = self._spec_cache.version
+
+        if key not in self._encoded_slices:
+            if key[0] == "index":
+                document = self.get_spec_index()
+            else:
+                document = self.get_spec_slice(**{key[0]: key[1]})
+
+            self._encoded_slices[key] = encode_spec(document) if document else None
+
+        return self._encoded_slices[key]
+
+    @property
+    @_single_flight
+    def encoded_spec(self) -> "EncodedSpec":
+        """
+        Returns the OpenAPI Specification encoded into JSON bytes and its
+        compressed variants, encoded once per revision of the specification.
+
+        Returns:
+            EncodedSpec: The encoded OpenAPI Specification.
+        """
+        if self._spec_artifact is not None:
+            return self._spec_artifact.encoded
+
+        spec = self.get_spec
+
+        if self._encoded_revision != self._spec_revision:
+            from flask_swadantic.openapi.encoding import encode_spec
+
+            with metrics.timed("spec_phase", "encode"):
+                self._encoded_spec = encode_spec(spec)
+            self._encoded_revision = self._spec_revision
+
+        return self._encoded_spec
+
+    @property
+    def streamed_spec(self) -> "StreamedSpec":
+        """
+        Returns the OpenAPI Specification ready to be encoded while it is sent.
+
+        Returns:
+            StreamedSpec: The OpenAPI Specification to stream.
+        """
+        from flask_swadantic.openapi.encoding import StreamedSpec
+
+        spec = self.get_spec
+
+        return StreamedSpec(spec, etag=f"{self._stream_token}-{self._spec_revision}")
+
+    @_single_flight
+    def _encode_format(self, spec_format: str) -> "EncodedSpec":
+        """
+        Returns the OpenAPI Specification encoded into an alternative format,
+        encoded once per version of the JSON specification.
+
+        Args:
+            spec_format (str): "min", "yaml" or "msgpack".
+
+        Returns:
+            EncodedSpec: The encoded OpenAPI Specification.
+        """
+        from flask_swadantic.openapi.encoding import encode_spec_format
+
+        encoded = self.encoded_spec
+
+        if self._encoded_formats_etag != encoded.etag:
+            self._encoded_formats = {}
+            self._encoded_formats_etag = encoded.etag
+
+        if spec_format not in self._encoded_formats:
+            with metrics.timed("spec_phase", f"encode_{spec_format}"):
+                self._encoded_formats[spec_format] = encode_spec_format(
+                    encoded.identity, spec_format
+                )
+
+        return self._encoded_formats[spec_format]
+
+    @property
+    @_single_flight
+    def rendered_swagger_ui(self) -> "EncodedSpec":
+        """
+        Returns the Swagger UI page with the specification inlined, rendered
+        and compressed once per version of the specification.
+
+        Returns:
+            EncodedSpec: The rendered page.
+        """
+        from flask_swadantic.openapi.encoding import encode_document
+        from flask_swadantic.swagger_bp import render_inline_page
+
+        encoded = self.encoded_spec
+
+        if self._swagger_page_etag != encoded.etag:
+            page = render_inline_page(
+                encoded.identity, light=self.swagger_ui == "light"
+            )
+            self._swagger_page = encode_document(page.encode(), "text/html")
+            self._swagger_page_etag = encoded.etag
+
+        return self._swagger_page
+
+    def _load_spec(self, spec_format: str = "json") -> "EncodedSpec | StreamedSpec":
+        """
+        Returns the OpenAPI Specification the way it is served by /apispec,
+        without taking the build lock once it is built.
+
+        Args:
+            spec_format (str): The format of the specification, a key of
+                `SPEC_FORMATS`. Only JSON is streamed.
+
+        Returns:
+            EncodedSpec | StreamedSpec: The OpenAPI Specification to send.
+        """
+        # The pair is replaced at once, so it is never read half updated
+        version, loaded = self._loaded_specs.get(spec_format, (None, None))
+        if version == self._spec_cache.version and not self._spec_cache.routes_changed:
+            return loaded
+
+        return self._build_spec(spec_format)
+
+    @_single_flight
+    def _build_spec(self, spec_format: str) -> "EncodedSpec | StreamedSpec":
+        """
+        Builds the OpenAPI Specification served by /apispec, unless a
+        concurrent caller built it while this one waited for the lock.
+
+        Args:
+            spec_format (str): The format of the specification.
+
+        Returns:
+            EncodedSpec | StreamedSpec: The OpenAPI Specification to send.
+        """
+        version, loaded = self._loaded_specs.get(spec_format, (None, None))
+        if version == self._spec_cache.version and not self._spec_cache.routes_changed:
+            return loaded
+
+        if spec_format != "json":
+            loaded = self._encode_format(spec_format)
+        elif self._stream_spec and self._spec_artifact is None:
+            loaded = self.streamed_spec
+        else:
+            loaded = self.encoded_spec
+
+        self._loaded_specs[spec_format] = (self._spec_cache.version, loaded)
+        self._ready_version = self._spec_cache.version
+        return loaded
+
+    def _iter_schemas(self, schemas: list[Schema]) -> Iterator[Schema]:
+        """
+        Yields the given schemas and their child schemas, parents first.
+
+        Args:
+            schemas (list[Schema]): The schemas to walk.
+
+        Returns:
+            Iterator[Schema]: The schemas.
+        """
+        for schema in schemas:
+            yield schema
+            yield from self._iter_schemas(schema.schemas)
+
+    def _find_endpoint(
+        self, blueprint: str | None, function_name: str
+    ) -> EndpointMeta | None:
+        """
+        Finds the metadata of a documented view from its blueprint in the app.
+
+        Args:
+            blueprint (str | None): The dotted name of the blueprint of the view.
+            function_name (str): The name of the view function.
+
+        Returns:
+            EndpointMeta | None: The metadata, or None if the view is not
+            documented.
+        """
+        if not blueprint:
+            return None
+
+        schemas = list(self._schemas)
+        for name in blueprint.split("."):
+            schema = next((s for s in schemas if s.name == name), None)
+            if schema is None:
+                return None
+            schemas = schema.schemas
+
+        return next(
+            (
+                endpoint
+                for endpoint in schema.registered_endpoints
+                if endpoint.function_name == function_name
+            ),
+            None,
+        )
+
+    def _find_sampler(self, endpoint: str) -> tuple[float, "ResponseValidator"] | None:
+        """
+        Resolves the response sampling of a Flask endpoint.
+
+        Args:
+            endpoint (str): The Flask endpoint of the request.
+
+        Returns:
+            tuple[float, ResponseValidator] | None: The sampling rate and the
+            validator, or None if the responses of the endpoint are not sampled.
+        """
+        from flask_swadantic.runtime import ResponseValidator
+
+        view_func = current_app.view_functions.get(endpoint)
+        if view_func is None:
+            return None
+
+        meta = self._find_endpoint(request.blueprint, view_func.__name__)
+        if meta is None or not meta.responses:
+            return None
+
+        rate = meta.response_sample_rate
+        if rate is None:
+            rate = self._response_sample_rate
+        if not rate:
+            return None
+
+        return rate, ResponseValidator(meta.responses)
+
+    def _sample_response(self, response: Response) -> Response:
+        """
+        Validates a sample of the responses against their declared body, and
+        reports the mismatches. Never raises, as it runs on the request path.
+
+        Args:
+            response (Response): The response sent by the view.
+
+        Returns:
+            Response: The response, unchanged.
+        """
+        endpoint = request.endpoint
+        if endpoint is None:
+            return response
+
+        try:
+            sampler = self._response_samplers.get(endpoint, False)
+            if sampler is False:
+                sampler = self._response_samplers[endpoint] = self._find_sampler(
+                    endpoint
+                )
+
+            if sampler is None or random.random() >= sampler[0]:
+                return response
+
+            errors = sampler[1].validate(response)
+            if errors:
+                from flask_swadantic.runtime import ResponseMismatch
+
+                mismatch = ResponseMismatch(
+                    endpoint, request.method, response.status_code, errors
+                )
+                if self._on_response_mismatch is None:
+                    logger.warning(
+                        "The %s response of %s %s does not match its declared body: %s",
+                        mismatch.status_code,
+                        mismatch.method,
+                        mismatch.endpoint,
+                        mismatch.errors,
+                    )
+                else:
+                    self._on_response_mismatch(mismatch)
+        except Exception:
+            logger.exception("The response of %s could not be validated", endpoint)
+
+        return response
+
+    def _iter_endpoints(self, schemas: list[Schema]) -> Iterator[EndpointMeta]:
+        """
+        Yields the endpoints of the given schemas and of their child schemas.
+
+        Args:
+            schemas (list[Schema]): The schemas to walk.
+
+        Returns:
+            Iterator[EndpointMeta]: The endpoint metadata objects.
+        """
+        for schema in schemas:
+            yield from schema.registered_endpoints
+            yield from self._iter_endpoints(schema.schemas)
+
+    def _iter_models(self) -> Iterator[type["BaseModel"]]:
+        """
+        Yields every model used by the registered endpoints, once.
+
+        Returns:
+            Iterator[type[BaseModel]]: The models of the bodies, queries and responses.
+        """
+        from flask_swadantic.runtime import iter_models
+
+        seen = set()
+
+        for endpoint in self._iter_endpoints(list(self._schemas)):
+            bodies = [
+                endpoint.query,
+                endpoint.body,
+                *(response.body for response in endpoint.responses or []),
+            ]
+
+            for model in iter_models(bodies):
+                if model not in seen:
+                    seen.add(model)
+                    yield model
+
+    def warmup(self, freeze: bool = True):
+        """
+        Builds everything the specification and the endpoints need ahead of the
+        first request: the specification, its encoded bytes and the validators
+        and serializers of every model, including models with `defer_build`.
+
+        Called in the master process before workers are forked (see
+        `flask_swadantic.gunicorn`), the built objects are shared by every worker.
+        With `freeze`, they are then moved to the permanent generation with
+        `gc.freeze()`, so the garbage collector does not touch, and thus copy,
+        their memory pages in the workers.
+
+        Args:
+            freeze (bool): Calls `gc.freeze()` once everything is built.
+        """
+        for model in self._iter_models():
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+
+        self._load_spec()
+
+        if freeze:
+            gc.collect()
+            gc.freeze()
+
+    def start_warmup(self):
+        """
+        Starts the background thread building the specification, and asks for
+        a first build. Call it once the application is set up, e.g. at the end
+        of the app factory: the routes registered later are picked up by a
+        build of their own.
+        """
+        if self._warmup_thread is None or not self._warmup_thread.is_alive():
+            self._warmup_thread = threading.Thread(
+                target=self._run_warmup, name="swadantic-warmup", daemon=True
+            )
+            self._warmup_thread.start()
+
+        self._request_warmup()
+
+    def _request_warmup(self):
+        """
+        Asks the background thread, if any, to build the specification again.
+        """
+        if self._warmup_thread is not None:
+            self._warmup_requested.set()
+
+    def _run_warmup(self):
+        """
+        Builds the specification every time a build is requested.
+        """
+        while True:
+            self._warmup_requested.wait()
+            self._warmup_requested.clear()
+
+            try:
+                self.warmup(freeze=False)
+            except Exception:
+                logger.exception("flask-swadantic: background warmup failed")
+
+    def _after_fork(self):
+        """
+        Resets the threading state in a forked child, where the lock may have
+        been held by a thread of the parent, and the warmup thread is gone.
+        """
+        self._build_lock = threading.RLock()
+        self._warmup_requested = threading.Event()
+
+        if self._warmup_thread is not None:
+            self._warmup_thread = None
+            self.start_warmup()
@@ -1,17 +1,135 @@
 import os
+from functools import cache
 
-from flask import Blueprint, send_file, send_from_directory
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    request,
+    send_file,
+    url_for,
+)
+from jinja2 import Environment, Template
+from markupsafe import Markup
 
-swagger_bp = Blueprint("swagger_bp", __name__, static_folder="static")
+from flask_swadantic.assets import get_manifest
+
+swagger_bp = Blueprint("swagger_bp", __name__)
+
+# Content-hashed assets never change, so browsers may keep them for a year
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def _asset_url(filename: str) -> str:
+    return url_for(
+        "swagger_bp.get_swagger_static",
+        filename=get_manifest().hashed_name(filename),
+    )
+
+
+# The pages only use the variables they are rendered with, so their templates
+# are compiled once per process instead of in the environment of each app
+_jinja_env = Environment(autoescape=True)
+
+
+@cache
+def _template(name: str) -> Template:
+    filepath = os.path.join(swagger_bp.root_path, "templates", name)
+    with open(filepath, encoding="utf-8") as file:
+        return _jinja_env.from_string(file.read())
+
+
+def render_inline_page(spec_json: bytes, light: bool = False) -> str:
+    """
+    Renders the Swagger UI page with the specification inlined, so the UI
+    renders without fetching /apispec.
+
+    Args:
+        spec_json (bytes): The specification encoded into JSON.
+        light (bool): Only loads swagger-ui-bundle.js, without the standalone
+            preset and its top bar.
+
+    Returns:
+        str: The HTML page.
+    """
+    # "<" only appears in JSON strings, where its escape cannot close the
+    # script element
+    spec_text = bytes(spec_json).decode().replace("<", "\\u003c")
+
+    return _template("inline.html").render(
+        asset_url=_asset_url, spec_json=Markup(spec_text), light=light
+    )
 
 
 @swagger_bp.get("")
 def get_swagger():
-    filepath = os.path.join(swagger_bp.root_path, "templates", "index.html")
-    return send_file(filepath)
+    swadantic = current_app.extensions.get("swadantic")
+    if swadantic is not None and swadantic.swagger_ui != "static":
+        from flask_swadantic.app.api_spec_view import send_encoded
+
+        return send_encoded(swadantic.rendered_swagger_ui).make_conditional(request)
+
+    page = _template("index.html").render(
+        asset_url=_asset_url,
+        spec_url=url_for("spec_bp.apispec"),
+        config_url=url_for("spec_bp.apispec_index"),
+    )
+    response = Response(page, mimetype="text/html")
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @swagger_bp.get("/static/<path:filename>")
 def get_swagger_static(filename):
-    static_folder = os.path.join(swagger_bp.root_path, "static")
-    return send_from_directory(static_folder, filename)
+    manifest = get_manifest()
+    resolved = manifest.resolve(filename)
+    if resolved is None:
+        abort(404)
+
+    filename, immutable = resolved
+    swadantic = current_app.extensions.get("swadantic")
+    sendfile = swadantic.static_sendfile if swadantic else None
+
+    # The front server only sends files, so only the precompressed siblings
+    # can be handed off to it
+    served, encoding = manifest.negotiate(
+        filename, request.accept_encodings, in_memory=sendfile is None
+    )
+    path = os.path.join(manifest.folder, served)
+
+    if encoding and served == filename:
+        content, etag = manifest.compress(filename, encoding)
+        response = Response(content, mimetype=manifest.mimetype(filename))
+        response.set_etag(etag)
+        response.make_conditional(request)
+    elif sendfile == "x-accel-redirect":
+        response = Response(mimetype=manifest.mimetype(filename))
+        response.headers["X-Accel-Redirect"] = (
+            f"{swadantic.static_accel_prefix.rstrip('/')}/{served}"
+        )
+    elif sendfile == "x-sendfile":
+        response = Response(mimetype=manifest.mimetype(filename))
+        response.headers["X-Sendfile"] = path
+    else:
+        response = send_file(
+            path,
+            mimetype=manifest.mimetype(filename),
+            download_name=filename,
+            conditional=True,
+        )
+
+    if encoding:
+        response.content_encoding = encoding
+    response.vary.add("Accept-Encoding")
+
+    if immutable:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+
+    return response
@@ -0,0 +1,124 @@
+from collections import Counter
+
+import pytest
+from flask import Blueprint, Flask
+from pydantic import BaseModel
+
+from flask_swadantic import CachePolicy, InfoSchema, ResponseSchema, Schema
+from flask_swadantic.metrics import metrics
+from flask_swadantic.schema import clear_model_schema_cache
+
+
+class User(BaseModel):
+    name: str
+    email: str
+
+
+class UserFilter(BaseModel):
+    name: str | None = None
+    active: bool | None = None
+
+
+class UserQuery(BaseModel):
+    limit: int = 10
+    tags: list[str] = []
+    filter: UserFilter | None = None
+
+
+def build_app(**options) -> tuple[Flask, object, Counter]:
+    """
+    Builds a small application documenting users and orders, with the runtime
+    behaviours enabled on its endpoints.
+
+    Args:
+        **options: The options of the Swadantic instance.
+
+    Returns:
+        tuple[Flask, Swadantic, Counter]: The application, its extension and
+        the number of calls of each view.
+    """
+    from flask_swadantic import Swadantic
+
+    calls = Counter()
+
+    users_bp = Blueprint("users", __name__, url_prefix="/users")
+    users_schema = Schema(users_bp, tags=["Users"])
+
+    @users_bp.get("")
+    @users_schema.register_endpoint(
+        summary="List Users",
+        query=UserQuery,
+        responses=[ResponseSchema(200, list[User])],
+        parse_query=True,
+    )
+    def list_users(query: UserQuery):
+        calls["list_users"] += 1
+        return query.model_dump(mode="json")
+
+    @users_bp.get("/<int:user_id>")
+    @users_schema.register_endpoint(
+        summary="Get User",
+        responses=[ResponseSchema(200, User), ResponseSchema(404, None)],
+        serialize_response=True,
+        cache=CachePolicy(ttl=60),
+    )
+    def get_user(user_id: int):
+        calls["get_user"] += 1
+        return User(name=f"user-{user_id}", email=f"{user_id}@example.com")
+
+    @users_bp.post("")
+    @users_schema.register_endpoint(
+        summary="Create User",
+        body=User,
+        responses=[ResponseSchema(201, User)],
+        validate_body=True,
+        serialize_response=True,
+    )
+    def create_user(body: User):
+        calls["create_user"] += 1
+        return body, 201
+
+    orders_bp = Blueprint("orders", __name__, url_prefix="/orders")
+    orders_schema = Schema(orders_bp, tags=["Orders"])
+
+    @orders_bp.get("")
+    @orders_schema.register_endpoint(
+        summary="List Order Owners",
+        responses=[ResponseSchema(200, list[User])],
+    )
+    def list_order_owners():
+        calls["list_order_owners"] += 1
+        return []
+
+    app = Flask(__name__)
+    swadantic = Swadantic(InfoSchema(title="Test API", version="1.0.0"), **options)
+    swadantic.init_app(app)
+    app.register_blueprint(users_bp)
+    app.register_blueprint(orders_bp)
+    swadantic.register_schema(users_schema)
+    swadantic.register_schema(orders_schema)
+
+    return app, swadantic, calls
+
+
+@pytest.fixture(autouse=True)
+def _isolated():
+    clear_model_schema_cache()
+    yield
+    metrics.enabled = False
+    metrics.reset()
+
+
+@pytest.fixture
+def app_factory():
+    return build_app
+
+
+@pytest.fixture
+def built():
+    return build_app()
+
+
+@pytest.fixture
+def client(built):
+    return built[0].test_client()
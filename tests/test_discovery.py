@@ -0,0 +1,112 @@
+from uuid import UUID
+
+from flask import Blueprint, Flask
+from pydantic import BaseModel
+
+from flask_swadantic import InfoSchema, ResponseSchema, Schema, Swadantic
+
+
+class Note(BaseModel):
+    text: str
+
+
+def _spec(*blueprints: tuple[Blueprint, Schema]) -> dict:
+    app = Flask(__name__)
+    swadantic = Swadantic(InfoSchema(title="Notes", version="1.0.0"), app)
+    for blueprint, schema in blueprints:
+        app.register_blueprint(blueprint)
+        swadantic.register_schema(schema)
+
+    return swadantic.get_spec
+
+
+def test_every_method_and_rule_of_a_view_is_documented():
+    blueprint = Blueprint("notes", __name__, url_prefix="/notes")
+    schema = Schema(blueprint, tags=["Notes"])
+
+    @blueprint.route("", methods=["GET", "POST"])
+    @blueprint.route("/all")
+    @schema.register_endpoint(
+        summary="Notes",
+        responses=[ResponseSchema(200, list[Note])],
+    )
+    def notes():
+        return []
+
+    paths = _spec((blueprint, schema))["paths"]
+
+    assert set(paths["/notes"]) == {"get", "post"}
+    assert set(paths["/notes/all"]) == {"get"}
+
+
+def test_path_parameters_come_from_the_rule_converters():
+    blueprint = Blueprint("notes", __name__, url_prefix="/notes")
+    schema = Schema(blueprint)
+
+    @blueprint.get("/<uuid:note_id>/revisions/<int:revision>")
+    @schema.register_endpoint(summary="Get Revision")
+    def get_revision(note_id: UUID, revision: int):
+        return {}
+
+    paths = _spec((blueprint, schema))["paths"]
+    parameters = {
+        parameter["name"]: parameter["schema"]
+        for parameter in paths["/notes/{note_id}/revisions/{revision}"]["get"][
+            "parameters"
+        ]
+    }
+
+    assert parameters["note_id"] == {"type": "string", "format": "uuid"}
+    assert parameters["revision"]["type"] == "integer"
+
+
+def test_nested_blueprints_get_the_full_rule():
+    parent = Blueprint("workspaces", __name__, url_prefix="/workspaces")
+    child = Blueprint("notes", __name__, url_prefix="/notes")
+    parent_schema = Schema(parent)
+    child_schema = Schema(child)
+
+    @child.get("")
+    @child_schema.register_endpoint(summary="List Notes")
+    def list_notes():
+        return []
+
+    parent.register_blueprint(child)
+    parent_schema.register_schema(child_schema)
+
+    paths = _spec((parent, parent_schema))["paths"]
+
+    assert set(paths) == {"/workspaces/notes"}
+
+
+def test_late_blueprints_only_generate_their_schemas():
+    app = Flask(__name__)
+    swadantic = Swadantic(InfoSchema(title="Notes", version="1.0.0"), app)
+    notes = Blueprint("notes", __name__, url_prefix="/notes")
+    notes_schema = Schema(notes)
+    plugin = Blueprint("plugin", __name__, url_prefix="/plugin")
+    plugin_schema = Schema(plugin)
+
+    @notes.get("")
+    @notes_schema.register_endpoint(summary="List Notes")
+    def list_notes():
+        return []
+
+    @plugin.get("")
+    @plugin_schema.register_endpoint(summary="List Plugin Notes")
+    def list_plugin_notes():
+        return []
+
+    app.register_blueprint(notes)
+    swadantic.register_schema(notes_schema)
+    swadantic.register_schema(plugin_schema)
+    first = swadantic.get_spec
+    fragment = swadantic._spec_cache._fragments[(notes_schema,)]
+
+    app.register_blueprint(plugin)
+    spec = swadantic.get_spec
+
+    # Replayed until the blueprint is registered, then read from the url_map
+    assert set(first["paths"]) == {"/notes", "/plugin/"}
+    assert set(spec["paths"]) == {"/notes", "/plugin"}
+    assert swadantic._spec_cache._fragments[(notes_schema,)] is fragment
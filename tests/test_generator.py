@@ -0,0 +1,128 @@
+import logging
+
+import pytest
+from flask import Blueprint, Flask
+from pydantic import BaseModel
+
+from flask_swadantic import InfoSchema, ResponseSchema, Schema, Swadantic
+from flask_swadantic.openapi.generator import (
+    ComponentConflictError,
+    OpenAPIGenerator,
+    merge_fragments,
+)
+
+
+class Pet(BaseModel):
+    name: str
+
+
+class Owner(BaseModel):
+    name: str
+    pets: list[Pet]
+
+
+def _schemas() -> list[Schema]:
+    schemas = []
+    for name, body in (("pets", list[Pet]), ("owners", Owner), ("vets", Owner)):
+        blueprint = Blueprint(name, __name__, url_prefix=f"/{name}")
+        schema = Schema(blueprint, tags=[name.title()])
+
+        @blueprint.get("/<int:item_id>")
+        @schema.register_endpoint(
+            summary=f"Get {name.title()}",
+            responses=[ResponseSchema(200, body)],
+        )
+        def get_item(item_id: int):
+            return {}
+
+        schemas.append(schema)
+
+    return schemas
+
+
+def _fragment(path: str, component: dict) -> dict:
+    return {
+        "paths": {path: {"get": {"summary": path}}},
+        "components": {"schemas": {"User": component}},
+    }
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_shards_are_generated_like_a_single_generator(executor):
+    expected = OpenAPIGenerator().generate(_schemas())
+
+    generated = OpenAPIGenerator().generate(_schemas(), workers=2, executor=executor)
+
+    assert list(generated["paths"]) == [
+        "/pets/{item_id}",
+        "/owners/{item_id}",
+        "/vets/{item_id}",
+    ]
+    assert generated["paths"] == expected["paths"]
+    assert generated["components"] == expected["components"]
+
+
+def test_fragments_are_merged_in_order():
+    user = {"type": "object"}
+
+    merged = merge_fragments([_fragment("/b", user), _fragment("/a", user)])
+
+    assert list(merged["paths"]) == ["/b", "/a"]
+    assert merged["components"]["schemas"] == {"User": user}
+
+
+def test_conflicting_components_keep_the_first_one(caplog):
+    first = _fragment("/users", {"type": "object", "title": "User"})
+    second = _fragment("/admins", {"type": "string", "title": "User"})
+
+    with caplog.at_level(logging.WARNING):
+        merged = merge_fragments([first, second])
+
+    assert merged["components"]["schemas"]["User"]["type"] == "object"
+    assert "Component 'User'" in caplog.text
+    with pytest.raises(ComponentConflictError):
+        merge_fragments([first, second], strict=True)
+
+
+def test_conflicting_operations_keep_the_last_one(caplog):
+    user = {"type": "object"}
+    first = _fragment("/users", user)
+    second = {**_fragment("/users", user), "paths": {"/users": {"get": {}}}}
+
+    with caplog.at_level(logging.WARNING):
+        merged = merge_fragments([first, second])
+
+    assert merged["paths"]["/users"]["get"] == {}
+    assert "Operation 'GET /users'" in caplog.text
+    with pytest.raises(ComponentConflictError):
+        merge_fragments([first, second], strict=True)
+
+
+def test_models_sharing_a_name_are_served(caplog):
+    def model(field: str) -> type[BaseModel]:
+        return type("Item", (BaseModel,), {"__annotations__": {field: str}})
+
+    app = Flask(__name__)
+    swadantic = Swadantic(InfoSchema(title="Items", version="1.0.0"), app)
+    for name, item in (("books", model("title")), ("films", model("director"))):
+        blueprint = Blueprint(name, __name__, url_prefix=f"/{name}")
+        schema = Schema(blueprint)
+
+        @blueprint.get("")
+        @schema.register_endpoint(
+            summary=f"List {name.title()}",
+            responses=[ResponseSchema(200, item)],
+        )
+        def list_items():
+            return {}
+
+        app.register_blueprint(blueprint)
+        swadantic.register_schema(schema)
+
+    with caplog.at_level(logging.WARNING):
+        response = app.test_client().get("/apispec")
+
+    assert response.status_code == 200
+    assert set(response.get_json()["components"]["schemas"]["Item"]["properties"]) == {
+        "title"
+    }
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+from benchmarks.bench_import import MAX_RATIO, measure_ratio
+
+# Modules only the commands of the CLI use, which init_app must not import
+COMMAND_MODULES = (
+    "flask_swadantic.loadtest",
+    "flask_swadantic.openapi.artifact",
+    "multiprocessing",
+    "concurrent.futures.process",
+)
+
+
+def test_import_stays_within_its_budget():
+    own, ratio, loaded = measure_ratio(runs=3)
+
+    assert loaded == []
+    assert ratio <= MAX_RATIO, f"{own:.2f} ms, {ratio:.3f} of the dependencies"
+
+
+def test_init_app_does_not_import_the_commands():
+    statement = (
+        "import sys; from flask import Flask; "
+        "from flask_swadantic import InfoSchema, Swadantic; "
+        "Swadantic(InfoSchema(title='App', version='1.0.0'), Flask('app')); "
+        f"print(*(m for m in {COMMAND_MODULES!r} if m in sys.modules))"
+    )
+
+    loaded = subprocess.run(
+        [sys.executable, "-c", statement], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    assert loaded == []
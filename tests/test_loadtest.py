@@ -0,0 +1,48 @@
+from flask_swadantic.loadtest import PlannedRequest, plan_requests, run_loadtest
+
+
+def test_loadtest_sends_valid_requests(built):
+    app, swadantic, calls = built
+
+    planned = plan_requests(swadantic.get_spec)
+    stats = run_loadtest(app, planned, count=len(planned) * 2)
+
+    assert {stat.operation_id for stat in stats} == {
+        request.operation_id for request in planned
+    }
+    assert sum(stat.requests for stat in stats) == len(planned) * 2
+    assert all(stat.errors == stat.client_errors == 0 for stat in stats)
+    assert calls["create_user"] == 2
+
+
+def test_loadtest_counts_client_errors_apart(built):
+    app, _, _ = built
+    planned = [PlannedRequest("get-get-user", "GET", "/users/abc")]
+
+    [stat] = run_loadtest(app, planned, count=3)
+
+    assert (stat.requests, stat.errors, stat.client_errors) == (3, 0, 3)
+
+
+def test_loadtest_command_fails_on_client_errors(built, monkeypatch):
+    from flask_swadantic import loadtest
+
+    app, _, _ = built
+    monkeypatch.setattr(loadtest._AppClient, "send", lambda self, request: 404)
+
+    result = app.test_cli_runner().invoke(args=["swadantic", "loadtest", "-n", "4"])
+
+    assert result.exit_code == 1
+    assert "4 requests were answered with a 4xx status." in result.output
+
+
+def test_loadtest_falls_back_to_threads_without_fork(built, monkeypatch):
+    from flask_swadantic import loadtest
+
+    app, swadantic, _ = built
+    monkeypatch.setattr(loadtest, "get_all_start_methods", lambda: ["spawn"])
+
+    planned = plan_requests(swadantic.get_spec)
+    stats = run_loadtest(app, planned, processes=2, count=len(planned) * 2)
+
+    assert sum(stat.requests for stat in stats) == len(planned) * 2
@@ -0,0 +1,115 @@
+from flask_swadantic.openapi.dedup import deduplicate_schemas
+
+USER_LIST = {"type": "array", "items": {"$ref": "#/components/schemas/User"}}
+USER = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+
+def _generated(operations: int, schema: dict) -> dict:
+    return {
+        "paths": {
+            f"/users-{index}": {
+                "get": {
+                    "responses": {
+                        "200": {"content": {"application/json": {"schema": schema}}}
+                    }
+                }
+            }
+            for index in range(operations)
+        },
+        "components": {"schemas": {"User": USER}},
+    }
+
+
+def _response_schema(generated: dict, path: str) -> dict:
+    response = generated["paths"][path]["get"]["responses"]["200"]
+    return response["content"]["application/json"]["schema"]
+
+
+def test_repeated_array_of_models_is_hoisted():
+    generated = _generated(50, USER_LIST)
+
+    deduplicated = deduplicate_schemas(generated)
+
+    assert _response_schema(deduplicated, "/users-0") == {
+        "$ref": "#/components/schemas/UserList"
+    }
+    assert deduplicated["components"]["schemas"]["UserList"] == USER_LIST
+    assert _response_schema(generated, "/users-0") == USER_LIST
+
+
+def test_schema_is_kept_inline_when_hoisting_does_not_save_space():
+    generated = _generated(2, USER_LIST)
+
+    assert deduplicate_schemas(generated) is generated
+
+
+def test_custom_converters_are_described_by_the_converter_they_extend():
+    from flask import Blueprint, Flask
+    from werkzeug.routing import IntegerConverter
+
+    from flask_swadantic import InfoSchema, Schema, Swadantic
+
+    class EvenConverter(IntegerConverter):
+        pass
+
+    app = Flask(__name__)
+    app.url_map.converters["even"] = EvenConverter
+    blueprint = Blueprint("numbers", __name__, url_prefix="/numbers")
+    schema = Schema(blueprint)
+
+    @blueprint.get("/<even:number>")
+    @schema.register_endpoint(summary="Get Number")
+    def get_number(number):
+        return {}
+
+    swadantic = Swadantic(InfoSchema(title="Numbers", version="1.0.0"), app)
+    app.register_blueprint(blueprint)
+    swadantic.register_schema(schema)
+
+    operation = swadantic.generate_spec()["paths"]["/numbers/{number}"]["get"]
+
+    assert operation["parameters"][0]["schema"] == {"type": "integer", "minimum": 0}
+
+
+def test_stripping_keeps_the_nulls_of_schemas():
+    from flask_swadantic.openapi.encoding import strip_empty
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "nickname": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+            "deleted": {"const": None},
+            "note": {"default": None},
+            "anything": {},
+        },
+    }
+    document = {
+        "info": {"title": "Users", "description": None},
+        "paths": {
+            "/users": {
+                "get": {
+                    "tags": [],
+                    "security": [],
+                    "requestBody": None,
+                    "parameters": [
+                        {"name": "q", "in": "query", "schema": {"default": None}}
+                    ],
+                    "responses": {
+                        "200": {"content": {"application/json": {"schema": schema}}}
+                    },
+                }
+            }
+        },
+        "components": {"schemas": {"Any": {}}},
+    }
+
+    stripped = strip_empty(document)
+
+    assert stripped["info"] == {"title": "Users"}
+    operation = stripped["paths"]["/users"]["get"]
+    assert set(operation) == {"security", "parameters", "responses"}
+    assert operation["parameters"][0]["schema"] == {"default": None}
+    assert operation["responses"]["200"]["content"]["application/json"] == {
+        "schema": schema
+    }
+    assert stripped["components"] == {"schemas": {"Any": {}}}
@@ -0,0 +1,179 @@
+from http import HTTPStatus
+
+import pytest
+from flask import Flask
+from werkzeug.datastructures import MultiDict
+
+from flask_swadantic import ResponseSchema
+from flask_swadantic.runtime import (
+    QueryParser,
+    RequestValidationError,
+    ResponseSerializer,
+)
+from tests.conftest import User, UserQuery
+
+
+def test_body_is_validated_and_passed_to_the_view(client):
+    response = client.post("/users", json={"name": "Ada", "email": "ada@example.com"})
+
+    assert response.status_code == 201
+    assert response.get_json() == {"name": "Ada", "email": "ada@example.com"}
+
+
+def test_invalid_body_is_answered_with_422(built):
+    app, _, calls = built
+
+    response = app.test_client().post("/users", json={"name": "Ada"})
+
+    assert response.status_code == 422
+    assert response.mimetype == "application/json"
+    errors = response.get_json()["errors"]
+    assert [error["loc"] for error in errors] == [["email"]]
+    assert calls["create_user"] == 0
+
+
+def test_malformed_body_is_answered_with_422(client):
+    response = client.post("/users", data=b"{not json", content_type="application/json")
+
+    assert response.status_code == 422
+
+
+def test_returned_model_is_serialized_with_the_declared_body(client):
+    response = client.get("/users/7")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"name": "user-7", "email": "7@example.com"}
+
+
+@pytest.mark.parametrize(
+    ("returned", "status", "headers"),
+    [
+        ("201 CREATED", "201 CREATED", {}),
+        (HTTPStatus.CREATED, "201 CREATED", {}),
+        (201, "201 CREATED", {}),
+        ({"X-Id": "1"}, "200 OK", {"X-Id": "1"}),
+        ([("X-Id", "1")], "200 OK", {"X-Id": "1"}),
+    ],
+)
+def test_two_item_tuples_are_read_like_flask(returned, status, headers):
+    serializer = ResponseSerializer(
+        [ResponseSchema(200, User), ResponseSchema(201, User)]
+    )
+    user = User(name="Ada", email="ada@example.com")
+
+    with Flask(__name__).app_context():
+        response = serializer.serialize((user, returned))
+
+    assert response.status == status
+    assert response.get_json() == {"name": "Ada", "email": "ada@example.com"}
+    assert {key: response.headers[key] for key in headers} == headers
+
+
+def test_query_string_is_parsed_into_the_query_model(client):
+    response = client.get(
+        "/users?limit=5&tags=a&tags=b&filter[name]=Ada&filter[active]=true&other=1"
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "limit": 5,
+        "tags": ["a", "b"],
+        "filter": {"name": "Ada", "active": True},
+    }
+
+
+def test_invalid_query_is_answered_with_422(client):
+    response = client.get("/users?limit=many")
+
+    assert response.status_code == 422
+    assert response.get_json()["errors"][0]["loc"] == ["query", "limit"]
+
+
+def test_query_parser_reads_deep_objects():
+    parser = QueryParser(UserQuery)
+
+    query = parser.parse(MultiDict([("filter[active]", "false")]))
+
+    assert query.filter.active is False
+    assert query.limit == 10
+
+
+def test_query_parser_reports_nested_errors():
+    parser = QueryParser(UserQuery)
+
+    try:
+        parser.parse(MultiDict([("filter[active]", "maybe")]))
+    except RequestValidationError as e:
+        assert e.errors[0]["loc"] == ["query", "filter", "active"]
+    else:
+        raise AssertionError("The query should not be valid")
+
+
+def test_cached_response_is_served_without_calling_the_view(built):
+    app, _, calls = built
+    client = app.test_client()
+
+    first = client.get("/users/1")
+    second = client.get("/users/1")
+
+    assert calls["get_user"] == 1
+    assert second.data == first.data
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.cache_control.max_age == 60
+
+
+def test_cached_response_answers_304_to_matching_etag(built):
+    app, _, calls = built
+    client = app.test_client()
+
+    etag = client.get("/users/1").headers["ETag"]
+    response = client.get("/users/1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert calls["get_user"] == 1
+
+
+def test_cache_is_keyed_by_path_parameters(built):
+    app, _, calls = built
+    client = app.test_client()
+
+    client.get("/users/1")
+    response = client.get("/users/2")
+
+    assert response.get_json()["name"] == "user-2"
+    assert calls["get_user"] == 2
+
+
+def test_cache_is_keyed_by_credentials(built):
+    app, _, calls = built
+    client = app.test_client()
+
+    first = client.get("/users/1", headers={"Authorization": "Bearer ada"})
+    second = client.get("/users/1", headers={"Authorization": "Bearer bob"})
+    repeated = client.get("/users/1", headers={"Authorization": "Bearer ada"})
+
+    assert calls["get_user"] == 2
+    assert repeated.headers["ETag"] == first.headers["ETag"]
+    assert first.cache_control.private
+    assert {"Authorization", "Cookie"} <= set(second.vary)
+
+
+def test_shared_cache_ignores_credentials():
+    from flask import Flask
+
+    from flask_swadantic.runtime.cache import ResponseCache
+    from flask_swadantic.schema import CachePolicy
+
+    cache = ResponseCache(CachePolicy(ttl=60, shared=True))
+    app = Flask(__name__)
+    app.add_url_rule("/users", "list_users", list)
+
+    keys = set()
+    for authorization in ("Bearer ada", "Bearer bob"):
+        with app.test_request_context(
+            "/users", headers={"Authorization": authorization}
+        ):
+            keys.add(cache.key())
+
+    assert len(keys) == 1
@@ -0,0 +1,48 @@
+import pytest
+from flask import Blueprint
+
+from flask_swadantic import Schema
+
+
+def test_replaced_metadata_is_prepared_again():
+    blueprint = Blueprint("items", __name__, url_prefix="/items")
+    schema = Schema(blueprint)
+
+    @blueprint.get("")
+    @schema.register_endpoint(summary="First")
+    def list_items():
+        return []
+
+    assert [endpoint.summary for endpoint in schema.endpoints] == ["First"]
+
+    schema.register_endpoint(summary="Second")(list_items)
+
+    assert [endpoint.summary for endpoint in schema.endpoints] == ["Second"]
+
+
+def test_functions_recorded_for_the_app_are_skipped():
+    blueprint = Blueprint("items", __name__, url_prefix="/items")
+    schema = Schema(blueprint)
+
+    @blueprint.app_template_filter()
+    def shout(value):
+        return value.upper()
+
+    @blueprint.get("")
+    @schema.register_endpoint(summary="List Items")
+    def list_items():
+        return []
+
+    assert [endpoint.method for endpoint in schema.endpoints] == ["GET"]
+
+
+def test_errors_of_deferred_functions_are_raised():
+    blueprint = Blueprint("items", __name__, url_prefix="/items")
+    schema = Schema(blueprint)
+
+    @blueprint.record
+    def broken(state):
+        raise AttributeError("broken")
+
+    with pytest.raises(AttributeError, match="broken"):
+        schema._prepare_endpoints()
@@ -0,0 +1,60 @@
+from flask import Blueprint
+from pydantic import BaseModel
+
+from flask_swadantic import InfoSchema, ResponseSchema, Schema, Swadantic
+
+
+class Item(BaseModel):
+    name: str
+
+
+def _plugin(name: str) -> tuple[Blueprint, Schema]:
+    blueprint = Blueprint(name, __name__, url_prefix=f"/{name}")
+    schema = Schema(blueprint, tags=[name.title()])
+
+    @blueprint.get("/items")
+    @schema.register_endpoint(
+        summary=f"List {name.title()}",
+        responses=[ResponseSchema(200, list[Item])],
+    )
+    def list_items():
+        return []
+
+    return blueprint, schema
+
+
+def test_late_schemas_are_generated_alone():
+    swadantic = Swadantic(InfoSchema(title="Plugins", version="1.0.0"))
+    _, core = _plugin("core")
+    swadantic.register_schema(core)
+    first = swadantic.get_spec
+    fragment = swadantic._spec_cache._fragments[(core,)]
+
+    _, billing = _plugin("billing")
+    swadantic.register_schema(billing)
+    spec = swadantic.get_spec
+
+    assert set(first["paths"]) == {"/core/items"}
+    assert set(spec["paths"]) == {"/core/items", "/billing/items"}
+    assert spec["paths"]["/billing/items"]["get"]["tags"] == ["Billing"]
+    assert swadantic._spec_cache._fragments[(core,)] is fragment
+
+
+def test_changed_schemas_are_generated_again():
+    swadantic = Swadantic(InfoSchema(title="Plugins", version="1.0.0"))
+    _, core = _plugin("core")
+    blueprint, billing = _plugin("billing")
+    swadantic.register_schema(core)
+    swadantic.register_schema(billing)
+    assert set(swadantic.get_spec["paths"]) == {"/core/items", "/billing/items"}
+    fragment = swadantic._spec_cache._fragments[(core,)]
+
+    @blueprint.post("/items")
+    @billing.register_endpoint(summary="Create Invoice")
+    def create_invoice():
+        return {}
+
+    spec = swadantic.get_spec
+
+    assert set(spec["paths"]["/billing/items"]) == {"get", "post"}
+    assert swadantic._spec_cache._fragments[(core,)] is fragment
@@ -0,0 +1,333 @@
+import gzip
+import json
+import os
+import threading
+
+import pytest
+
+from flask_swadantic.openapi.encoding import yaml
+
+
+def test_spec_is_served_with_etag_and_304(client):
+    response = client.get("/apispec")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    spec = response.get_json()
+    assert set(spec["paths"]) == {"/users", "/users/{user_id}", "/orders"}
+
+    repeated = client.get(
+        "/apispec", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert repeated.status_code == 304
+
+
+def test_spec_is_served_gzipped(client):
+    identity = client.get("/apispec", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/apispec", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.data) == identity.data
+    assert compressed.headers["ETag"] != identity.headers["ETag"]
+
+
+def test_streamed_spec_matches_the_encoded_spec(app_factory):
+    encoded_app, _, _ = app_factory()
+    streamed_app, _, _ = app_factory(stream_spec=True)
+
+    expected = encoded_app.test_client().get("/apispec").get_json()
+    client = streamed_app.test_client()
+    identity = client.get("/apispec", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/apispec", headers={"Accept-Encoding": "gzip"})
+
+    assert json.loads(identity.data) == expected
+    assert json.loads(gzip.decompress(compressed.data)) == expected
+
+
+def test_spec_is_sliced_by_tag_and_blueprint(client):
+    by_tag = client.get("/apispec/tag/Orders").get_json()
+    by_blueprint = client.get("/apispec/blueprint/users").get_json()
+
+    assert set(by_tag["paths"]) == {"/orders"}
+    assert set(by_tag["components"]["schemas"]) == {"User"}
+    assert set(by_blueprint["paths"]) == {"/users", "/users/{user_id}"}
+    assert client.get("/apispec/tag/Unknown").status_code == 404
+
+
+def test_spec_index_lists_the_slices(client):
+    index = client.get("/apispec/index").get_json()
+
+    assert [url["name"] for url in index["urls"]] == [
+        "All",
+        "Tag: Users",
+        "Tag: Orders",
+        "Blueprint: users",
+        "Blueprint: orders",
+    ]
+    assert index["urls"][1]["url"] == "/apispec/tag/Users"
+
+
+def test_swagger_ui_follows_the_mount_point(client):
+    page = client.get("/swagger", base_url="http://localhost/api").get_data(
+        as_text=True
+    )
+
+    assert 'data-spec-url="/api/apispec"' in page
+    assert 'data-config-url="/api/apispec/index"' in page
+
+
+def test_minified_spec_drops_empty_fields(client):
+    full = client.get("/apispec").get_json()
+    minified = client.get("/apispec?format=min")
+
+    assert minified.mimetype == "application/json"
+    assert len(minified.data) < len(client.get("/apispec").data)
+    assert set(minified.get_json()["paths"]) == set(full["paths"])
+
+
+@pytest.mark.skipif(yaml is None, reason="PyYAML is not installed")
+def test_yaml_spec_is_negotiated_from_accept(client):
+    response = client.get("/apispec", headers={"Accept": "application/yaml"})
+
+    assert response.mimetype == "application/yaml"
+    assert "Accept" in response.vary
+    assert yaml.safe_load(response.data)["info"]["title"] == "Test API"
+
+
+def test_unknown_spec_format_is_answered_with_406(client):
+    assert client.get("/apispec?format=xml").status_code == 406
+
+
+def test_static_swagger_ui_fetches_the_spec(client):
+    response = client.get("/swagger")
+
+    assert response.status_code == 200
+    assert b"swagger-ui-bundle." in response.data
+    assert b'"openapi"' not in response.data
+
+
+@pytest.mark.parametrize("mode", ["inline", "light"])
+def test_inline_swagger_ui_embeds_the_spec(app_factory, mode):
+    app, _, _ = app_factory(swagger_ui=mode)
+    client = app.test_client()
+
+    response = client.get("/swagger", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert b'"openapi":"3.1.1"' in response.data
+    assert (b"swagger-ui-standalone-preset." in response.data) is (mode == "inline")
+    repeated = client.get(
+        "/swagger", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert repeated.status_code == 304
+
+
+def test_swagger_ui_assets_are_served_immutable(client):
+    page = client.get("/swagger").data.decode()
+    start = page.index("/swagger/static/swagger-ui-bundle.")
+    url = page[start : page.index('"', start)]
+
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.cache_control.immutable
+    response.close()
+
+
+def test_prebuilt_artifact_is_served(app_factory, tmp_path):
+    from flask_swadantic.openapi.artifact import write_artifact
+
+    _, generator, _ = app_factory()
+    path = tmp_path / "openapi.json"
+    write_artifact(generator.generate_spec(), str(path))
+
+    app, swadantic, _ = app_factory(spec_artifact=str(path))
+    client = app.test_client()
+    response = client.get("/apispec", headers={"Accept-Encoding": "gzip"})
+
+    assert swadantic.ready
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.data)) == json.loads(path.read_bytes())
+
+
+def test_deduplicated_spec_keeps_its_operations(app_factory):
+    plain, _, _ = app_factory()
+    deduplicated, _, _ = app_factory(deduplicate_schemas=True)
+
+    expected = plain.test_client().get("/apispec").get_json()
+    spec = deduplicated.test_client().get("/apispec").get_json()
+
+    assert set(spec["paths"]) == set(expected["paths"])
+    assert set(expected["components"]["schemas"]) <= set(spec["components"]["schemas"])
+
+
+def test_metrics_are_served_when_collected(app_factory):
+    app, _, _ = app_factory(collect_metrics=True)
+    client = app.test_client()
+
+    client.get("/users/1")
+    response = client.get("/apispec/metrics")
+
+    assert response.status_code == 200
+    assert b'operation_id="get-get-user"' in response.data
+
+
+def test_mismatching_responses_are_reported(app_factory):
+    mismatches = []
+    app, _, _ = app_factory(
+        response_sample_rate=1.0, on_response_mismatch=mismatches.append
+    )
+
+    app.test_client().get("/users?limit=1")
+
+    assert [mismatch.endpoint for mismatch in mismatches] == ["users.list_users"]
+
+
+def test_swagger_ui_assets_are_compressed_without_siblings(client):
+    page = client.get("/swagger").data.decode()
+    start = page.index("/swagger/static/swagger-ui.")
+    url = page[start : page.index('"', start)]
+
+    identity = client.get(url, headers={"Accept-Encoding": "identity"})
+    compressed = client.get(url, headers={"Accept-Encoding": "gzip"})
+    repeated = client.get(
+        url,
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": compressed.headers["ETag"],
+        },
+    )
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.data) == identity.get_data()
+    assert repeated.status_code == 304
+    identity.close()
+
+
+def test_swagger_ui_template_is_compiled_once(client):
+    from flask_swadantic.swagger_bp import _template
+
+    client.get("/swagger")
+    hits = _template.cache_info().hits
+    client.get("/swagger")
+
+    assert _template.cache_info().hits == hits + 1
+    assert _template.cache_info().currsize >= 1
+
+
+def test_missing_artifact_falls_back_to_generation(app_factory, tmp_path):
+    path = tmp_path / "openapi.json"
+    app, _, _ = app_factory(spec_artifact=str(path))
+
+    response = app.test_client().get("/apispec")
+
+    assert response.status_code == 200
+    assert set(response.get_json()["paths"]) == {
+        "/users",
+        "/users/{user_id}",
+        "/orders",
+    }
+
+    result = app.test_cli_runner().invoke(args=["swadantic", "build", "-o", str(path)])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(path.read_bytes()) == response.get_json()
+    assert {"openapi.json.gz", "openapi.json.meta.json"} <= {
+        file.name for file in tmp_path.iterdir()
+    }
+
+
+def test_failed_artifact_build_keeps_the_previous_artifact(
+    app_factory, tmp_path, monkeypatch
+):
+    from flask_swadantic.openapi import artifact
+
+    _, swadantic, _ = app_factory()
+    path = tmp_path / "openapi.json"
+    artifact.write_artifact(swadantic.generate_spec(), str(path))
+    previous = {file.name: file.read_bytes() for file in tmp_path.iterdir()}
+
+    def fail(source, destination):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(artifact.os, "replace", fail)
+    with pytest.raises(OSError):
+        artifact.write_artifact({**swadantic.generate_spec(), "paths": {}}, str(path))
+
+    assert {file.name: file.read_bytes() for file in tmp_path.iterdir()} == previous
+
+
+def test_background_warmup_starts_once_the_app_is_set_up(app_factory):
+    import time
+
+    app, swadantic, _ = app_factory(background_warmup=True)
+
+    assert swadantic._warmup_thread is None
+    swadantic.start_warmup()
+    deadline = time.monotonic() + 5
+    while not swadantic.ready and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert swadantic.ready
+    assert app.test_client().get("/apispec").status_code == 200
+
+
+def test_background_warmup_only_starts_explicitly(app_factory):
+    app, swadantic, _ = app_factory(background_warmup=True)
+
+    app.test_client().get("/users/1")
+
+    assert not swadantic.ready
+    assert swadantic._warmup_thread is None
+
+
+def test_built_spec_is_served_without_the_build_lock(app_factory):
+    app, swadantic, _ = app_factory()
+    client = app.test_client()
+    first = client.get("/apispec").data
+
+    # Another thread holds the lock until the request is served, or times out
+    acquired = threading.Event()
+    release = threading.Event()
+    timed_out = []
+
+    def hold_lock():
+        with swadantic._build_lock:
+            acquired.set()
+            timed_out.append(not release.wait(2))
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    acquired.wait(5)
+    try:
+        assert swadantic.ready
+        assert client.get("/apispec").data == first
+    finally:
+        release.set()
+        holder.join()
+
+    assert timed_out == [False]
+
+
+def test_unused_swagger_ui_bundles_are_served_unhashed(client):
+    from flask_swadantic.assets import UNUSED_ASSETS, get_manifest
+
+    for filename in UNUSED_ASSETS:
+        response = client.get(f"/swagger/static/{filename}")
+
+        assert get_manifest().hashed_name(filename) == filename
+        assert response.status_code == 200
+        assert not response.cache_control.immutable
+        response.close()
+
+
+def test_unused_swagger_ui_bundles_are_not_precompressed(tmp_path):
+    from flask_swadantic.assets import precompress_assets
+
+    (tmp_path / "swagger-ui.js").write_text("unused();")
+    (tmp_path / "swagger-ui-bundle.js").write_text("used();")
+
+    written = precompress_assets(str(tmp_path))
+
+    assert {os.path.basename(path) for path in written} >= {"swagger-ui-bundle.js.gz"}
+    assert not any("swagger-ui.js" in path for path in written)
@@ -0,0 +1,93 @@
+import gc
+from types import SimpleNamespace
+
+import pytest
+from flask import Blueprint, Flask
+from pydantic import BaseModel, ConfigDict
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from flask_swadantic import InfoSchema, ResponseSchema, Schema, Swadantic
+from flask_swadantic.gunicorn import on_starting
+
+
+@pytest.fixture
+def frozen(monkeypatch):
+    calls = []
+    monkeypatch.setattr(gc, "freeze", lambda: calls.append("freeze"))
+    return calls
+
+
+def _build_app() -> tuple[Flask, Swadantic, type[BaseModel]]:
+    class Report(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+
+        title: str
+
+    app = Flask(__name__)
+    swadantic = Swadantic(InfoSchema(title="Reports", version="1.0.0"))
+    swadantic.init_app(app)
+    blueprint = Blueprint("reports", __name__, url_prefix="/reports")
+    schema = Schema(blueprint, tags=["Reports"])
+
+    @blueprint.get("/latest")
+    @schema.register_endpoint(
+        summary="Latest Report",
+        responses=[ResponseSchema(200, Report)],
+    )
+    def latest_report():
+        return {"title": "latest"}
+
+    app.register_blueprint(blueprint)
+    swadantic.register_schema(schema)
+    return app, swadantic, Report
+
+
+def _server(wsgi) -> SimpleNamespace:
+    logged = []
+    log = SimpleNamespace(
+        info=lambda message: logged.append(("info", message)),
+        warning=lambda message: logged.append(("warning", message)),
+    )
+    return SimpleNamespace(
+        app=SimpleNamespace(wsgi=lambda: wsgi), log=log, logged=logged
+    )
+
+
+def test_warmup_builds_models_and_spec(frozen):
+    _, swadantic, report = _build_app()
+    assert not report.__pydantic_complete__
+
+    swadantic.warmup()
+
+    assert report.__pydantic_complete__
+    assert swadantic._encoded_spec is not None
+    assert frozen == ["freeze"]
+
+
+def test_warmup_without_freeze(frozen):
+    _, swadantic, _ = _build_app()
+
+    swadantic.warmup(freeze=False)
+
+    assert swadantic._encoded_spec is not None
+    assert frozen == []
+
+
+def test_gunicorn_hook_warms_up_behind_middlewares(frozen):
+    app, swadantic, _ = _build_app()
+    server = _server(ProxyFix(app))
+
+    on_starting(server)
+
+    assert swadantic._encoded_spec is not None
+    assert frozen == ["freeze"]
+    assert [level for level, _ in server.logged] == ["info"]
+
+
+def test_gunicorn_hook_without_extension(frozen):
+    server = _server(Flask(__name__))
+
+    on_starting(server)
+
+    assert frozen == []
+    assert [level for level, _ in server.logged] == ["warning"]